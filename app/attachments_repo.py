@@ -0,0 +1,185 @@
+'''
+attachments 레포지토리 계층은 DB만 다룹니다.
+HTTP를 모르며, 비즈니스 규칙(하루 장수 제한 등)도 모릅니다.
+'''
+
+from datetime import date
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import Attachment, AttachmentThumbnail, WorkLog
+
+
+async def count_attachments(session: AsyncSession, work_log_id: int) -> int:
+    statement = select(func.count()).select_from(Attachment).where(
+        Attachment.work_log_id == work_log_id
+    )
+    return int((await session.exec(statement)).one())
+
+
+# *_statement: 실행하는 함수와 app.query_plans(EXPLAIN 점검)가 같은 문장을 쓰도록 분리
+
+def lock_work_log_statement(work_log_id: int):
+    # work_log 행 FOR UPDATE (같은 work_log에 대한 동시 confirm은 여기서 줄을 섬)
+    return select(WorkLog).where(WorkLog.id == work_log_id).with_for_update()
+
+
+def work_log_attachments_statement(work_log_id: int):
+    return (
+        select(Attachment)
+        .where(Attachment.work_log_id == work_log_id)
+        .order_by(Attachment.created_at, Attachment.id)
+    )
+
+
+async def lock_work_log_with_attachments(
+    session: AsyncSession, work_log_id: int
+) -> tuple[WorkLog | None, list[Attachment]]:
+    # 잠금과 첨부 조회는 꼭 별도 문장으로: READ COMMITTED에서 한 문장에 JOIN하면
+    # 잠금을 기다린 뒤 work_log 행만 다시 읽고 첨부는 문장 시작 때 스냅샷이라
+    # 앞 요청이 커밋한 첨부를 못 보고 장수 제한을 넘김
+    work_log = (await session.exec(lock_work_log_statement(work_log_id))).first()
+    if work_log is None:
+        return None, []
+    return work_log, list((await session.exec(work_log_attachments_statement(work_log_id))).all())
+
+
+async def insert_attachments(session: AsyncSession, rows: list[dict]) -> list[Attachment]:
+    # multi-row INSERT ... ON CONFLICT (work_log_id, file_key) DO NOTHING RETURNING
+    # 커밋은 호출 측 트랜잭션에서
+    if not rows:
+        return []
+    statement = (
+        pg_insert(Attachment)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["work_log_id", "file_key"])
+        .returning(Attachment)
+    )
+    return list((await session.scalars(statement)).all())
+
+
+async def insert_thumbnails(session: AsyncSession, rows: list[dict]) -> int:
+    # 같은 (attachment_id, size)가 이미 있으면 건너뜀 (재처리/백필 멱등)
+    if not rows:
+        return 0
+    statement = (
+        pg_insert(AttachmentThumbnail)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["attachment_id", "size"])
+        .returning(AttachmentThumbnail.id)
+    )
+    return len((await session.scalars(statement)).all())
+
+
+def thumbnail_keys_statement(attachment_ids: list[int]):
+    return select(
+        AttachmentThumbnail.attachment_id, AttachmentThumbnail.size, AttachmentThumbnail.file_key
+    ).where(AttachmentThumbnail.attachment_id.in_(attachment_ids))
+
+
+async def list_thumbnail_keys(
+    session: AsyncSession, attachment_ids: list[int]
+) -> dict[int, dict[int, str]]:
+    # attachment_id -> {size: file_key}
+    if not attachment_ids:
+        return {}
+    keys: dict[int, dict[int, str]] = {}
+    for attachment_id, size, file_key in (await session.exec(thumbnail_keys_statement(attachment_ids))).all():
+        keys.setdefault(attachment_id, {})[size] = file_key
+    return keys
+
+
+async def list_attachments_missing_thumbnails(
+    session: AsyncSession, size_count: int, after_id: int = 0, limit: int = 100
+) -> list[tuple[Attachment, WorkLog]]:
+    # 썸네일이 size_count개 미만인 첨부 (id 순 keyset)
+    thumbnails = (
+        select(func.count())
+        .select_from(AttachmentThumbnail)
+        .where(AttachmentThumbnail.attachment_id == Attachment.id)
+        .scalar_subquery()
+    )
+    statement = (
+        select(Attachment, WorkLog)
+        .join(WorkLog, WorkLog.id == Attachment.work_log_id)
+        .where(Attachment.id > after_id, thumbnails < size_count)
+        .order_by(Attachment.id)
+        .limit(limit)
+    )
+    return [tuple(row) for row in (await session.exec(statement)).all()]
+
+
+async def list_known_file_keys(
+    session: AsyncSession, work_date: date
+) -> tuple[dict[str, int], set[str]]:
+    # 그 날짜의 첨부 file_key -> id, 썸네일 file_key 집합 (LEFT JOIN 한 번)
+    statement = (
+        select(Attachment.id, Attachment.file_key, AttachmentThumbnail.file_key)
+        .join(WorkLog, WorkLog.id == Attachment.work_log_id)
+        .outerjoin(AttachmentThumbnail, AttachmentThumbnail.attachment_id == Attachment.id)
+        .where(WorkLog.work_date == work_date)
+    )
+    attachments: dict[str, int] = {}
+    thumbnails: set[str] = set()
+    for attachment_id, file_key, thumbnail_key in (await session.exec(statement)).all():
+        attachments[file_key] = attachment_id
+        if thumbnail_key is not None:
+            thumbnails.add(thumbnail_key)
+    return attachments, thumbnails
+
+
+def attachment_files_statement(date_from: date, date_to: date):
+    # 기간 내 첨부 (work_date, file_key, original_filename) 한 번에. reconcile에서 없다고 확인된 건 제외
+    return (
+        select(WorkLog.work_date, Attachment.file_key, Attachment.original_filename)
+        .join(WorkLog, WorkLog.id == Attachment.work_log_id)
+        .where(
+            WorkLog.work_date >= date_from,
+            WorkLog.work_date <= date_to,
+            Attachment.missing_at.is_(None),
+        )
+        .order_by(WorkLog.work_date, Attachment.created_at, Attachment.id)
+    )
+
+
+async def list_attachment_files(
+    session: AsyncSession, date_from: date, date_to: date
+) -> list[tuple[date, str, str]]:
+    return [tuple(row) for row in (await session.exec(attachment_files_statement(date_from, date_to))).all()]
+
+
+async def list_attachment_dates(session: AsyncSession) -> list[date]:
+    statement = (
+        select(WorkLog.work_date)
+        .where(select(Attachment.id).where(Attachment.work_log_id == WorkLog.id).exists())
+        .order_by(WorkLog.work_date)
+    )
+    return list((await session.exec(statement)).all())
+
+
+async def set_attachments_missing(
+    session: AsyncSession, missing_ids: list[int], present_ids: list[int]
+) -> list[int]:
+    # 없어진 첨부는 missing_at 기록, 다시 확인된 첨부는 해제 (각각 UPDATE 한 번, 커밋은 호출 측)
+    # 반환: 첨부 상태가 바뀐 work_log id (캐시 무효화/알림용)
+    changed: set[int] = set()
+    if missing_ids:
+        result = await session.execute(
+            update(Attachment)
+            .where(Attachment.id.in_(missing_ids), Attachment.missing_at.is_(None))
+            .values(missing_at=func.now())
+            .returning(Attachment.work_log_id)
+        )
+        changed.update(result.scalars())
+    if present_ids:
+        result = await session.execute(
+            update(Attachment)
+            .where(Attachment.id.in_(present_ids), Attachment.missing_at.is_not(None))
+            .values(missing_at=None)
+            .returning(Attachment.work_log_id)
+        )
+        changed.update(result.scalars())
+    return sorted(changed)
@@ -1,12 +1,18 @@
 # app/attachments_router.py
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from sqlmodel import Session, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.attachments_repo import count_attachments, list_attachment_files
+from app.attachments_service import MAX_PHOTOS_MESSAGE, MAX_PHOTOS_PER_DAY, confirm_attachments
 from app.db import get_session
+from app.export_service import stream_photos_zip, validate_export_range
 from app.models import Attachment
+from app.reconcile_service import reopen_reconciled_date
 from app.s3 import build_file_key, create_presigned_get_url, create_presigned_put_url
+from app.settings import get_settings
 from app.works_repo import get_work_log_by_id
 from app.works_service import ensure_today_work_log  # 네 repo 함수명에 맞게 바꿔도 됨
 
@@ -28,10 +34,14 @@ class PresignGetRequest(BaseModel):
     as_attachment: bool = False
     download_filename: str | None = None
 
+class PresignGetResponse(BaseModel):
+    download_url: str
+    file_key: str
+
 @router.post("/presign", response_model=PresignResponse)
-def presign_upload(req: PresignRequest, session: Session = Depends(get_session)):
+async def presign_upload(req: PresignRequest, session: AsyncSession = Depends(get_session)):
     # 1) work_log 존재 확인
-    work_log = get_work_log_by_id(session, req.work_log_id)
+    work_log = await get_work_log_by_id(session, req.work_log_id)
     if not work_log:
         raise HTTPException(status_code=404, detail="work_log not found")
 
@@ -40,8 +50,9 @@ def presign_upload(req: PresignRequest, session: Session = Depends(get_session))
     # if work_log.status == WorkStatus.OFF:
     #     raise HTTPException(status_code=400, detail="off day cannot upload")
 
-    # 3) file_key 생성
+    # 3) file_key 생성 (지난 날짜면 S3 대조가 그 prefix를 다시 보도록)
     file_key = build_file_key(work_log.work_date, req.filename)
+    await reopen_reconciled_date(session, work_log.work_date)
 
     # 4) presigned url 생성
     upload_url = create_presigned_put_url(
@@ -52,8 +63,8 @@ def presign_upload(req: PresignRequest, session: Session = Depends(get_session))
 
     return PresignResponse(upload_url=upload_url, file_key=file_key)
 
-@router.post("/presign-get")
-def presign_get(payload: PresignGetRequest):
+@router.post("/presign-get", response_model=PresignGetResponse)
+async def presign_get(payload: PresignGetRequest):
     if not payload.file_key:
         raise HTTPException(status_code=400, detail="file_key is required")
 
@@ -64,7 +75,7 @@ def presign_get(payload: PresignGetRequest):
         as_attachment=payload.as_attachment,
         download_filename=payload.download_filename,
     )
-    return {"download_url": url, "file_key": payload.file_key}
+    return PresignGetResponse(download_url=url, file_key=payload.file_key)
 
 class ConfirmRequest(BaseModel):
     work_log_id: int
@@ -90,60 +101,44 @@ def _is_off_day(work_log) -> bool:
     value = getattr(status, "value", status)
     return value == "휴무"
 
-@router.post("/confirm", response_model=ConfirmResponse)
-def confirm_attachment(req: ConfirmRequest, session: Session = Depends(get_session)):
-    # 1) work_log 존재 확인
-    work_log = get_work_log_by_id(session, req.work_log_id)
-    if not work_log:
-        raise HTTPException(status_code=404, detail="work_log not found")
+def _confirm_response(attachment: Attachment) -> ConfirmResponse:
+    return ConfirmResponse(
+        id=attachment.id,
+        work_log_id=attachment.work_log_id,
+        file_key=attachment.file_key,
+        original_filename=attachment.original_filename,
+        created_at=attachment.created_at.isoformat() if attachment.created_at else "",
+    )
 
-    # 2) 휴무일이면 불가
-    # status_value = getattr(getattr(work_log.status, "value", work_log.status), "strip", lambda: work_log.status)()
-    # if status_value == "휴무":
+@router.post("/confirm", response_model=ConfirmResponse)
+async def confirm_attachment(req: ConfirmRequest, session: AsyncSession = Depends(get_session)):
+    # 휴무일 제한은 아직 안 함
+    # if _is_off_day(work_log):
     #     raise HTTPException(status_code=400, detail="off day cannot attach files")
 
-    # 3) 멱등성: 이미 있으면 그대로 반환
-    stmt = select(Attachment).where(
-        Attachment.work_log_id == req.work_log_id,
-        Attachment.file_key == req.file_key,
-    )
-    existing = session.exec(stmt).first()
-    if existing:
-        return ConfirmResponse(
-            id=existing.id,
-            work_log_id=existing.work_log_id,
-            file_key=existing.file_key,
-            original_filename=existing.original_filename,
-            created_at=existing.created_at.isoformat() if existing.created_at else "",
-        )
-
-    # 3.5) 하루 최대 3장 제한
-    count_stmt = select(func.count()).select_from(Attachment).where(
-        Attachment.work_log_id == req.work_log_id
+    # 존재 확인/멱등성/하루 최대 장수 제한은 서비스에서 한 트랜잭션으로
+    attachments = await confirm_attachments(
+        session, req.work_log_id, [(req.file_key, req.original_filename)]
     )
-    current_count = session.exec(count_stmt).one()
+    return _confirm_response(attachments[0])
 
-    if int(current_count) >= 3:
-        raise HTTPException(status_code=400, detail="오늘은 사진을 최대 3장까지 올릴 수 있어요.")
+class ConfirmBatchItem(BaseModel):
+    file_key: str
+    original_filename: str
 
-    # 4) 없으면 생성
-    attachment = Attachment(
-        work_log_id=req.work_log_id,
-        file_key=req.file_key,
-        original_filename=req.original_filename,
-    )
+class ConfirmBatchRequest(BaseModel):
+    work_log_id: int
+    files: list[ConfirmBatchItem]
 
-    session.add(attachment)
-    session.commit()
-    session.refresh(attachment)
+@router.post("/confirm/batch", response_model=list[ConfirmResponse])
+async def confirm_attachment_batch(req: ConfirmBatchRequest, session: AsyncSession = Depends(get_session)):
+    if not req.files:
+        raise HTTPException(status_code=400, detail="files가 비어 있습니다.")
 
-    return ConfirmResponse(
-        id=attachment.id,
-        work_log_id=attachment.work_log_id,
-        file_key=attachment.file_key,
-        original_filename=attachment.original_filename,
-        created_at=attachment.created_at.isoformat() if attachment.created_at else "",
+    attachments = await confirm_attachments(
+        session, req.work_log_id, [(f.file_key, f.original_filename) for f in req.files]
     )
+    return [_confirm_response(a) for a in attachments]
 
 class PresignTodayRequest(BaseModel):
     filename: str
@@ -155,8 +150,8 @@ class PresignTodayResponse(BaseModel):
     work_log_id: int
 
 @router.post("/presign/today", response_model=PresignTodayResponse)
-def presign_today(req: PresignTodayRequest, session: Session = Depends(get_session)):
-    wl = ensure_today_work_log(session)
+async def presign_today(req: PresignTodayRequest, session: AsyncSession = Depends(get_session)):
+    wl = await ensure_today_work_log(session)
 
     status_value = getattr(wl.status, "value", wl.status)
     if status_value == "휴무":
@@ -170,4 +165,78 @@ def presign_today(req: PresignTodayRequest, session: Session = Depends(get_sessi
         expires_in=600,  # 너가 10분으로 늘린 흐름과 통일
     )
 
-    return PresignTodayResponse(upload_url=upload_url, file_key=file_key, work_log_id=wl.id)
\ No newline at end of file
+    return PresignTodayResponse(upload_url=upload_url, file_key=file_key, work_log_id=wl.id)
+
+class PresignBatchItem(BaseModel):
+    filename: str
+    content_type: str
+
+class PresignTodayBatchRequest(BaseModel):
+    files: list[PresignBatchItem]
+
+class PresignBatchResult(BaseModel):
+    filename: str
+    upload_url: str
+    file_key: str
+
+class PresignTodayBatchResponse(BaseModel):
+    work_log_id: int
+    items: list[PresignBatchResult]
+
+@router.post("/presign/today/batch", response_model=PresignTodayBatchResponse)
+async def presign_today_batch(req: PresignTodayBatchRequest, session: AsyncSession = Depends(get_session)):
+    # 여러 장을 한 번에: work_log 조회/생성과 장수 확인을 한 번만
+    if not req.files:
+        raise HTTPException(status_code=400, detail="files가 비어 있습니다.")
+
+    wl = await ensure_today_work_log(session)
+
+    status_value = getattr(wl.status, "value", wl.status)
+    if status_value == "휴무":
+        raise HTTPException(status_code=400, detail="휴무 상태에서는 사진 업로드가 불가합니다. 출근으로 변경 후 업로드하세요.")
+
+    # confirm 단계의 하루 장수 제한을 미리 확인 (최종 판정은 confirm에서)
+    remaining = MAX_PHOTOS_PER_DAY - await count_attachments(session, wl.id)
+    if len(req.files) > remaining:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{MAX_PHOTOS_MESSAGE} (남은 장수: {max(remaining, 0)})",
+        )
+
+    items: list[PresignBatchResult] = []
+    for f in req.files:
+        file_key = build_file_key(wl.work_date, f.filename)
+        upload_url = create_presigned_put_url(
+            file_key=file_key,
+            content_type=f.content_type,
+            expires_in=600,
+        )
+        items.append(PresignBatchResult(filename=f.filename, upload_url=upload_url, file_key=file_key))
+
+    return PresignTodayBatchResponse(work_log_id=wl.id, items=items)
+
+@router.get("/archive")
+async def download_photos_archive(
+    date_from: date = Query(alias="from"),
+    date_to: date = Query(alias="to"),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    기간 내 사진 원본을 ZIP 하나로 (YYYY-MM-DD/원본파일명).
+    S3에서 받는 대로 흘려보내므로 첫 바이트가 바로 나감. 못 받은 파일은 MISSING.txt에 목록으로.
+    """
+    try:
+        validate_export_range(date_from, date_to)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # key 목록은 쿼리 한 번으로 먼저 (스트리밍 중에는 DB를 안 씀)
+    files = await list_attachment_files(session, date_from, date_to)
+    if not files:
+        raise HTTPException(status_code=404, detail="해당 기간에 사진이 없습니다.")
+
+    return StreamingResponse(
+        stream_photos_zip(files, get_settings().s3_fetch_concurrency),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="photos_{date_from}_{date_to}.zip"'},
+    )
@@ -0,0 +1,65 @@
+'''
+attachments에서 어떻게 처리할지 결정합니다 (비즈니스 로직).
+예: 하루 최대 장수 제한, confirm 멱등성
+'''
+
+from fastapi import HTTPException
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.attachments_repo import insert_attachments, lock_work_log_with_attachments
+from app.events import notify_change
+from app.models import Attachment
+from app.rollups_repo import refresh_rollups
+from app.thumbnails_service import ThumbnailJob, thumbnail_worker
+from app.works_service import invalidate_work_log_caches
+
+MAX_PHOTOS_PER_DAY = 3
+MAX_PHOTOS_MESSAGE = f"오늘은 사진을 최대 {MAX_PHOTOS_PER_DAY}장까지 올릴 수 있어요."
+
+
+async def confirm_attachments(
+    session: AsyncSession,
+    work_log_id: int,
+    files: list[tuple[str, str]],
+) -> list[Attachment]:
+    """
+    (file_key, original_filename) 목록을 한 트랜잭션에서 확정.
+    이미 확정된 file_key는 그대로 반환(멱등), 새 것만 장수 제한을 적용해 INSERT.
+    반환 순서는 요청 순서 (중복 file_key는 한 번만).
+    """
+    # 1) work_log 잠금 + 기존 첨부 조회 (쿼리 1번)
+    work_log, existing = await lock_work_log_with_attachments(session, work_log_id)
+    if not work_log:
+        raise HTTPException(status_code=404, detail="work_log not found")
+
+    by_key = {a.file_key: a for a in existing}
+    new_files: dict[str, str] = {}
+    for file_key, original_filename in files:
+        if file_key not in by_key:
+            new_files.setdefault(file_key, original_filename)
+
+    # 2) 하루 최대 장수 제한 (잠금 안에서 판단하므로 동시 요청이 넘어갈 수 없음)
+    if len(existing) + len(new_files) > MAX_PHOTOS_PER_DAY:
+        await session.rollback()
+        raise HTTPException(status_code=400, detail=MAX_PHOTOS_MESSAGE)
+
+    # 3) 새 것만 한 번에 INSERT (쿼리 1번)
+    inserted = await insert_attachments(
+        session,
+        [
+            {"work_log_id": work_log_id, "file_key": key, "original_filename": name}
+            for key, name in new_files.items()
+        ],
+    )
+    if inserted:
+        await refresh_rollups(session, [work_log.work_date])
+        await notify_change(session, "attachment", [work_log.work_date], [work_log_id])
+    await session.commit()
+    if inserted:
+        await invalidate_work_log_caches([work_log.work_date], [work_log_id])
+        # 썸네일은 응답을 기다리게 하지 않고 백그라운드에서
+        for a in inserted:
+            thumbnail_worker.enqueue(ThumbnailJob(a.id, work_log_id, work_log.work_date, a.file_key))
+
+    by_key.update({a.file_key: a for a in inserted})
+    return [by_key[key] for key in dict.fromkeys(key for key, _ in files)]
@@ -0,0 +1,255 @@
+'''
+서비스 계층용 캐시 백엔드
+- LocalCache: 프로세스 로컬 LRU (테스트/단일 노드)
+- RedisCache: 여러 uvicorn 워커/레플리카가 공유 (CACHE_URL=redis://...)
+값은 JSON으로 표현 가능한 것만 넣습니다 (Redis와 동작을 맞추기 위해).
+'''
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.settings import get_settings
+
+
+class CacheBackend(ABC):
+    """
+    get/set/delete + _version/_set_if_version을 구현하면 get_or_load(single-flight 포함)를 쓸 수 있음.
+    같은 키의 동시 miss는 프로세스 안에서 로더 한 번으로 합쳐짐.
+    delete는 키의 버전을 올림 -> 무효화 전에 시작한 로딩 결과는 캐시에 쓰지 않음
+    (쓰기 직전에 읽은 옛 값이 무효화 뒤에 다시 들어가 TTL 동안 남는 것 방지).
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        ...
+
+    @abstractmethod
+    async def _version(self, key: str) -> Any:
+        ...
+
+    @abstractmethod
+    async def _set_if_version(self, key: str, value: Any, ttl: float, version: Any) -> None:
+        ...
+
+    def _forget_inflight(self, keys: tuple[str, ...]) -> None:
+        # 무효화 뒤의 요청이 무효화 전에 시작한 로딩에 합류하지 않도록
+        for key in keys:
+            self._inflight.pop(key, None)
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float
+    ) -> Any:
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # 이미 누가 로딩 중이면 그 결과를 같이 씀
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        # 기다리는 쪽이 없을 때 "exception was never retrieved" 경고 방지
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            value = await self._load_and_set(key, loader, ttl)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _load_and_set(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float
+    ) -> Any:
+        version = await self._version(key)
+        value = await loader()
+        if value is not None:
+            await self._set_if_version(key, value, ttl, version)
+        return value
+
+
+class LocalCache(CacheBackend):
+    def __init__(self, maxsize: int | None = None) -> None:
+        super().__init__()
+        self.maxsize = maxsize if maxsize is not None else get_settings().local_cache_size
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        # delete마다 증가 (키별로 두지 않음: 무효화는 드물고, 가끔 한 번 더 로딩하는 정도)
+        self.generation = 0
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        self.generation += 1
+        self._forget_inflight(keys)
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def _version(self, key: str) -> int:
+        return self.generation
+
+    async def _set_if_version(self, key: str, value: Any, ttl: float, version: int) -> None:
+        if version == self.generation:
+            await self.set(key, value, ttl)
+
+
+class RedisCache(CacheBackend):
+    """
+    Redis 프로토콜 백엔드. client를 직접 넘기면 fakeredis 같은 대체 구현도 사용 가능.
+    프로세스 간 stampede는 lock 키(SET NX PX)로 한 프로세스만 로딩하게 막음.
+    키 버전은 ver:{key}에 두고, 버전 비교+SET과 lock 해제(토큰 비교+DEL)는 Lua로 원자적으로.
+    """
+
+    LOCK_TTL_MS = 3000
+    LOCK_POLL_INTERVAL = 0.05
+    # 로딩 시간보다 충분히 길면 됨 (만료돼도 "0"으로 읽힐 뿐)
+    VERSION_TTL_MS = 24 * 3600 * 1000
+
+    # KEYS[1]=값 키, KEYS[2]=버전 키, ARGV = 기대 버전, 값, PX
+    _SET_IF_VERSION = """
+        if (redis.call('GET', KEYS[2]) or '0') == ARGV[1] then
+            redis.call('SET', KEYS[1], ARGV[2], 'PX', ARGV[3])
+            return 1
+        end
+        return 0
+    """
+    # KEYS = 값 키들 다음에 버전 키들 (같은 순서), ARGV[1] = 버전 키 PX
+    _DELETE_AND_BUMP = """
+        local n = #KEYS / 2
+        for i = 1, n do
+            redis.call('DEL', KEYS[i])
+            redis.call('INCR', KEYS[n + i])
+            redis.call('PEXPIRE', KEYS[n + i], ARGV[1])
+        end
+        return n
+    """
+    # 자기 토큰일 때만 lock 해제 (PX가 지나 다른 프로세스가 잡은 lock은 건드리지 않음)
+    _RELEASE_LOCK = """
+        if redis.call('GET', KEYS[1]) == ARGV[1] then
+            return redis.call('DEL', KEYS[1])
+        end
+        return 0
+    """
+
+    def __init__(self, url: str | None = None, client: Any = None, prefix: str = "wrt:") -> None:
+        super().__init__()
+        if client is None:
+            try:
+                from redis import asyncio as redis_asyncio
+            except ImportError as e:
+                raise RuntimeError("CACHE_URL로 redis를 쓰려면 redis 패키지가 필요합니다.") from e
+            client = redis_asyncio.from_url(url)
+        self._redis = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self._redis.get(self.prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self._redis.set(
+            self.prefix + key,
+            json.dumps(value, ensure_ascii=False),
+            px=max(int(ttl * 1000), 1),
+        )
+
+    def _version_key(self, key: str) -> str:
+        return f"{self.prefix}ver:{key}"
+
+    async def delete(self, *keys: str) -> None:
+        self._forget_inflight(keys)
+        if keys:
+            await self._redis.eval(
+                self._DELETE_AND_BUMP,
+                len(keys) * 2,
+                *(self.prefix + key for key in keys),
+                *(self._version_key(key) for key in keys),
+                self.VERSION_TTL_MS,
+            )
+
+    async def _version(self, key: str) -> str:
+        raw = await self._redis.get(self._version_key(key))
+        if raw is None:
+            return "0"
+        return raw.decode() if isinstance(raw, bytes) else str(raw)
+
+    async def _set_if_version(self, key: str, value: Any, ttl: float, version: str) -> None:
+        await self._redis.eval(
+            self._SET_IF_VERSION,
+            2,
+            self.prefix + key,
+            self._version_key(key),
+            version,
+            json.dumps(value, ensure_ascii=False),
+            max(int(ttl * 1000), 1),
+        )
+
+    async def _load_and_set(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float
+    ) -> Any:
+        lock_key = f"{self.prefix}lock:{key}"
+        token = uuid.uuid4().hex
+        if await self._redis.set(lock_key, token, nx=True, px=self.LOCK_TTL_MS):
+            try:
+                return await super()._load_and_set(key, loader, ttl)
+            finally:
+                await self._redis.eval(self._RELEASE_LOCK, 1, lock_key, token)
+
+        # 다른 프로세스가 로딩 중: lock TTL 동안 캐시가 채워지길 기다렸다가, 안 되면 직접 로딩
+        deadline = time.monotonic() + self.LOCK_TTL_MS / 1000
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.LOCK_POLL_INTERVAL)
+            value = await self.get(key)
+            if value is not None:
+                return value
+        return await super()._load_and_set(key, loader, ttl)
+
+
+_cache: CacheBackend | None = None
+
+
+def get_cache() -> CacheBackend:
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        if settings.cache_url.startswith(("redis://", "rediss://")):
+            _cache = RedisCache(settings.cache_url)
+        else:
+            _cache = LocalCache()
+    return _cache
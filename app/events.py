@@ -0,0 +1,131 @@
+'''
+work_log 변경 알림 (Postgres LISTEN/NOTIFY -> SSE)
+- 쓰기 경로: 커밋 전에 notify_change()로 pg_notify (커밋될 때만 전달됨)
+- 프로세스마다 LISTEN 커넥션 하나(ChangeListener)가 받아서 구독자 큐로 fan-out
+- 다른 프로세스의 쓰기도 여기로 들어오므로 로컬 캐시 무효화에도 사용
+'''
+
+import asyncio
+import json
+import logging
+from collections.abc import Iterable
+from contextlib import contextmanager
+from datetime import date
+
+import asyncpg
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db import listen_dsn
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "work_log_changes"
+MAX_NOTIFY_IDS = 100  # NOTIFY payload는 8000바이트 제한
+SUBSCRIBER_QUEUE_SIZE = 100
+RECONNECT_DELAY = 3.0
+
+
+async def notify_change(
+    session: AsyncSession,
+    kind: str,
+    work_dates: Iterable[date],
+    work_log_ids: Iterable[int] = (),
+) -> None:
+    dates = sorted(set(work_dates))
+    if not dates:
+        return
+    ids = sorted(set(work_log_ids))
+    payload = {
+        "kind": kind,
+        "from": dates[0].isoformat(),
+        "to": dates[-1].isoformat(),
+        "work_log_ids": ids if len(ids) <= MAX_NOTIFY_IDS else [],
+    }
+    await session.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": CHANNEL, "payload": json.dumps(payload)},
+    )
+
+
+class ChangeListener:
+    def __init__(self, dsn: str | None = None) -> None:
+        # None이면 start 시점에 앱 DB 설정에서 만듦 (import 시 엔진 생성 방지)
+        self.dsn = dsn
+        self._subscribers: set[asyncio.Queue] = set()
+        self._handlers: list = []
+        self._task: asyncio.Task | None = None
+
+    def add_handler(self, handler) -> None:
+        # handler(payload: dict) -> awaitable, 이벤트마다 호출 (캐시 무효화 등)
+        self._handlers.append(handler)
+
+    @contextmanager
+    def subscribe(self):
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def _dispatch(self, connection, pid, channel, raw: str) -> None:
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning("invalid %s payload: %r", CHANNEL, raw)
+            return
+
+        for handler in self._handlers:
+            asyncio.ensure_future(self._call_handler(handler, payload))
+
+        for queue in self._subscribers:
+            if queue.full():
+                # 느린 클라이언트는 가장 오래된 이벤트를 버림 (최신 상태만 중요)
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+    @staticmethod
+    async def _call_handler(handler, payload: dict) -> None:
+        try:
+            await handler(payload)
+        except Exception:
+            logger.exception("%s handler failed", CHANNEL)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn or listen_dsn())
+            except Exception:
+                logger.exception("LISTEN connection failed, retrying")
+                await asyncio.sleep(RECONNECT_DELAY)
+                continue
+
+            closed = asyncio.get_running_loop().create_future()
+            connection.add_termination_listener(
+                lambda _: closed.done() or closed.set_result(None)
+            )
+            try:
+                await connection.add_listener(CHANNEL, self._dispatch)
+                await closed
+                logger.warning("LISTEN connection closed, reconnecting")
+            finally:
+                if not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+change_listener = ChangeListener()
@@ -0,0 +1,265 @@
+'''
+기간별 내보내기
+- GET /work-logs/export: work_log(+첨부)를 서버사이드 커서에서 배치 단위로 읽어 바로 CSV/Parquet bytes로
+  행 단위는 work_log LEFT JOIN attachment: 첨부가 여러 장인 날은 work_log 값이 첨부 수만큼 반복됨.
+  pyarrow는 선택 의존성 (없으면 parquet만 불가).
+- GET /attachments/archive: 사진 원본을 S3에서 동시에 몇 개씩 받아 ZIP으로 바로 흘려보냄
+둘 다 기간이 길어도 API 프로세스 메모리는 일정.
+'''
+
+import asyncio
+import csv
+import importlib.util
+import io
+import logging
+import zipfile
+import zlib
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from enum import Enum
+
+from sqlalchemy import Row
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.s3 import open_object
+from app.works_repo import iter_export_partitions
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FIELDS = (
+    "work_date",
+    "work_log_id",
+    "status",
+    "sales_count",
+    "sales_amount",
+    "note",
+    "created_at",
+    "updated_at",
+    "attachment_id",
+    "file_key",
+    "original_filename",
+    "attachment_created_at",
+)
+# 5년치(첨부 포함 수천~수만 행)면 row group 몇 개. 한 그룹만 메모리에 올라감
+PARQUET_ROW_GROUP_SIZE = 10_000
+
+# 사진 ZIP: 객체당 미리 받아 둘 청크 수 -> 메모리 상한은 동시 개수 x ZIP_QUEUE_CHUNKS x ZIP_CHUNK_SIZE
+ZIP_CHUNK_SIZE = 256 * 1024
+ZIP_QUEUE_CHUNKS = 4
+# 받지 못한 객체(S3에 없음 등)는 건너뛰고 마지막에 이 파일로 목록을 남김
+ZIP_MISSING_ENTRY = "MISSING.txt"
+
+
+def pyarrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def validate_export_range(date_from: date, date_to: date) -> None:
+    if date_from > date_to:
+        raise ValueError("from은 to보다 이후일 수 없습니다.")
+
+
+class _ChunkSink(io.RawIOBase):
+    """되감기 없는 쓰기 전용 버퍼: 쓴 만큼 drain()으로 꺼내 보냄 (tell은 누적 위치)"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+async def export_csv(session: AsyncSession, date_from: date, date_to: date) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    # 헤더는 쿼리 전에 바로 보냄
+    writer.writerow(EXPORT_FIELDS)
+    yield buffer.getvalue().encode()
+
+    async for rows in iter_export_partitions(session, date_from, date_to):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(v) for v in row] for row in rows)
+        yield buffer.getvalue().encode()
+
+
+def _parquet_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("work_date", pa.date32()),
+        ("work_log_id", pa.int64()),
+        ("status", pa.string()),
+        ("sales_count", pa.int64()),
+        ("sales_amount", pa.int64()),
+        ("note", pa.string()),
+        ("created_at", pa.timestamp("us")),
+        ("updated_at", pa.timestamp("us")),
+        ("attachment_id", pa.int64()),
+        ("file_key", pa.string()),
+        ("original_filename", pa.string()),
+        ("attachment_created_at", pa.timestamp("us")),
+    ])
+
+
+def _parquet_table(rows: list[Row], schema):
+    import pyarrow as pa
+
+    columns = [list(column) for column in zip(*rows)] if rows else [[] for _ in EXPORT_FIELDS]
+    status = EXPORT_FIELDS.index("status")
+    columns[status] = [getattr(s, "value", s) for s in columns[status]]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+async def export_parquet(
+    session: AsyncSession, date_from: date, date_to: date, compression: str = "none"
+) -> AsyncIterator[bytes]:
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema()
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression=compression)
+    try:
+        yield sink.drain()  # 매직 바이트 (PAR1)
+
+        pending: list[Row] = []
+        async for rows in iter_export_partitions(session, date_from, date_to):
+            pending.extend(rows)
+            if len(pending) >= PARQUET_ROW_GROUP_SIZE:
+                writer.write_table(_parquet_table(pending, schema))
+                pending = []
+                yield sink.drain()
+        if pending:
+            writer.write_table(_parquet_table(pending, schema))
+    finally:
+        # 끊겨도 writer는 닫음 (footer는 정상 종료일 때만 의미 있음)
+        writer.close()
+    yield sink.drain()
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    # 청크마다 sync flush -> 받는 쪽에서 바로 풀어볼 수 있음 (압축률 손해는 작음)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        if data := compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH):
+            yield data
+    yield compressor.flush()
+
+
+def _safe_filename(name: str) -> str:
+    # 경로 구분자/상위 경로 제거 (압축 해제 위치 밖으로 못 나가게)
+    name = name.replace("\\", "/").rsplit("/", 1)[-1].strip()
+    return "" if name in (".", "..") else name
+
+
+def zip_entry_names(files: list[tuple[date, str, str]]) -> list[str]:
+    """(work_date, file_key, original_filename) -> "YYYY-MM-DD/원본이름", 같은 날 같은 이름은 " (2)" 식으로"""
+    seen: set[str] = set()
+    names = []
+    for work_date, file_key, original_filename in files:
+        filename = _safe_filename(original_filename) or file_key.rsplit("/", 1)[-1]
+        stem, dot, ext = filename.rpartition(".")
+        if not stem:
+            stem, dot, ext = filename, "", ""
+        name = f"{work_date.isoformat()}/{filename}"
+        n = 2
+        # 대소문자 구분 없는 파일시스템(Windows/macOS)에서도 겹치지 않게
+        while name.casefold() in seen:
+            name = f"{work_date.isoformat()}/{stem} ({n}){dot}{ext}"
+            n += 1
+        seen.add(name.casefold())
+        names.append(name)
+    return names
+
+
+async def _fetch_object(file_key: str, queue: asyncio.Queue) -> None:
+    # 청크를 queue에 넣음 (꽉 차면 기다림 -> 소비 속도에 맞춰 읽음). 끝은 None, 실패는 예외 객체
+    try:
+        body = await asyncio.to_thread(open_object, file_key)
+        try:
+            while chunk := await asyncio.to_thread(body.read, ZIP_CHUNK_SIZE):
+                await queue.put(chunk)
+        finally:
+            body.close()
+    except Exception as e:
+        await queue.put(e)
+        return
+    await queue.put(None)
+
+
+async def stream_photos_zip(files: list[tuple[date, str, str]], concurrency: int) -> AsyncIterator[bytes]:
+    """
+    files(work_date, file_key, original_filename) 순서대로 ZIP 엔트리를 씀.
+    앞쪽 concurrency개를 미리 받기 시작하고, 하나를 쓰기 시작할 때마다 다음 것을 시작.
+    되감을 수 없는 출력이라 크기/CRC는 각 엔트리 뒤(data descriptor)에, 크기 제한이 없도록 zip64.
+    사진은 이미 압축된 포맷이라 STORED (CPU 안 씀).
+    """
+    names = zip_entry_names(files)
+    sink = _ChunkSink()
+    archive = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED)
+    fetches: dict[int, tuple[asyncio.Queue, asyncio.Task]] = {}
+    missing: list[str] = []
+
+    def start(index: int) -> None:
+        if index < len(files):
+            queue: asyncio.Queue = asyncio.Queue(maxsize=ZIP_QUEUE_CHUNKS)
+            fetches[index] = (queue, asyncio.create_task(_fetch_object(files[index][1], queue)))
+
+    try:
+        for index in range(concurrency):
+            start(index)
+        for index, (work_date, file_key, _) in enumerate(files):
+            queue, _ = fetches.pop(index)
+            start(index + concurrency)
+
+            chunk = await queue.get()
+            if isinstance(chunk, Exception):
+                logger.warning("photo archive: skipped %s (%s)", file_key, chunk)
+                missing.append(file_key)
+                continue
+
+            info = zipfile.ZipInfo(names[index], date_time=(work_date.year, work_date.month, work_date.day, 0, 0, 0))
+            with archive.open(info, mode="w", force_zip64=True) as entry:
+                while chunk is not None:
+                    # 중간에 끊기면 이미 보낸 엔트리를 되돌릴 수 없으니 응답을 중단
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    entry.write(chunk)
+                    yield sink.drain()
+                    chunk = await queue.get()
+            yield sink.drain()
+
+        if missing:
+            archive.writestr(ZIP_MISSING_ENTRY, "\n".join(missing) + "\n")
+        archive.close()
+        yield sink.drain()
+    finally:
+        # 클라이언트가 끊은 경우 등: 미리 받던 것 정리
+        for _, task in fetches.values():
+            task.cancel()
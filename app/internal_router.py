@@ -0,0 +1,20 @@
+'''
+운영용 내부 엔드포인트 (풀 사이징 등 데이터 확인용)
+'''
+
+from fastapi import APIRouter
+
+from app.db import pool_status
+from app.s3 import presign_cache_stats
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get("/db-pool")
+async def read_db_pool():
+    return pool_status()
+
+
+@router.get("/s3-presign-cache")
+async def read_s3_presign_cache():
+    return presign_cache_stats()
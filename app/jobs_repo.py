@@ -4,16 +4,149 @@ jobs 레포지토리 계층은 DB만 다룹니다.
 특징으로 HTTP를 모르며 status 의미도 모릅니다. 가져와라/저장해라만 합니다.
 '''
 
-from sqlmodel import Session, select
-from app.models import Job
+from datetime import date
 
+from sqlalchemy import func, text, tuple_, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import Job, JobTotal
 
-def get_job_by_id(session: Session, job_id: int) -> Job | None:
-    return session.get(Job, job_id)
 
+async def get_job_by_id(session: AsyncSession, job_id: int) -> Job | None:
+    return await session.get(Job, job_id)
 
-def save_job(session: Session, job: Job) -> Job:
+
+# *_statement: 실행하는 함수와 app.query_plans(EXPLAIN 점검)가 같은 문장을 쓰도록 분리
+
+def jobs_statement(limit: int, after: tuple[date, int] | None = None):
+    # (work_date, id) 인덱스 순서 그대로 keyset
+    statement = select(Job).order_by(Job.work_date.asc(), Job.id.asc()).limit(limit)
+    if after is not None:
+        statement = statement.where(tuple_(Job.work_date, Job.id) > tuple_(*after))
+    return statement
+
+
+def jobs_by_status_statement(status: str, limit: int, after: tuple[date, int] | None = None):
+    # (status, work_date, id) 인덱스 순서 그대로 keyset
+    return jobs_statement(limit, after).where(Job.status == status)
+
+
+async def list_jobs(session: AsyncSession, limit: int, after: tuple[date, int] | None = None) -> list[Job]:
+    return list((await session.exec(jobs_statement(limit, after))).all())
+
+
+async def list_jobs_by_status(
+    session: AsyncSession,
+    status: str,
+    limit: int,
+    after: tuple[date, int] | None = None,
+) -> list[Job]:
+    return list((await session.exec(jobs_by_status_statement(status, limit, after))).all())
+
+
+async def insert_job(session: AsyncSession, job: Job) -> Job:
+    # 커밋은 호출 측 (카운터와 같은 트랜잭션)
     session.add(job)
-    session.commit()
-    session.refresh(job)
+    await session.flush()
     return job
+
+
+def _update_jobs_status(from_status, to_status, ids, date_from, date_to, values):
+    # UPDATE ... WHERE status = from_status AND (id IN ... | work_date BETWEEN ...)
+    statement = update(Job).where(Job.status == from_status)
+    if ids is not None:
+        statement = statement.where(Job.id.in_(ids))
+    if date_from is not None:
+        statement = statement.where(Job.work_date >= date_from)
+    if date_to is not None:
+        statement = statement.where(Job.work_date <= date_to)
+    return statement.values(status=to_status, **(values or {}))
+
+
+def update_jobs_status_statement(
+    from_status: str,
+    to_status: str,
+    ids: list[int] | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    values: dict | None = None,
+):
+    # 바뀐 행 전체를 RETURNING 한 번
+    return _update_jobs_status(from_status, to_status, ids, date_from, date_to, values).returning(Job)
+
+
+def update_jobs_status_totals_statement(
+    from_status: str,
+    to_status: str,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    values: dict | None = None,
+):
+    # WITH changed AS (UPDATE ... RETURNING amount) SELECT count(*), sum(amount) FROM changed
+    # 행 수 제한이 없는 기간 변경용: 바뀐 행은 DB 밖으로 안 나오고 (건수, 금액 합) 한 행만
+    changed = _update_jobs_status(
+        from_status, to_status, None, date_from, date_to, values
+    ).returning(Job.amount).cte("changed")
+    return select(func.count(), func.coalesce(func.sum(changed.c.amount), 0))
+
+
+async def update_jobs_status(
+    session: AsyncSession,
+    from_status: str,
+    to_status: str,
+    ids: list[int] | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    values: dict | None = None,
+) -> list[Job]:
+    # 동시 요청이 같은 행을 바꿔도 WHERE status 재평가로 한 번만 반환됨 (카운터 이중 차감 없음)
+    statement = update_jobs_status_statement(from_status, to_status, ids, date_from, date_to, values)
+    result = await session.scalars(statement, execution_options={"populate_existing": True})
+    return list(result.all())
+
+
+async def update_jobs_status_totals(
+    session: AsyncSession,
+    from_status: str,
+    to_status: str,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    values: dict | None = None,
+) -> tuple[int, int]:
+    # (바뀐 건수, 금액 합). WHERE status 재평가로 동시 요청과 겹쳐도 한 번만 셈
+    statement = update_jobs_status_totals_statement(from_status, to_status, date_from, date_to, values)
+    count, amount = (await session.exec(statement)).one()
+    return count, amount
+
+
+async def adjust_job_total(session: AsyncSession, status: str, job_count: int, amount: int) -> None:
+    # 카운터 행 증감 (없으면 생성). 커밋은 호출 측
+    if not job_count and not amount:
+        return
+    await session.execute(
+        text("""
+            INSERT INTO job_totals (status, job_count, amount, updated_at)
+            VALUES (:status, :job_count, :amount, now())
+            ON CONFLICT (status) DO UPDATE
+            SET job_count = job_totals.job_count + EXCLUDED.job_count,
+                amount = job_totals.amount + EXCLUDED.amount,
+                updated_at = now()
+        """),
+        {"status": status, "job_count": job_count, "amount": amount},
+    )
+
+
+async def get_job_total(session: AsyncSession, status: str) -> JobTotal | None:
+    return await session.get(JobTotal, status)
+
+
+async def rebuild_job_totals(session: AsyncSession) -> None:
+    # 전체 재계산 (관리 명령용)
+    await session.execute(text("DELETE FROM job_totals"))
+    await session.execute(text("""
+        INSERT INTO job_totals (status, job_count, amount, updated_at)
+        SELECT status, count(*), coalesce(sum(amount), 0), now()
+        FROM jobs
+        GROUP BY status
+    """))
+    await session.commit()
@@ -1,41 +1,90 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
-from sqlmodel import Session, select
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db import get_session
-from app.models import Job
-from app.jobs_service import mark_job_paid
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from app.responses import ORJSONResponse
+from app.jobs_service import (
+    create_job,
+    get_jobs,
+    get_unpaid_jobs,
+    get_unpaid_summary,
+    mark_job_paid,
+    mark_jobs_paid,
+)
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
-@router.get("/")
-def read_jobs(session: Session = Depends(get_session)):
-    jobs = session.exec(select(Job)).all()
+class JobCreateRequest(BaseModel):
+    work_date: date
+    amount: int
+    title: str | None = None
+
+
+class MarkPaidRequest(BaseModel):
+    # ids 또는 기간(from/to) 중 하나
+    ids: list[int] | None = None
+    date_from: date | None = None
+    date_to: date | None = None
+
+
+# response_model이 없는 목록 응답: jsonable_encoder 뒤 직렬화만 orjson으로 (app.responses 참고)
+@router.get("/", response_class=ORJSONResponse)
+async def read_jobs(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_session),
+):
+    # 전체 job (work_date, id) 순 keyset 페이지, 다음 cursor는 헤더로
+    try:
+        jobs, next_cursor = await get_jobs(session, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return jobs
 
-@router.get("/unpaid")
-def read_unpaid_jobs(session: Session = Depends(get_session)):
-    unpaid_jobs = session.exec(select(Job)
-                            .where(Job.status == "UNPAID")
-                            .order_by(Job.work_date.asc())
-                            ).all()
-    return unpaid_jobs
+@router.post("/")
+async def post_job(payload: JobCreateRequest, session: AsyncSession = Depends(get_session)):
+    try:
+        return await create_job(session, payload.work_date, payload.amount, payload.title)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-@router.patch("/{id}/mark_paid")
-def mark_job_paid(id:int, session: Session = Depends(get_session)):
-    job = session.get(Job, id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
+@router.get("/unpaid", response_class=ORJSONResponse)
+async def read_unpaid_jobs(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_session),
+):
+    # 오래된 순 keyset 페이지, 다음 cursor는 헤더로
+    try:
+        jobs, next_cursor = await get_unpaid_jobs(session, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return jobs
 
-    job.status = "PAID"
-    session.add(job)
-    session.commit()
-    session.refresh(job)
-    return job
+@router.post("/mark_paid", response_class=ORJSONResponse)
+async def bulk_mark_paid(payload: MarkPaidRequest, session: AsyncSession = Depends(get_session)):
+    # UPDATE 한 번. ids면 실제로 PAID로 바뀐 job 목록까지, 기간이면 건수/금액만
+    try:
+        return await mark_jobs_paid(
+            session, ids=payload.ids, date_from=payload.date_from, date_to=payload.date_to
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.patch("/{id}/mark_paid")
+async def patch_job_paid(id: int, session: AsyncSession = Depends(get_session)):
+    return await mark_job_paid(session, id)
 
 @router.get("/unpaid/summary")
-def get_unpaid_jobs_summary(session: Session = Depends(get_session)):
-    summary = session.exec(
-        select(func.sum(Job.amount))
-            .where(Job.status == "UNPAID")).first() or 0
-    return {"total_amount": summary}
\ No newline at end of file
+async def get_unpaid_jobs_summary(session: AsyncSession = Depends(get_session)):
+    return await get_unpaid_summary(session)
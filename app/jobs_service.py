@@ -5,21 +5,112 @@ app.jobs_service의 Docstring
 PAID의 상태를 다시 바꾸지 않는다, 
 없는 job은 에러, paid로 바꾸는 행위의 규칙 등이 있습니다.(비즈니스 로직이라 함)
 '''
+from datetime import date
+
 from fastapi import HTTPException
-from sqlmodel import Session
+from sqlalchemy import func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.jobs_repo import (
+    adjust_job_total,
+    get_job_by_id,
+    get_job_total,
+    insert_job,
+    list_jobs,
+    list_jobs_by_status,
+    update_jobs_status,
+    update_jobs_status_totals,
+)
+from app.models import Job, JobStatus
+from app.pagination import cursor_after, page
+
+MAX_MARK_PAID_IDS = 1000
+
+
+async def create_job(session: AsyncSession, work_date: date, amount: int, title: str | None = None) -> Job:
+    if amount < 0:
+        raise ValueError("amount는 0 이상이어야 합니다.")
+    job = await insert_job(session, Job(work_date=work_date, amount=amount, title=title))
+    await adjust_job_total(session, JobStatus.UNPAID.value, 1, amount)
+    await session.commit()
+    await session.refresh(job)
+    return job
+
 
-from app.jobs_repo import get_job_by_id, save_job
+async def mark_jobs_paid(
+    session: AsyncSession,
+    ids: list[int] | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> dict:
+    """
+    id 목록 또는 work_date 기간의 UNPAID job을 한 번에 PAID로.
+    이미 PAID인 건 건너뜀(멱등). 미지급 카운터는 같은 트랜잭션에서 차감.
+    반환: paid_count, paid_amount (+ ids로 요청했으면 바뀐 job 목록 jobs).
+    기간은 행 수 제한이 없으므로 바뀐 job 목록은 돌려주지 않음 (건수/금액만 DB에서 집계).
+    """
+    if (ids is None) == (date_from is None and date_to is None):
+        raise ValueError("ids 또는 기간(from/to) 중 하나만 지정하세요.")
+    if ids is not None and len(ids) > MAX_MARK_PAID_IDS:
+        raise ValueError(f"ids는 한 번에 {MAX_MARK_PAID_IDS}개까지 가능합니다.")
+    if date_from and date_to and date_from > date_to:
+        raise ValueError("from은 to보다 이후일 수 없습니다.")
 
+    paid: list[Job] | None = None
+    if ids is not None:
+        if not ids:
+            return {"paid_count": 0, "paid_amount": 0, "jobs": []}
+        paid = await update_jobs_status(
+            session, JobStatus.UNPAID.value, JobStatus.PAID.value, ids=ids, values={"paid_at": func.now()}
+        )
+        count, amount = len(paid), sum(job.amount for job in paid)
+    else:
+        count, amount = await update_jobs_status_totals(
+            session,
+            JobStatus.UNPAID.value,
+            JobStatus.PAID.value,
+            date_from=date_from,
+            date_to=date_to,
+            values={"paid_at": func.now()},
+        )
+    await adjust_job_total(session, JobStatus.UNPAID.value, -count, -amount)
+    await adjust_job_total(session, JobStatus.PAID.value, count, amount)
+    await session.commit()
 
-def mark_job_paid(session: Session, job_id: int):
-    job = get_job_by_id(session, job_id)
+    result = {"paid_count": count, "paid_amount": amount}
+    if paid is not None:
+        result["jobs"] = paid
+    return result
 
+
+async def mark_job_paid(session: AsyncSession, job_id: int) -> Job:
+    paid = (await mark_jobs_paid(session, ids=[job_id]))["jobs"]
+    if paid:
+        return paid[0]
+
+    # 바뀐 게 없으면: 없는 job이거나 이미 PAID (멱등)
+    job = await get_job_by_id(session, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+async def get_jobs(
+    session: AsyncSession, limit: int, cursor: str | None = None
+) -> tuple[list[Job], str | None]:
+    return page(await list_jobs(session, limit + 1, cursor_after(cursor)), limit)
+
+
+async def get_unpaid_jobs(
+    session: AsyncSession, limit: int, cursor: str | None = None
+) -> tuple[list[Job], str | None]:
+    return page(await list_jobs_by_status(session, JobStatus.UNPAID.value, limit + 1, cursor_after(cursor)), limit)
 
-    # 비즈니스 규칙
-    if job.status == "PAID":
-        return job  # 멱등성
 
-    job.status = "PAID"
-    return save_job(session, job)
+async def get_unpaid_summary(session: AsyncSession) -> dict:
+    # 카운터 행 PK 조회 한 번
+    total = await get_job_total(session, JobStatus.UNPAID.value)
+    return {
+        "total_amount": total.amount if total else 0,
+        "job_count": total.job_count if total else 0,
+    }
@@ -1,20 +1,68 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from app.db import get_engine, pool_status
+from app.events import change_listener
 from app.users_router import router as users_router
-from app.works_router import router as jobs_router
+from app.works_router import router as works_router
+from app.jobs_router import router as jobs_router
 from app.attachments_router import router as attachments_router
+from app.internal_router import router as internal_router
+from app.metrics import MetricsMiddleware, render_metrics
+from app.s3 import presign_cache_stats, warm_up as warm_up_s3
+from app.thumbnails_service import thumbnail_worker
+from app.works_service import handle_change_event
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 엔진/S3 client는 import 때 만들지 않으므로 첫 요청 전에 미리 생성
+    get_engine()
+    warm_up_s3()
+    # 프로세스당 LISTEN 커넥션 하나 (SSE fan-out + 로컬 캐시 무효화)
+    change_listener.add_handler(handle_change_event)
+    change_listener.start()
+    # confirm 후 썸네일 생성 (Pillow 없으면 꺼짐)
+    thumbnail_worker.start()
+    yield
+    await thumbnail_worker.stop()
+    await change_listener.stop()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
+app.include_router(works_router)
 app.include_router(jobs_router)
 app.include_router(users_router)
 app.include_router(attachments_router)
+app.include_router(internal_router)
 
+app.add_middleware(MetricsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "X-Query-Count", "X-DB-Time-Ms"],
 )
 
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    pool = pool_status()
+    cache = presign_cache_stats()
+    gauges = {
+        "db_pool_checked_out": pool["checked_out"],
+        "db_pool_overflow": pool["overflow"],
+        "db_pool_acquisitions_total": pool["acquisitions"],
+        "db_pool_timeouts_total": pool["timeouts"],
+        "db_pool_max_wait_ms": pool["max_wait_ms"],
+        "s3_presign_cache_hits_total": cache["hits"],
+        "s3_presign_cache_misses_total": cache["misses"],
+        "s3_presign_cache_size": cache["size"],
+    }
+    return PlainTextResponse(render_metrics(gauges), media_type="text/plain; version=0.0.4")
+
 # python -m uvicorn app.main:app --reload
@@ -0,0 +1,149 @@
+'''
+관리 명령 모음
+python -m app.manage rebuild-rollups
+python -m app.manage rebuild-job-totals
+python -m app.manage explain-hot-queries
+python -m app.manage generate-thumbnails [--limit N] [--concurrency N]
+python -m app.manage reconcile-s3 [--dry-run] [--full] [--since YYYY-MM-DD] [--grace-hours N] [--recheck N]
+'''
+
+import argparse
+import asyncio
+import sys
+from datetime import date, timedelta
+
+from app.attachments_repo import list_attachments_missing_thumbnails
+from app.db import async_session
+from app.jobs_repo import rebuild_job_totals
+from app.query_plans import check_hot_query_plans
+from app.reconcile_service import DEFAULT_GRACE, DEFAULT_RECHECK_LIMIT, dates_to_reconcile, reconcile_date
+from app.rollups_repo import rebuild_rollups
+from app.settings import get_settings
+from app.thumbnails_service import ThumbnailJob, generate_thumbnails, pillow_available
+
+
+async def _rebuild_rollups(args: argparse.Namespace) -> int:
+    async with async_session() as session:
+        await rebuild_rollups(session)
+    print("work_log_rollups rebuilt")
+    return 0
+
+
+async def _rebuild_job_totals(args: argparse.Namespace) -> int:
+    async with async_session() as session:
+        await rebuild_job_totals(session)
+    print("job_totals rebuilt")
+    return 0
+
+
+async def _explain_hot_queries(args: argparse.Namespace) -> int:
+    async with async_session() as session:
+        failures = await check_hot_query_plans(session)
+    for failure in failures:
+        print(failure)
+    print("ok" if not failures else f"{len(failures)} hot query plan problem(s)")
+    return 1 if failures else 0
+
+
+async def _generate_thumbnails(args: argparse.Namespace) -> int:
+    # 썸네일이 빠진 첨부를 id 순으로 채움 (워커 대기열 유실/신규 크기 추가 대비)
+    if not pillow_available():
+        print("Pillow가 설치되어 있지 않습니다.")
+        return 1
+
+    size_count = len(get_settings().thumbnail_sizes)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    done = failed = 0
+    after_id = 0
+
+    async def run(job: ThumbnailJob) -> None:
+        nonlocal done, failed
+        async with semaphore:
+            try:
+                await generate_thumbnails(job)
+                done += 1
+            except Exception as e:
+                failed += 1
+                print(f"attachment {job.attachment_id} ({job.file_key}): {e}")
+
+    while args.limit is None or done + failed < args.limit:
+        async with async_session() as session:
+            rows = await list_attachments_missing_thumbnails(session, size_count, after_id=after_id)
+        if not rows:
+            break
+        if args.limit is not None:
+            rows = rows[: args.limit - done - failed]
+        after_id = rows[-1][0].id
+        await asyncio.gather(*(
+            run(ThumbnailJob(a.id, wl.id, wl.work_date, a.file_key)) for a, wl in rows
+        ))
+
+    print(f"thumbnails generated for {done} attachment(s), {failed} failed")
+    return 1 if failed else 0
+
+
+async def _reconcile_s3(args: argparse.Namespace) -> int:
+    grace = timedelta(hours=args.grace_hours)
+    totals = {"dates": 0, "objects": 0, "orphans": 0, "deleted": 0, "missing": 0}
+    async with async_session() as session:
+        dates = await dates_to_reconcile(
+            session,
+            grace=grace,
+            full=args.full,
+            since=args.since,
+            recheck_limit=args.recheck,
+            dry_run=args.dry_run,
+        )
+        for work_date in dates:
+            result = await reconcile_date(session, work_date, grace=grace, dry_run=args.dry_run)
+            totals["dates"] += 1
+            totals["objects"] += result.object_count
+            totals["orphans"] += len(result.orphans)
+            totals["deleted"] += len(result.deleted)
+            totals["missing"] += len(result.missing_ids)
+            if result.orphans or result.missing_ids:
+                action = "would delete" if args.dry_run else "deleted"
+                removed = result.expired if args.dry_run else result.deleted
+                print(
+                    f"{work_date}: objects={result.object_count} orphans={len(result.orphans)} "
+                    f"{action}={len(removed)} missing={len(result.missing_ids)}"
+                )
+
+    print(" ".join(f"{k}={v}" for k, v in totals.items()) + (" (dry run)" if args.dry_run else ""))
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.manage")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("rebuild-rollups").set_defaults(handler=_rebuild_rollups)
+    commands.add_parser("rebuild-job-totals").set_defaults(handler=_rebuild_job_totals)
+
+    commands.add_parser("explain-hot-queries").set_defaults(handler=_explain_hot_queries)
+
+    thumbnails = commands.add_parser("generate-thumbnails")
+    thumbnails.add_argument("--limit", type=int, help="처리할 최대 첨부 수")
+    thumbnails.add_argument("--concurrency", type=int, default=4)
+    thumbnails.set_defaults(handler=_generate_thumbnails)
+
+    reconcile = commands.add_parser("reconcile-s3")
+    reconcile.add_argument("--dry-run", action="store_true", help="삭제/표시/체크포인트 없이 결과만 출력")
+    reconcile.add_argument("--full", action="store_true", help="체크포인트를 무시하고 모든 날짜 대조")
+    reconcile.add_argument("--since", type=date.fromisoformat, help="이 날짜 이후 prefix만")
+    reconcile.add_argument(
+        "--grace-hours", type=float, default=DEFAULT_GRACE.total_seconds() / 3600,
+        help="이 시간보다 오래된 orphan만 삭제",
+    )
+    reconcile.add_argument(
+        "--recheck", type=int, default=DEFAULT_RECHECK_LIMIT,
+        help="정리가 끝난 날짜 중 목록을 다시 볼 최대 개수 (오래 확인 안 한 것부터)",
+    )
+    reconcile.set_defaults(handler=_reconcile_s3)
+
+    args = parser.parse_args()
+    sys.exit(asyncio.run(args.handler(args)))
+
+
+if __name__ == "__main__":
+    main()
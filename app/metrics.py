@@ -0,0 +1,176 @@
+'''
+요청 지연/DB 쿼리/S3 서명 계측 -> Prometheus 텍스트 포맷 (/metrics)
+- MetricsMiddleware: route별 지연 히스토그램 + 요청당 쿼리 수/DB 시간 (X-Query-Count 헤더)
+- install_db_hooks: SQLAlchemy before/after_cursor_execute로 쿼리 시간 측정
+- observe(): 임의 구간 타이밍 (S3 presign 등)
+'''
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from starlette.routing import Match
+
+from app.settings import get_settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05)
+
+
+def _label_str(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    return ",".join(f'{n}="{str(v)}"' for n, v in zip(names, values))
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = (), buckets=LATENCY_BUCKETS) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        # labels 값 -> [bucket별 count..., sum, count]
+        self._series: dict[tuple, list[float]] = {}
+
+    def observe(self, value: float, *label_values) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [0.0] * (len(self.buckets) + 2)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[i] += 1
+                break
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for label_values, series in sorted(self._series.items()):
+            base = _label_str(self.labels, label_values)
+            prefix = base + "," if base else ""
+            cumulative = 0.0
+            for bound, n in zip(self.buckets, series):
+                cumulative += n
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative:g}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {series[-1]:g}')
+            suffix = f"{{{base}}}" if base else ""
+            lines.append(f"{self.name}_sum{suffix} {series[-2]:.6f}")
+            lines.append(f"{self.name}_count{suffix} {series[-1]:g}")
+        return lines
+
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route", "status")
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries", "DB queries per HTTP request", ("route",), COUNT_BUCKETS
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds", "DB time per HTTP request", ("route",)
+)
+DB_QUERY_LATENCY = Histogram("db_query_duration_seconds", "DB cursor execute latency")
+S3_PRESIGN_LATENCY = Histogram(
+    "s3_presign_duration_seconds", "S3 presigned URL signing latency", ("operation",), FAST_BUCKETS
+)
+
+_HISTOGRAMS = [REQUEST_LATENCY, REQUEST_QUERIES, REQUEST_DB_TIME, DB_QUERY_LATENCY, S3_PRESIGN_LATENCY]
+
+
+class RequestStats:
+    __slots__ = ("queries", "db_time")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_time = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+@contextmanager
+def observe(histogram: Histogram, *label_values):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - started, *label_values)
+
+
+def install_db_hooks(sync_engine) -> None:
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        DB_QUERY_LATENCY.observe(elapsed)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_time += elapsed
+
+
+def _route_path(scope) -> str:
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    app = scope.get("app")
+    for candidate in getattr(app, "routes", []):
+        path = getattr(candidate, "path", None)
+        if path is None:
+            continue
+        match, _ = candidate.matches(scope)
+        if match == Match.FULL:
+            return path
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """순수 ASGI 미들웨어 (스트리밍 응답도 그대로 통과)"""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        query_count_header = get_settings().query_count_header
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if query_count_header:
+                    # 헤더 시점까지의 쿼리 수 (스트리밍 응답은 이후 쿼리 미포함)
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-query-count", str(stats.queries).encode()))
+                    headers.append((b"x-db-time-ms", f"{stats.db_time * 1000:.2f}".encode()))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            route = _route_path(scope)
+            REQUEST_LATENCY.observe(time.perf_counter() - started, scope["method"], route, status)
+            REQUEST_QUERIES.observe(stats.queries, route)
+            REQUEST_DB_TIME.observe(stats.db_time, route)
+
+
+def render_metrics(gauges: dict[str, float] | None = None) -> str:
+    lines: list[str] = []
+    for histogram in _HISTOGRAMS:
+        lines += histogram.render()
+    for name, value in (gauges or {}).items():
+        lines += [f"# TYPE {name} gauge", f"{name} {value:g}"]
+    return "\n".join(lines) + "\n"
@@ -3,7 +3,7 @@ from datetime import datetime, date
 from enum import Enum
 
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, DateTime, text
+from sqlalchemy import BigInteger, Column, DateTime, Index, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import ENUM as PGEnum
 
 
@@ -23,10 +23,15 @@ class WorkStatus(str, Enum):
 
 class WorkLog(SQLModel, table=True):
     __tablename__ = "work_logs"
+    # status별 목록/주간 집계: WHERE status = ? ORDER BY work_date
+    __table_args__ = (
+        Index("ix_work_logs_status_work_date", "status", "work_date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
-    work_date: date = Field(nullable=False, index=True)
+    # 하루 1행: upsert의 ON CONFLICT (work_date) 대상
+    work_date: date = Field(nullable=False, index=True, unique=True)
 
     sales_count: int = Field(default=0, nullable=False)
     sales_amount: int = Field(default=0, nullable=False)
@@ -45,17 +50,24 @@ class WorkLog(SQLModel, table=True):
         default=None,
         sa_column=Column(DateTime, nullable=False, server_default=text("now()")),
     )
+    # ORM UPDATE 때마다 now()로 갱신 (ETag 기준), core upsert는 직접 now()를 넣음
     updated_at: Optional[datetime] = Field(
         default=None,
-        sa_column=Column(DateTime, nullable=False, server_default=text("now()")),
+        sa_column=Column(DateTime, nullable=False, server_default=text("now()"), onupdate=func.now()),
     )
 
 class Attachment(SQLModel, table=True):
     __tablename__ = "attachments"
+    # confirm 멱등성: ON CONFLICT (work_log_id, file_key) 대상
+    # 첨부 목록: WHERE work_log_id = ? ORDER BY created_at
+    __table_args__ = (
+        UniqueConstraint("work_log_id", "file_key", name="uq_attachments_work_log_id_file_key"),
+        Index("ix_attachments_work_log_id_created_at", "work_log_id", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
-    work_log_id: int = Field(foreign_key="work_logs.id", nullable=False, index=True)
+    work_log_id: int = Field(foreign_key="work_logs.id", nullable=False)
 
     file_key: str = Field(nullable=False, max_length=1024)
     original_filename: str = Field(nullable=False, max_length=255)
@@ -63,4 +75,146 @@ class Attachment(SQLModel, table=True):
     created_at: Optional[datetime] = Field(
         default=None,
         sa_column=Column(DateTime, nullable=False, server_default=text("now()")),
-    )
\ No newline at end of file
+    )
+    # S3 대조(reconcile)에서 객체가 없다고 확인된 시각 (다시 보이면 NULL로)
+    missing_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, nullable=True),
+    )
+
+
+class AttachmentThumbnail(SQLModel, table=True):
+    """
+    첨부 원본에서 만든 WebP 썸네일 (크기별 1개, 원본 옆 thumbs/ 아래에 저장).
+    confirm 후 백그라운드 워커가 채움 -> 없으면 목록 API는 원본 URL로 대체.
+    """
+    __tablename__ = "attachment_thumbnails"
+    # ON CONFLICT (attachment_id, size) 대상 + 첨부별 조회
+    __table_args__ = (
+        UniqueConstraint("attachment_id", "size", name="uq_attachment_thumbnails_attachment_id_size"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    attachment_id: int = Field(foreign_key="attachments.id", nullable=False)
+    size: int = Field(nullable=False)  # 긴 변 최대 px (요청 크기)
+
+    file_key: str = Field(nullable=False, max_length=1024)
+    width: int = Field(nullable=False)
+    height: int = Field(nullable=False)
+    byte_size: int = Field(nullable=False)
+
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, nullable=False, server_default=text("now()")),
+    )
+
+
+class S3ReconcileCheckpoint(SQLModel, table=True):
+    """work-logs/{date}/ prefix별 마지막 S3 대조 결과 (증분 실행 기준)"""
+    __tablename__ = "s3_reconcile_checkpoints"
+
+    work_date: date = Field(primary_key=True)
+
+    object_count: int = Field(default=0, nullable=False)
+    orphan_count: int = Field(default=0, nullable=False)  # 발견된 DB에 없는 객체
+    deleted_count: int = Field(default=0, nullable=False)  # 그중 유예 기간이 지나 삭제한 것
+    missing_count: int = Field(default=0, nullable=False)  # 객체가 없는 첨부
+    # 대조 시점 prefix의 최신 LastModified (UTC). 목록이 바뀌었는지 비교하는 기준
+    max_last_modified: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, nullable=True),
+    )
+
+    reconciled_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, nullable=False, server_default=text("now()")),
+    )
+    # 목록을 마지막으로 확인한 시각 (대조 또는 목록만 재확인). 재확인 순번 기준
+    checked_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, nullable=False, server_default=text("now()")),
+    )
+
+
+class JobStatus(str, Enum):
+    UNPAID = "UNPAID"
+    PAID = "PAID"
+
+
+class Job(SQLModel, table=True):
+    __tablename__ = "jobs"
+    # 미지급 목록: WHERE status = ? ORDER BY work_date, id (keyset)
+    # 전체 목록: ORDER BY work_date, id (keyset)
+    __table_args__ = (
+        Index("ix_jobs_status_work_date", "status", "work_date", "id"),
+        Index("ix_jobs_work_date", "work_date", "id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    work_date: date = Field(nullable=False)
+    title: Optional[str] = Field(default=None, max_length=255)
+    amount: int = Field(default=0, nullable=False)
+    status: str = Field(default=JobStatus.UNPAID.value, nullable=False, max_length=16)
+
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, nullable=False, server_default=text("now()")),
+    )
+    paid_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, nullable=True),
+    )
+
+
+class JobTotal(SQLModel, table=True):
+    """
+    status별 jobs 합계 카운터 (행 하나씩).
+    jobs 쓰기와 같은 트랜잭션에서 증감 -> 미지급 합계 조회는 PK 한 번.
+    """
+    __tablename__ = "job_totals"
+
+    status: str = Field(primary_key=True, max_length=16)
+    job_count: int = Field(default=0, nullable=False)
+    amount: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, server_default=text("0")),
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, nullable=False, server_default=text("now()")),
+    )
+
+
+class WorkLogRollup(SQLModel, table=True):
+    """
+    work_logs 집계 (period: day / week(월요일 시작) / month, 전체 합계는 month 행 합산).
+    work_log/attachment 쓰기와 같은 트랜잭션에서 갱신 -> 요약 API는 PK 조회 한 번.
+    """
+    __tablename__ = "work_log_rollups"
+
+    period: str = Field(primary_key=True, max_length=8)
+    period_start: date = Field(primary_key=True)
+
+    work_days: int = Field(default=0, nullable=False)  # 출근
+    half_days: int = Field(default=0, nullable=False)  # 반차
+    off_days: int = Field(default=0, nullable=False)  # 휴무
+
+    # 기간 합계는 int 범위를 넘을 수 있어서 bigint
+    sales_count: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, server_default=text("0")),
+    )
+    sales_amount: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, server_default=text("0")),
+    )
+
+    photo_days: int = Field(default=0, nullable=False)  # 사진 1장 이상 있는 날 수
+    photo_count: int = Field(default=0, nullable=False)
+
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, nullable=False, server_default=text("now()")),
+    )
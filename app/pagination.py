@@ -0,0 +1,45 @@
+'''
+목록 API 공용 keyset 페이지 (work_logs, jobs)
+- (work_date, id) 오름차순, cursor는 마지막 행의 "YYYY-MM-DD_id"
+- limit+1개를 읽어서 다음 페이지 존재 여부 판단
+- 다음 페이지 cursor는 응답 헤더(X-Next-Cursor)로 (body는 리스트 그대로)
+'''
+
+from datetime import date
+from typing import Protocol, TypeVar
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class _Keyed(Protocol):
+    work_date: date
+    id: int
+
+
+T = TypeVar("T", bound=_Keyed)
+
+
+def encode_cursor(row: _Keyed) -> str:
+    return f"{row.work_date.isoformat()}_{row.id}"
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        work_date, row_id = cursor.split("_", 1)
+        return date.fromisoformat(work_date), int(row_id)
+    except ValueError:
+        raise ValueError("cursor 형식이 올바르지 않습니다.")
+
+
+def cursor_after(cursor: str | None) -> tuple[date, int] | None:
+    # repo 함수의 after 인자 (cursor가 없으면 첫 페이지)
+    return decode_cursor(cursor) if cursor else None
+
+
+def page(rows: list[T], limit: int) -> tuple[list[T], str | None]:
+    # rows는 limit+1개까지 읽은 것
+    if len(rows) > limit:
+        return rows[:limit], encode_cursor(rows[limit - 1])
+    return rows, None
@@ -0,0 +1,188 @@
+'''
+hot path 쿼리 실행계획 점검 (인덱스 회귀 방지)
+python -m app.manage explain-hot-queries
+pytest tests/test_query_plans.py  (DATABASE_URL이 있을 때만 실행, 없으면 skip)
+
+repo 계층의 *_statement가 만드는 실제 문장을 값까지 박아(literal_binds) EXPLAIN하고,
+쿼리마다 기대하는 인덱스를 planner가 실제로 골랐는지 확인 (enable_seqscan은 건드리지 않음).
+값은 DB에 있는 최근 work_log에서 고르므로 시드된 DB에서 돌려야 의미가 있음
+(python -m bench.seed 후 실행: 작은 테이블은 planner가 Seq Scan을 고르는 게 맞음).
+PK 한 번 조회(session.get: get_rollup, get_job_total 등)는 점검 대상에서 뺌.
+'''
+
+import json
+from datetime import date, timedelta
+from typing import NamedTuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.attachments_repo import (
+    attachment_files_statement,
+    lock_work_log_statement,
+    thumbnail_keys_statement,
+    work_log_attachments_statement,
+)
+from app.jobs_repo import jobs_by_status_statement, jobs_statement, update_jobs_status_totals_statement
+from app.models import Attachment, JobStatus, WorkLog, WorkStatus
+from app.rollups_repo import rollup_buckets_statement, rollup_total_statement
+from app.works_repo import (
+    export_statement,
+    work_log_by_date_statement,
+    work_log_detail_statement,
+    work_log_with_attachments_statement,
+    work_logs_statement,
+)
+
+HOT_TABLES = {"work_logs", "attachments", "work_log_rollups", "attachment_thumbnails", "jobs", "job_totals"}
+
+# API 기본값과 같은 크기
+PAGE_LIMIT = 101
+EXPORT_DAYS = 31
+ANALYTICS_DAYS = 365
+
+
+class HotQuery(NamedTuple):
+    name: str
+    statement: object
+    indexes: frozenset[str]  # 계획에 나와야 하는 인덱스
+    # Seq Scan이어도 되는 테이블: 기간 조인은 범위가 넓으면 attachments 전체 hash join이 더 싸서 planner가 고름
+    seq_scan_ok: frozenset[str] = frozenset()
+
+
+class _Sample(NamedTuple):
+    work_log_id: int
+    work_date: date
+    attachment_ids: list[int]
+
+
+async def _sample(session: AsyncSession) -> _Sample | None:
+    # 첨부가 있는 가장 최근 work_log 기준으로 값을 고름 (오늘 화면/최근 기간 조회와 같은 모양)
+    row = (await session.execute(
+        select(WorkLog.id, WorkLog.work_date)
+        .where(select(Attachment.id).where(Attachment.work_log_id == WorkLog.id).exists())
+        .order_by(WorkLog.work_date.desc())
+        .limit(1)
+    )).first()
+    if row is None:
+        return None
+    attachment_ids = list((await session.execute(
+        select(Attachment.id).where(Attachment.work_log_id == row.id)
+    )).scalars())
+    return _Sample(row.id, row.work_date, attachment_ids)
+
+
+def hot_queries(sample: _Sample) -> list[HotQuery]:
+    day, log_id = sample.work_date, sample.work_log_id
+    month_ago = day - timedelta(days=EXPORT_DAYS - 1)
+    year_ago = day - timedelta(days=ANALYTICS_DAYS - 1)
+    work_date_index = frozenset({"ix_work_logs_work_date"})
+    attachments_index = frozenset({"ix_attachments_work_log_id_created_at"})
+    return [
+        HotQuery("work_log by date", work_log_by_date_statement(day), work_date_index),
+        HotQuery(
+            "work_logs page (keyset)",
+            work_logs_statement(after=(day, log_id)).limit(PAGE_LIMIT),
+            work_date_index,
+        ),
+        HotQuery(
+            # 첫 페이지 (오래된 순). 출근처럼 대부분인 status는 work_date 인덱스 + 필터가 맞는 계획이라 반차로
+            "work_logs by status first page",
+            work_logs_statement(status=WorkStatus.반차).limit(PAGE_LIMIT),
+            frozenset({"ix_work_logs_status_work_date"}),
+        ),
+        HotQuery(
+            "today with attachments",
+            work_log_with_attachments_statement(day),
+            work_date_index | attachments_index,
+        ),
+        HotQuery("confirm lock", lock_work_log_statement(log_id), frozenset({"work_logs_pkey"})),
+        HotQuery("attachments of work_log (confirm)", work_log_attachments_statement(log_id), attachments_index),
+        HotQuery(
+            "work_log detail by id",
+            work_log_detail_statement(log_id),
+            frozenset({"work_logs_pkey"}) | attachments_index,
+        ),
+        HotQuery(
+            "export range with attachments",
+            export_statement(month_ago, day),
+            work_date_index,
+            seq_scan_ok=frozenset({"attachments"}),
+        ),
+        HotQuery(
+            "photo archive keys",
+            attachment_files_statement(month_ago, day),
+            work_date_index,
+            seq_scan_ok=frozenset({"attachments"}),
+        ),
+        HotQuery(
+            "thumbnails of attachments",
+            thumbnail_keys_statement(sample.attachment_ids),
+            frozenset({"uq_attachment_thumbnails_attachment_id_size"}),
+        ),
+        HotQuery(
+            "analytics buckets",
+            rollup_buckets_statement("month", year_ago, day),
+            frozenset({"work_log_rollups_pkey"}),
+        ),
+        HotQuery("rollup total", rollup_total_statement(), frozenset({"work_log_rollups_pkey"})),
+        HotQuery(
+            "jobs page (keyset)",
+            jobs_statement(PAGE_LIMIT, after=(month_ago, 0)),
+            frozenset({"ix_jobs_work_date"}),
+        ),
+        HotQuery(
+            "unpaid jobs page (keyset)",
+            jobs_by_status_statement(JobStatus.UNPAID.value, PAGE_LIMIT, after=(month_ago, 0)),
+            frozenset({"ix_jobs_status_work_date"}),
+        ),
+        HotQuery(
+            "mark paid by date range",
+            update_jobs_status_totals_statement(
+                JobStatus.UNPAID.value, JobStatus.PAID.value, date_from=month_ago, date_to=day,
+                values={"paid_at": func.now()},
+            ),
+            frozenset({"ix_jobs_status_work_date"}),
+        ),
+    ]
+
+
+def _render(statement) -> str:
+    # 실제 바인드 값을 박은 SQL (파라미터 없이 EXPLAIN하면 generic plan이 아니라 그 값의 계획)
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+async def explain(session: AsyncSession, statement) -> dict:
+    # text()를 거치지 않음: 리터럴 안의 ':'가 바인드로 해석되지 않게 드라이버 SQL로 바로
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {_render(statement)}")
+    raw = result.scalar_one()
+    return (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+
+
+async def check_hot_query_plans(session: AsyncSession) -> list[str]:
+    """기대 인덱스를 안 쓰거나 hot 테이블을 Seq Scan하는 쿼리 목록 (비어 있으면 통과). 끝나면 롤백."""
+    sample = await _sample(session)
+    if sample is None:
+        await session.rollback()
+        return ["첨부가 있는 work_log가 없습니다 (python -m bench.seed로 시드한 DB에서 실행)"]
+
+    failures = []
+    for query in hot_queries(sample):
+        nodes = list(_walk(await explain(session, query.statement)))
+        used = {node["Index Name"] for node in nodes if "Index Name" in node}
+        for index in sorted(query.indexes - used):
+            failures.append(f"{query.name}: {index} not used (indexes: {sorted(used) or 'none'})")
+        for node in nodes:
+            table = node.get("Relation Name")
+            if node.get("Node Type") == "Seq Scan" and table in HOT_TABLES - query.seq_scan_ok:
+                failures.append(f"{query.name}: Seq Scan on {table}")
+    await session.rollback()
+    return failures
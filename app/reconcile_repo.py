@@ -0,0 +1,57 @@
+'''
+S3 대조 체크포인트 레포지토리 (work_date prefix별 마지막 대조 결과)
+'''
+
+from datetime import date
+
+from sqlalchemy import Row, delete, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import S3ReconcileCheckpoint
+
+
+async def get_reconcile_checkpoints(session: AsyncSession) -> dict[date, Row]:
+    # work_date -> (reconciled_at, checked_at, object_count, orphan_count, deleted_count, max_last_modified)
+    statement = select(
+        S3ReconcileCheckpoint.work_date,
+        S3ReconcileCheckpoint.reconciled_at,
+        S3ReconcileCheckpoint.checked_at,
+        S3ReconcileCheckpoint.object_count,
+        S3ReconcileCheckpoint.orphan_count,
+        S3ReconcileCheckpoint.deleted_count,
+        S3ReconcileCheckpoint.max_last_modified,
+    )
+    return {row.work_date: row for row in (await session.exec(statement)).all()}
+
+
+async def save_reconcile_checkpoint(session: AsyncSession, values: dict) -> None:
+    # 커밋은 호출 측 (그 날짜의 missing 플래그와 같은 트랜잭션)
+    statement = pg_insert(S3ReconcileCheckpoint).values(**values)
+    statement = statement.on_conflict_do_update(
+        index_elements=["work_date"],
+        set_={
+            **{key: statement.excluded[key] for key in values if key != "work_date"},
+            "reconciled_at": func.now(),
+            "checked_at": func.now(),
+        },
+    )
+    await session.execute(statement)
+
+
+async def mark_reconcile_checked(session: AsyncSession, work_dates: list[date]) -> None:
+    # 목록만 다시 보고 그대로였던 날짜 (커밋은 호출 측)
+    await session.execute(
+        update(S3ReconcileCheckpoint)
+        .where(S3ReconcileCheckpoint.work_date.in_(work_dates))
+        .values(checked_at=func.now())
+    )
+
+
+async def delete_reconcile_checkpoint(session: AsyncSession, work_date: date) -> bool:
+    # 체크포인트가 없으면 다음 실행에서 그 날짜를 처음부터 대조함 (커밋은 호출 측)
+    result = await session.execute(
+        delete(S3ReconcileCheckpoint).where(S3ReconcileCheckpoint.work_date == work_date)
+    )
+    return result.rowcount > 0
@@ -0,0 +1,169 @@
+'''
+S3 <-> attachments 대조 (python -m app.manage reconcile-s3)
+날짜 prefix(work-logs/{date}/) 단위로:
+- DB에 없는 객체(confirm 안 된 업로드, 기록 전에 실패한 썸네일) -> 유예 기간이 지나면 삭제
+- 객체가 없는 첨부 -> attachments.missing_at 표시 (다시 보이면 해제)
+결과는 s3_reconcile_checkpoints에 남김. 정리가 끝난 날짜는 다시 대조하지 않음, 단
+- 지난 날짜로 presign하면 그 날짜 체크포인트를 지움 (reopen_reconciled_date) -> 다음 실행에서 바로 대조
+- 그 밖의 변경(썸네일 백필, 밖에서 지운 객체 등)은 실행마다 가장 오래 확인 안 한 날짜부터
+  recheck_limit개만 목록을 다시 보고, 객체 수나 최신 LastModified가 바뀐 날짜만 다시 대조
+그래서 한 번 실행의 S3 목록 비용은 최근/바뀐 날짜 + recheck_limit개 prefix로 묶임 (전체 객체 수와 무관).
+'''
+
+import asyncio
+from datetime import date, datetime, time, timedelta, timezone
+from typing import NamedTuple
+
+from sqlalchemy import Row
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.attachments_repo import list_attachment_dates, list_known_file_keys, set_attachments_missing
+from app.events import notify_change
+from app.reconcile_repo import (
+    delete_reconcile_checkpoint,
+    get_reconcile_checkpoints,
+    mark_reconcile_checked,
+    save_reconcile_checkpoint,
+)
+from app.s3 import WORK_LOGS_PREFIX, delete_objects, list_date_prefixes, list_objects, work_date_prefix
+from app.works_service import invalidate_work_log_caches, today_seoul_date
+
+# presigned PUT(최대 10분) 후 confirm까지 여유 + 썸네일 업로드~기록 사이 여유
+DEFAULT_GRACE = timedelta(hours=24)
+# 정리가 끝난 날짜 중 한 번 실행에 목록을 다시 보는 최대 개수 (한 달치씩 돌아가며)
+DEFAULT_RECHECK_LIMIT = 31
+# 그 목록 재확인 동시 개수
+RECHECK_CONCURRENCY = 8
+
+
+class ReconcileResult(NamedTuple):
+    work_date: date
+    object_count: int
+    orphans: list[str]
+    expired: list[str]  # 유예 기간이 지난 orphan (삭제 대상)
+    deleted: list[str]
+    missing_ids: list[int]
+
+
+def _parse_prefix(prefix: str) -> date | None:
+    # "work-logs/2024-01-01/" -> date (날짜가 아닌 prefix는 무시)
+    try:
+        return date.fromisoformat(prefix.removeprefix(WORK_LOGS_PREFIX).rstrip("/"))
+    except ValueError:
+        return None
+
+
+def _is_settled(checkpoint: Row, grace: timedelta) -> bool:
+    # 그날이 끝나고 유예 기간까지 지난 뒤에 대조했고, 유예 중이라 못 지운 orphan도 없으면 정리 끝
+    # (정리가 끝난 날짜도 목록이 바뀌면 다시 대조 -> _changed_since)
+    day_end = datetime.combine(checkpoint.work_date, time()) + timedelta(days=1)
+    return (
+        checkpoint.reconciled_at - day_end >= grace
+        and checkpoint.orphan_count <= checkpoint.deleted_count
+    )
+
+
+def _max_last_modified(objects: dict[str, datetime]) -> datetime | None:
+    # 체크포인트 컬럼과 같은 naive UTC
+    if not objects:
+        return None
+    return max(objects.values()).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+async def _changed_since(checkpoint: Row) -> bool:
+    # prefix 목록이 마지막 대조 때와 다르면 (새 객체/삭제된 객체) 다시 대조
+    objects = await asyncio.to_thread(list_objects, work_date_prefix(checkpoint.work_date))
+    return (
+        len(objects) != checkpoint.object_count
+        or _max_last_modified(objects) != checkpoint.max_last_modified
+    )
+
+
+async def dates_to_reconcile(
+    session: AsyncSession,
+    grace: timedelta = DEFAULT_GRACE,
+    full: bool = False,
+    since: date | None = None,
+    recheck_limit: int = DEFAULT_RECHECK_LIMIT,
+    dry_run: bool = False,
+) -> list[date]:
+    """
+    대조할 날짜: 체크포인트가 없거나 아직 정리가 안 끝난 날짜 + 재확인해 보니 목록이 바뀐 정리된 날짜.
+    재확인한 결과 그대로인 날짜는 checked_at만 갱신 (dry_run이면 안 함) -> 다음 실행은 그다음 날짜들.
+    """
+    s3_dates = {d for p in await asyncio.to_thread(list_date_prefixes) if (d := _parse_prefix(p))}
+    db_dates = set(await list_attachment_dates(session))
+    checkpoints = {} if full else await get_reconcile_checkpoints(session)
+
+    dates = sorted(d for d in s3_dates | db_dates if since is None or d >= since)
+    settled = sorted(
+        (checkpoints[d] for d in dates if d in checkpoints and _is_settled(checkpoints[d], grace)),
+        key=lambda checkpoint: (checkpoint.checked_at, checkpoint.work_date),
+    )
+    recheck = settled[:recheck_limit]
+    semaphore = asyncio.Semaphore(RECHECK_CONCURRENCY)
+
+    async def changed(checkpoint: Row) -> bool:
+        async with semaphore:
+            return await _changed_since(checkpoint)
+
+    results = await asyncio.gather(*map(changed, recheck))
+    unchanged = [checkpoint.work_date for checkpoint, is_changed in zip(recheck, results) if not is_changed]
+    if unchanged and not dry_run:
+        await mark_reconcile_checked(session, unchanged)
+        await session.commit()
+
+    skip = {checkpoint.work_date for checkpoint in settled[recheck_limit:]} | set(unchanged)
+    return [d for d in dates if d not in skip]
+
+
+async def reopen_reconciled_date(session: AsyncSession, work_date: date) -> None:
+    # 지난 날짜 prefix로 업로드 URL을 줌: 정리가 끝났어도 새 객체가 생길 수 있으니 다음 실행에서 다시 대조
+    if work_date < today_seoul_date() and await delete_reconcile_checkpoint(session, work_date):
+        await session.commit()
+
+
+async def reconcile_date(
+    session: AsyncSession,
+    work_date: date,
+    grace: timedelta = DEFAULT_GRACE,
+    dry_run: bool = False,
+) -> ReconcileResult:
+    # DB를 먼저 읽고 S3를 나중에 목록화:
+    # 그 사이 confirm된 첨부는 DB 집합에 없으므로 missing으로 잘못 찍히지 않고,
+    # 그 사이 올라온 객체는 최근 객체라 유예 기간 때문에 지워지지 않음
+    attachments, thumbnails = await list_known_file_keys(session, work_date)
+    started = datetime.now(timezone.utc)
+    objects = await asyncio.to_thread(list_objects, work_date_prefix(work_date))
+
+    known = attachments.keys() | thumbnails
+    orphans = sorted(objects.keys() - known)
+    expired = [key for key in orphans if objects[key] <= started - grace]
+    missing_ids = sorted(attachments[key] for key in attachments.keys() - objects.keys())
+    present_ids = sorted(attachments[key] for key in attachments.keys() & objects.keys())
+
+    deleted: list[str] = []
+    if not dry_run:
+        if expired:
+            failed = set(await asyncio.to_thread(delete_objects, expired))
+            deleted = [key for key in expired if key not in failed]
+        # 체크포인트는 지운 뒤 남은 목록 기준 (다음 실행의 _changed_since 비교값)
+        deleted_keys = set(deleted)
+        remaining = {key: modified for key, modified in objects.items() if key not in deleted_keys}
+        changed = await set_attachments_missing(session, missing_ids, present_ids)
+        if changed:
+            await notify_change(session, "attachment", [work_date], changed)
+        await save_reconcile_checkpoint(session, {
+            "work_date": work_date,
+            "object_count": len(remaining),
+            "max_last_modified": _max_last_modified(remaining),
+            "orphan_count": len(orphans),
+            "deleted_count": len(deleted),
+            "missing_count": len(missing_ids),
+        })
+        await session.commit()
+        if changed:
+            # 오늘 스냅샷 등에서 없어진 첨부가 빠지도록 (다시 보이면 다시 포함)
+            await invalidate_work_log_caches([work_date], changed)
+
+    return ReconcileResult(work_date, len(objects), orphans, expired, deleted, missing_ids)
@@ -0,0 +1,39 @@
+'''
+JSON 응답 직렬화 (orjson은 선택 의존성, 없으면 표준 json으로 같은 결과)
+- response_model 라우트: FastAPI가 pydantic으로 바로 bytes 직렬화(dump_json)하고,
+  응답 클래스를 지정하면 그 경로가 꺼지므로 기본 응답 클래스는 건드리지 않음
+- response_model 없이 ORM 객체/dict 목록을 돌려주는 라우트(jobs 목록 등): response_class=ORJSONResponse
+- NDJSON 스트림: dumps()
+'''
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+def _default(obj: Any):
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """dict/list -> JSON bytes (date/datetime은 ISO 문자열, Enum은 값)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
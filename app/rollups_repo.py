@@ -0,0 +1,184 @@
+'''
+work_log_rollups 레포지토리 계층은 집계 테이블만 다룹니다.
+쓰기 경로(work_log upsert, attachment confirm)에서 커밋 전에 refresh_rollups를 불러
+같은 트랜잭션으로 집계를 맞춥니다.
+day 행은 다시 계산하고, week/month 행에는 day 행의 변화량만 더함 (다른 날짜 쓰기끼리는 안 막음).
+전체 합계는 따로 행을 두지 않고 month 행을 합산 (모든 쓰기가 한 행을 잡지 않도록).
+'''
+
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+from sqlalchemy import Date, String, bindparam, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import WorkLogRollup
+
+# 같은 날짜의 집계 갱신끼리만 직렬화: pg_advisory_xact_lock(_ROLLUP_LOCK_KEY, 날짜 번호)
+# (이전 day 값을 읽고 변화량을 계산하는 사이에 같은 날짜의 다른 갱신이 끼지 않도록)
+_ROLLUP_LOCK_KEY = 7_214_001
+
+_COLUMNS = (
+    "work_days", "half_days", "off_days",
+    "sales_count", "sales_amount", "photo_days", "photo_count",
+)
+_INSERT_COLUMNS = ", ".join(("period", "period_start", *_COLUMNS, "updated_at"))
+_ON_CONFLICT = (
+    "ON CONFLICT (period, period_start) DO UPDATE SET "
+    + ", ".join(f"{c} = EXCLUDED.{c}" for c in (*_COLUMNS, "updated_at"))
+)
+_SUM_COLUMNS = ", ".join(f"coalesce(sum({c}), 0)" for c in _COLUMNS)
+
+# work_logs(+첨부 수) -> day 행
+_DAY_SELECT = """
+    SELECT 'day', wl.work_date,
+           count(*) FILTER (WHERE wl.status = '출근'),
+           count(*) FILTER (WHERE wl.status = '반차'),
+           count(*) FILTER (WHERE wl.status = '휴무'),
+           coalesce(sum(wl.sales_count), 0),
+           coalesce(sum(wl.sales_amount), 0),
+           count(*) FILTER (WHERE a.n > 0),
+           coalesce(sum(a.n), 0),
+           now()
+    FROM work_logs wl
+    LEFT JOIN LATERAL (
+        SELECT count(*) AS n FROM attachments WHERE attachments.work_log_id = wl.id
+    ) a ON true
+"""
+
+_LOCK_DAYS = text("""
+    SELECT pg_advisory_xact_lock(:key, d - DATE '1970-01-01')
+    FROM unnest(CAST(:dates AS date[])) AS d
+    ORDER BY d
+""")
+
+# 한 문장으로: 새 day 값(fresh) - 이전 day 값(old) = delta
+# -> day 행 덮어쓰기(work_log가 없어진 날은 삭제) + week/month 행에 delta를 더함
+# (CTE는 모두 문장 시작 시점 스냅샷을 보므로 old는 갱신 전 값)
+_REFRESH = text(f"""
+    WITH fresh_days (period, period_start, {", ".join(_COLUMNS)}, updated_at) AS (
+        {_DAY_SELECT}
+        WHERE wl.work_date = ANY(CAST(:dates AS date[]))
+        GROUP BY wl.work_date
+    ),
+    old_days AS (
+        SELECT * FROM work_log_rollups
+        WHERE period = 'day' AND period_start = ANY(CAST(:dates AS date[]))
+    ),
+    delta AS (
+        SELECT d AS day, {", ".join(f"coalesce(f.{c}, 0) - coalesce(o.{c}, 0) AS {c}" for c in _COLUMNS)}
+        FROM unnest(CAST(:dates AS date[])) AS d
+        LEFT JOIN fresh_days f ON f.period_start = d
+        LEFT JOIN old_days o ON o.period_start = d
+    ),
+    upsert_days AS (
+        INSERT INTO work_log_rollups ({_INSERT_COLUMNS})
+        SELECT * FROM fresh_days
+        {_ON_CONFLICT}
+    ),
+    delete_days AS (
+        DELETE FROM work_log_rollups
+        WHERE period = 'day' AND period_start = ANY(CAST(:dates AS date[]))
+          AND period_start NOT IN (SELECT period_start FROM fresh_days)
+    )
+    INSERT INTO work_log_rollups ({_INSERT_COLUMNS})
+    SELECT p.period, p.period_start, {", ".join(f"sum(delta.{c})" for c in _COLUMNS)}, now()
+    FROM delta
+    CROSS JOIN LATERAL (VALUES
+        (CAST('week' AS varchar), CAST(date_trunc('week', delta.day) AS date)),
+        (CAST('month' AS varchar), CAST(date_trunc('month', delta.day) AS date))
+    ) AS p (period, period_start)
+    GROUP BY p.period, p.period_start
+    ON CONFLICT (period, period_start) DO UPDATE SET
+        {", ".join(f"{c} = work_log_rollups.{c} + EXCLUDED.{c}" for c in _COLUMNS)},
+        updated_at = EXCLUDED.updated_at
+""")
+
+_TOTAL = text(f"""
+    SELECT {", ".join(f"coalesce(sum({c}), 0) AS {c}" for c in _COLUMNS)}
+    FROM work_log_rollups
+    WHERE period = 'month'
+""")
+
+
+def week_start_of(d: date) -> date:
+    return d - timedelta(days=d.weekday())
+
+
+def month_start_of(d: date) -> date:
+    return d.replace(day=1)
+
+
+async def refresh_rollups(session: AsyncSession, dates: Iterable[date]) -> None:
+    # 바뀐 날짜의 day 행 재계산 + week/month 행에 변화량 반영 (커밋은 호출 측에서)
+    days = sorted(set(dates))
+    if not days:
+        return
+
+    # 날짜 순으로 잡아서 여러 날짜를 쓰는 트랜잭션(bulk)끼리 교착되지 않게
+    await session.execute(_LOCK_DAYS, {"key": _ROLLUP_LOCK_KEY, "dates": days})
+    # 락을 잡은 뒤의 새 문장 -> 먼저 커밋된 같은 날짜 쓰기를 보고 계산
+    await session.execute(_REFRESH, {"dates": days})
+
+
+async def rebuild_rollups(session: AsyncSession) -> None:
+    # 전체 재계산 (관리 명령용). 진행 중인 refresh가 끝나길 기다리고, 끝날 때까지 새 refresh를 막음
+    await session.execute(text("LOCK TABLE work_log_rollups IN EXCLUSIVE MODE"))
+    await session.execute(text("DELETE FROM work_log_rollups"))
+    await session.execute(text(f"""
+        INSERT INTO work_log_rollups ({_INSERT_COLUMNS})
+        {_DAY_SELECT}
+        GROUP BY wl.work_date
+    """))
+    for period in ("week", "month"):
+        await session.execute(
+            text(f"""
+                INSERT INTO work_log_rollups ({_INSERT_COLUMNS})
+                SELECT CAST(:period AS varchar), CAST(date_trunc(:period, period_start) AS date), {_SUM_COLUMNS}, now()
+                FROM work_log_rollups
+                WHERE period = 'day'
+                GROUP BY 2
+            """),
+            {"period": period},
+        )
+    await session.commit()
+
+
+_BUCKETS = text(f"""
+    SELECT CAST(date_trunc(:group_by, period_start) AS date) AS bucket_start,
+           {", ".join(f"coalesce(sum({c}), 0) AS {c}" for c in _COLUMNS)}
+    FROM work_log_rollups
+    WHERE period = 'day' AND period_start >= :date_from AND period_start <= :date_to
+    GROUP BY 1
+    ORDER BY 1
+""").bindparams(
+    # 타입을 붙여 둠 -> app.query_plans에서 literal_binds로 렌더링 가능
+    bindparam("group_by", type_=String),
+    bindparam("date_from", type_=Date),
+    bindparam("date_to", type_=Date),
+)
+
+
+def rollup_buckets_statement(group_by: str, date_from: date, date_to: date):
+    return _BUCKETS.bindparams(group_by=group_by, date_from=date_from, date_to=date_to)
+
+
+async def list_rollup_buckets(
+    session: AsyncSession, group_by: str, date_from: date, date_to: date
+) -> list[dict]:
+    # day 행을 group_by(day/week/month) 단위로 한 번에 묶음 (구간 경계도 정확)
+    result = await session.execute(rollup_buckets_statement(group_by, date_from, date_to))
+    return [dict(row) for row in result.mappings()]
+
+
+async def get_rollup(session: AsyncSession, period: str, period_start: date) -> WorkLogRollup | None:
+    return await session.get(WorkLogRollup, (period, period_start))
+
+
+def rollup_total_statement():
+    # 전체 기간 합계 (month 행 합산: 연 12행)
+    return _TOTAL
+
+
+async def get_rollup_total(session: AsyncSession) -> dict:
+    return dict((await session.execute(rollup_total_statement())).mappings().one())
@@ -1,36 +1,236 @@
 # app/s3.py
 import os
+import threading
+import time
 import uuid
-from datetime import date
-import boto3
+from collections import OrderedDict
+from datetime import date, datetime
 
-AWS_REGION = os.getenv("AWS_REGION", "ap-southeast-2")
-AWS_S3_BUCKET = os.getenv("AWS_S3_BUCKET")
+from app.metrics import S3_PRESIGN_LATENCY, observe
+from app.settings import get_settings
+from app.sigv4 import SigV4Presigner
 
-_s3 = boto3.client(
-    "s3",
-    region_name=AWS_REGION,
-    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-)
+# boto3 client는 첫 사용(또는 lifespan 워밍업) 때 생성 -> S3를 안 쓰는 프로세스는 boto3 import 비용 없음
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import boto3
+                from botocore.config import Config
+
+                settings = get_settings()
+                # local 엔진과 같은 URL이 나오도록 SigV4 + virtual-hosted 리전 엔드포인트
+                # (엔드포인트를 따로 지정하면 호스트명에 버킷을 붙일 수 없으니 path-style)
+                addressing_style = "path" if settings.s3_endpoint_url else "virtual"
+                _client = boto3.client(
+                    "s3",
+                    region_name=settings.aws_region,
+                    endpoint_url=settings.s3_endpoint_url,
+                    aws_access_key_id=settings.aws_access_key_id,
+                    aws_secret_access_key=settings.aws_secret_access_key,
+                    aws_session_token=settings.aws_session_token,
+                    config=Config(signature_version="s3v4", s3={"addressing_style": addressing_style}),
+                )
+    return _client
+
+
+_presigner: SigV4Presigner | None = None
+_presigner_lock = threading.Lock()
+
+
+def _get_presigner() -> SigV4Presigner | None:
+    # 로컬 서명기, boto3로 서명해야 하면 None
+    # auto: 키가 env에 있으면 local, 없으면(IAM role/인스턴스 프로필) boto3 자격증명 체인
+    global _presigner
+    settings = get_settings()
+    has_keys = bool(settings.aws_access_key_id and settings.aws_secret_access_key)
+    if settings.s3_presign_engine == "boto3" or (settings.s3_presign_engine == "auto" and not has_keys):
+        return None
+    if _presigner is None:
+        with _presigner_lock:
+            if _presigner is None:
+                if not has_keys:
+                    raise RuntimeError(
+                        "S3_PRESIGN_ENGINE=local은 AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY가 필요합니다 "
+                        "(IAM role 자격증명은 S3_PRESIGN_ENGINE=auto 또는 boto3)."
+                    )
+                _presigner = SigV4Presigner(
+                    bucket=settings.aws_s3_bucket,
+                    region=settings.aws_region,
+                    access_key=settings.aws_access_key_id,
+                    secret_key=settings.aws_secret_access_key,
+                    session_token=settings.aws_session_token,
+                    endpoint_url=settings.s3_endpoint_url,
+                )
+    return _presigner
+
+
+def warm_up() -> None:
+    # lifespan에서 호출: 첫 요청 전에 presign 엔진 준비 (local이면 boto3는 실제로 쓸 때까지 미룸)
+    if _get_presigner() is None:
+        get_s3_client()
+
+
+class _PresignCache:
+    """
+    presigned URL LRU 캐시.
+    URL 수명(expires_in) 중 reuse_fraction만큼 지나면 재서명 -> 클라이언트는 항상
+    남은 수명이 넉넉한 URL을 받음.
+    """
+
+    def __init__(self, maxsize: int, reuse_fraction: float) -> None:
+        self.maxsize = maxsize
+        self.reuse_fraction = reuse_fraction
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> str | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, url: str, expires_in: int) -> None:
+        reuse_until = time.monotonic() + expires_in * self.reuse_fraction
+        with self._lock:
+            self._entries[key] = (url, reuse_until)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        total = self.hits + self.misses
+        return {
+            "size": size,
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+_url_cache: _PresignCache | None = None
+_url_cache_lock = threading.Lock()
+
+
+def _get_url_cache() -> _PresignCache:
+    global _url_cache
+    if _url_cache is None:
+        with _url_cache_lock:
+            if _url_cache is None:
+                settings = get_settings()
+                _url_cache = _PresignCache(
+                    settings.s3_presign_cache_size, settings.s3_presign_cache_reuse_fraction
+                )
+    return _url_cache
+
+
+def presign_cache_stats() -> dict:
+    return _get_url_cache().stats()
+
+# 첨부 원본/썸네일은 모두 work-logs/{YYYY-MM-DD}/ 아래
+WORK_LOGS_PREFIX = "work-logs/"
+# DeleteObjects 한 번에 최대 1000개
+DELETE_BATCH_SIZE = 1000
+
+def work_date_prefix(work_date: date) -> str:
+    return f"{WORK_LOGS_PREFIX}{work_date.isoformat()}/"
 
 def build_file_key(work_date: date, filename: str) -> str:
     # 확장자 보존(없으면 jpg로)
     ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else "jpg"
     uid = uuid.uuid4().hex
-    return f"work-logs/{work_date.isoformat()}/{uid}.{ext}"
+    return f"{work_date_prefix(work_date)}{uid}.{ext}"
+
+def build_thumbnail_key(file_key: str, size: int) -> str:
+    # work-logs/2024-01-01/abc.jpg -> work-logs/2024-01-01/thumbs/abc_w480.webp
+    directory, _, filename = file_key.rpartition("/")
+    stem = filename.rsplit(".", 1)[0]
+    return f"{directory}/thumbs/{stem}_w{size}.webp"
+
+def get_object_bytes(file_key: str) -> bytes:
+    # 동기 호출 -> async 코드에서는 asyncio.to_thread로
+    response = get_s3_client().get_object(Bucket=get_settings().aws_s3_bucket, Key=file_key)
+    return response["Body"].read()
+
+def open_object(file_key: str):
+    # 스트리밍 body (read(n)으로 조금씩, 다 읽으면 close). 없으면 ClientError(NoSuchKey)
+    response = get_s3_client().get_object(Bucket=get_settings().aws_s3_bucket, Key=file_key)
+    return response["Body"]
+
+def put_object_bytes(file_key: str, body: bytes, content_type: str, cache_control: str | None = None) -> None:
+    extra = {"CacheControl": cache_control} if cache_control else {}
+    get_s3_client().put_object(
+        Bucket=get_settings().aws_s3_bucket,
+        Key=file_key,
+        Body=body,
+        ContentType=content_type,
+        **extra,
+    )
+
+def list_date_prefixes() -> list[str]:
+    # work-logs/ 바로 아래 날짜 prefix 목록 (Delimiter로 객체는 안 읽음)
+    paginator = get_s3_client().get_paginator("list_objects_v2")
+    prefixes = []
+    for page in paginator.paginate(
+        Bucket=get_settings().aws_s3_bucket, Prefix=WORK_LOGS_PREFIX, Delimiter="/"
+    ):
+        prefixes += [p["Prefix"] for p in page.get("CommonPrefixes", [])]
+    return prefixes
+
+def list_objects(prefix: str) -> dict[str, datetime]:
+    # prefix 아래 전체 객체 key -> LastModified (1000개씩 페이지)
+    paginator = get_s3_client().get_paginator("list_objects_v2")
+    objects: dict[str, datetime] = {}
+    for page in paginator.paginate(Bucket=get_settings().aws_s3_bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            objects[obj["Key"]] = obj["LastModified"]
+    return objects
+
+def delete_objects(keys: list[str]) -> list[str]:
+    # 배치 삭제, 실패한 key 목록 반환
+    failed: list[str] = []
+    for start in range(0, len(keys), DELETE_BATCH_SIZE):
+        batch = keys[start:start + DELETE_BATCH_SIZE]
+        response = get_s3_client().delete_objects(
+            Bucket=get_settings().aws_s3_bucket,
+            Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+        )
+        failed += [error["Key"] for error in response.get("Errors", [])]
+    return failed
 
 def create_presigned_put_url(file_key: str, content_type: str, expires_in: int = 60) -> str:
     # 업로드(PUT)용 presigned url 생성
-    return _s3.generate_presigned_url(
-        ClientMethod="put_object",
-        Params={
-            "Bucket": AWS_S3_BUCKET,
-            "Key": file_key,
-            "ContentType": content_type,
-        },
-        ExpiresIn=expires_in,
-    )
+    with observe(S3_PRESIGN_LATENCY, "put_object"):
+        presigner = _get_presigner()
+        if presigner is not None:
+            # content-type은 서명 헤더 -> 업로드 때 같은 Content-Type으로 보내야 함
+            return presigner.presign("PUT", file_key, expires_in, headers={"Content-Type": content_type})
+        return get_s3_client().generate_presigned_url(
+            ClientMethod="put_object",
+            Params={
+                "Bucket": get_settings().aws_s3_bucket,
+                "Key": file_key,
+                "ContentType": content_type,
+            },
+            ExpiresIn=expires_in,
+        )
 
 def create_presigned_get_url(
     file_key: str,
@@ -40,7 +240,7 @@ def create_presigned_get_url(
     download_filename: str | None = None,
 ) -> str:
     params: dict = {
-        "Bucket": AWS_S3_BUCKET,
+        "Bucket": get_settings().aws_s3_bucket,
         "Key": file_key,
     }
 
@@ -53,8 +253,31 @@ def create_presigned_get_url(
         filename = download_filename or os.path.basename(file_key)
         params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
 
-    return _s3.generate_presigned_url(
-        ClientMethod="get_object",
-        Params=params,
-        ExpiresIn=expires_in,
-    )
\ No newline at end of file
+    # 같은 파일/옵션이면 재서명 대신 캐시된 URL 재사용 (대시보드 폴링 대응)
+    cache_key = (
+        file_key,
+        expires_in,
+        params.get("ResponseContentType"),
+        params.get("ResponseContentDisposition"),
+    )
+    url = _get_url_cache().get(cache_key)
+    if url is not None:
+        return url
+
+    with observe(S3_PRESIGN_LATENCY, "get_object"):
+        presigner = _get_presigner()
+        if presigner is not None:
+            query = {}
+            if "ResponseContentType" in params:
+                query["response-content-type"] = params["ResponseContentType"]
+            if "ResponseContentDisposition" in params:
+                query["response-content-disposition"] = params["ResponseContentDisposition"]
+            url = presigner.presign("GET", file_key, expires_in, query=query)
+        else:
+            url = get_s3_client().generate_presigned_url(
+                ClientMethod="get_object",
+                Params=params,
+                ExpiresIn=expires_in,
+            )
+    _get_url_cache().put(cache_key, url, expires_in)
+    return url
\ No newline at end of file
@@ -0,0 +1,144 @@
+'''
+S3 presigned URL용 SigV4 query-string 서명 (boto3 없이 로컬 계산)
+boto3 client(signature_version="s3v4", addressing_style="virtual")의 generate_presigned_url과
+같은 URL을 만듦 -> 검증은 python -m bench.presign
+'''
+
+import hashlib
+import hmac
+import threading
+from datetime import datetime, timezone
+from urllib.parse import quote, urlsplit
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+SERVICE = "s3"
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+
+
+def _quote_query(value: str) -> str:
+    return quote(value, safe="-_.~")
+
+
+def _hmac(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode(), hashlib.sha256).digest()
+
+
+def _is_dns_compatible(bucket: str) -> bool:
+    # 점이 있는 버킷은 virtual-hosted TLS 인증서와 안 맞아서 path-style로 (boto3와 동일)
+    return (
+        3 <= len(bucket) <= 63
+        and "." not in bucket
+        and bucket == bucket.lower()
+        and bucket[0].isalnum()
+        and bucket[-1].isalnum()
+    )
+
+
+class SigV4Presigner:
+    """
+    버킷/리전/자격증명이 고정된 presigner. 서명 키는 (날짜, 리전)별로 한 번만 유도.
+    스레드 안전 (공유 상태는 서명 키 캐시뿐).
+    endpoint_url(MinIO/로컬 스텁 등)을 주면 그 호스트로 path-style (boto3 path addressing과 동일).
+    session_token: STS 임시 자격증명이면 X-Amz-Security-Token으로 서명에 포함.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        region: str,
+        access_key: str,
+        secret_key: str,
+        session_token: str | None = None,
+        endpoint_url: str | None = None,
+    ) -> None:
+        self.bucket = bucket
+        self.region = region
+        self.access_key = access_key
+        self.session_token = session_token
+        self._secret = ("AWS4" + secret_key).encode()
+        self._keys: dict[tuple[str, str], bytes] = {}
+        self._lock = threading.Lock()
+
+        if endpoint_url:
+            parts = urlsplit(endpoint_url)
+            self.scheme = parts.scheme or "https"
+            self.host = parts.netloc
+            self._path_prefix = parts.path.rstrip("/") + "/" + quote(bucket, safe="")
+            return
+        self.scheme = "https"
+        endpoint = "s3.amazonaws.com" if region == "us-east-1" else f"s3.{region}.amazonaws.com"
+        if _is_dns_compatible(bucket):
+            self.host = f"{bucket}.{endpoint}"
+            self._path_prefix = ""
+        else:
+            self.host = endpoint
+            self._path_prefix = "/" + quote(bucket, safe="")
+
+    def _signing_key(self, datestamp: str) -> bytes:
+        cache_key = (datestamp, self.region)
+        key = self._keys.get(cache_key)
+        if key is None:
+            key = _hmac(_hmac(_hmac(_hmac(self._secret, datestamp), self.region), SERVICE), "aws4_request")
+            with self._lock:
+                # 날짜가 바뀌면 이전 키는 필요 없음
+                self._keys = {cache_key: key}
+        return key
+
+    def presign(
+        self,
+        method: str,
+        key: str,
+        expires_in: int,
+        query: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        now: datetime | None = None,
+    ) -> str:
+        """
+        query: 서명에 포함할 operation 파라미터 (예: response-content-type), 순서 유지
+        headers: 클라이언트가 그대로 보내야 하는 서명 헤더 (예: PUT의 content-type)
+        """
+        now = now or datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        datestamp = amz_date[:8]
+        scope = f"{datestamp}/{self.region}/{SERVICE}/aws4_request"
+
+        signed = {"host": self.host}
+        for name, value in (headers or {}).items():
+            signed[name.lower()] = " ".join(str(value).split())
+        signed_names = sorted(signed)
+        signed_headers = ";".join(signed_names)
+
+        # URL 쿼리 순서: operation 파라미터 -> 인증 파라미터 -> 서명 (boto3와 동일)
+        params = list((query or {}).items())
+        params += [
+            ("X-Amz-Algorithm", ALGORITHM),
+            ("X-Amz-Credential", f"{self.access_key}/{scope}"),
+            ("X-Amz-Date", amz_date),
+            ("X-Amz-Expires", str(expires_in)),
+            ("X-Amz-SignedHeaders", signed_headers),
+        ]
+        if self.session_token:
+            params.append(("X-Amz-Security-Token", self.session_token))
+        encoded = [(_quote_query(k), _quote_query(v)) for k, v in params]
+        query_string = "&".join(f"{k}={v}" for k, v in encoded)
+
+        path = self._path_prefix + "/" + quote(key, safe="/~")
+        canonical_request = "\n".join((
+            method,
+            path,
+            "&".join(f"{k}={v}" for k, v in sorted(encoded)),
+            "".join(f"{name}:{signed[name]}\n" for name in signed_names),
+            signed_headers,
+            UNSIGNED_PAYLOAD,
+        ))
+        string_to_sign = "\n".join((
+            ALGORITHM,
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ))
+        signature = hmac.new(
+            self._signing_key(datestamp), string_to_sign.encode(), hashlib.sha256
+        ).hexdigest()
+
+        return f"{self.scheme}://{self.host}{path}?{query_string}&X-Amz-Signature={signature}"
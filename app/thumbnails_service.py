@@ -0,0 +1,144 @@
+'''
+첨부 썸네일 파이프라인 (confirm 후 백그라운드)
+S3 원본 다운로드 -> Pillow로 WebP 리사이즈(크기별) -> thumbs/ 아래 업로드 -> attachment_thumbnails 기록
+Pillow는 선택 의존성: 없으면 워커가 꺼지고 목록 API는 원본 URL을 그대로 씀.
+대기열은 프로세스 메모리라 재시작 때 남은 작업은 python -m app.manage generate-thumbnails로 채움.
+'''
+
+import asyncio
+import importlib.util
+import io
+import logging
+from datetime import date
+from typing import NamedTuple
+
+from app.attachments_repo import insert_thumbnails
+from app.db import async_session
+from app.events import notify_change
+from app.s3 import build_thumbnail_key, get_object_bytes, put_object_bytes
+from app.settings import get_settings
+from app.works_service import invalidate_work_log_caches
+
+logger = logging.getLogger(__name__)
+
+WEBP_QUALITY = 80
+# 키에 크기가 들어가고 내용이 바뀌지 않으므로 오래 캐시
+THUMBNAIL_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ThumbnailJob(NamedTuple):
+    attachment_id: int
+    work_log_id: int
+    work_date: date
+    file_key: str
+
+
+def pillow_available() -> bool:
+    return importlib.util.find_spec("PIL") is not None
+
+
+def render_thumbnails(original: bytes, sizes: tuple[int, ...]) -> list[tuple[int, bytes, int, int]]:
+    """원본 이미지 -> [(size, webp bytes, width, height)] (CPU 작업, 스레드에서 호출)"""
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(original)) as source:
+        # 휴대폰 사진의 EXIF 회전 반영
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        if image is source:
+            image = source.copy()
+
+        results = []
+        # 큰 것부터 만들고 작은 것은 그걸 다시 줄여서 리샘플링 비용을 줄임
+        for size in sorted(sizes, reverse=True):
+            image.thumbnail((size, size), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+            results.append((size, buffer.getvalue(), image.width, image.height))
+        return results
+
+
+async def generate_thumbnails(job: ThumbnailJob) -> int:
+    """한 첨부의 썸네일을 만들고 기록. 새로 기록된 개수 반환."""
+    sizes = get_settings().thumbnail_sizes
+    original = await asyncio.to_thread(get_object_bytes, job.file_key)
+    rendered = await asyncio.to_thread(render_thumbnails, original, sizes)
+
+    rows = []
+    for size, body, width, height in rendered:
+        file_key = build_thumbnail_key(job.file_key, size)
+        await asyncio.to_thread(put_object_bytes, file_key, body, "image/webp", THUMBNAIL_CACHE_CONTROL)
+        rows.append({
+            "attachment_id": job.attachment_id,
+            "size": size,
+            "file_key": file_key,
+            "width": width,
+            "height": height,
+            "byte_size": len(body),
+        })
+
+    async with async_session() as session:
+        inserted = await insert_thumbnails(session, rows)
+        if inserted:
+            # 다른 프로세스의 today 캐시도 무효화되도록 알림
+            await notify_change(session, "thumbnail", [job.work_date], [job.work_log_id])
+        await session.commit()
+    if inserted:
+        await invalidate_work_log_caches([job.work_date], [job.work_log_id])
+    return inserted
+
+
+class ThumbnailWorker:
+    """프로세스당 하나. lifespan에서 start/stop, confirm 후 enqueue."""
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[ThumbnailJob] | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        if not pillow_available():
+            logger.warning("Pillow not installed: thumbnail worker disabled")
+            return
+        settings = get_settings()
+        self._queue = asyncio.Queue(maxsize=settings.thumbnail_queue_size)
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._run()) for _ in range(settings.thumbnail_workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def enqueue(self, job: ThumbnailJob) -> bool:
+        # 요청 경로를 막지 않음: 꺼져 있거나 꽉 차면 버리고 백필 명령에 맡김
+        if self._queue is None:
+            return False
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            logger.warning("thumbnail queue full, dropped attachment %s", job.attachment_id)
+            return False
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await generate_thumbnails(job)
+            except Exception:
+                # 깨진 이미지/S3 오류는 재시도하지 않음 (백필 명령으로 다시 시도 가능)
+                logger.exception("thumbnail failed for attachment %s (%s)", job.attachment_id, job.file_key)
+            finally:
+                self._queue.task_done()
+
+
+thumbnail_worker = ThumbnailWorker()
@@ -1,12 +1,22 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
+from pydantic import BaseModel
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db import get_session
 from app.models import User
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-@router.get("/")
-def read_users(session: Session = Depends(get_session)):
-    users = session.exec(select(User)).all()
-    return users
\ No newline at end of file
+class UserItem(BaseModel):
+    id: int
+    email: str
+    created_at: datetime | None
+
+@router.get("/", response_model=list[UserItem])
+async def read_users(session: AsyncSession = Depends(get_session)):
+    # ORM 객체 대신 컬럼 Row로 읽어서 그대로 직렬화
+    users = (await session.execute(select(User.id, User.email, User.created_at))).all()
+    return users
@@ -4,44 +4,257 @@ work_logs 레포지토리 계층은 DB만 다룹니다.
 HTTP를 모르며, 비즈니스 규칙도 모릅니다. 가져와라/저장해라만 합니다.
 '''
 
+from collections.abc import AsyncIterator
 from datetime import date
-from sqlalchemy import func
-from sqlmodel import Session, select
+from sqlalchemy import Row, func, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models import WorkLog, WorkStatus
+from app.models import Attachment, WorkLog, WorkStatus
+from app.events import notify_change
+from app.rollups_repo import refresh_rollups
 
 
-def get_work_log_by_id(session: Session, log_id: int) -> WorkLog | None:
-    return session.get(WorkLog, log_id)
+async def get_work_log_by_id(session: AsyncSession, log_id: int) -> WorkLog | None:
+    return await session.get(WorkLog, log_id)
 
 
-def get_work_log_by_date(session: Session, work_date: date) -> WorkLog | None:
-    statement = select(WorkLog).where(WorkLog.work_date == work_date)
-    return session.exec(statement).first()
+# *_statement: 실행하는 함수와 app.query_plans(EXPLAIN 점검)가 같은 문장을 쓰도록 분리
 
+def work_log_by_date_statement(work_date: date):
+    return select(WorkLog).where(WorkLog.work_date == work_date)
 
-def save_work_log(session: Session, log: WorkLog) -> WorkLog:
+
+async def get_work_log_by_date(session: AsyncSession, work_date: date) -> WorkLog | None:
+    return (await session.exec(work_log_by_date_statement(work_date))).first()
+
+
+def _work_log_with_attachments():
+    # work_log + 첨부를 LEFT JOIN 한 번으로 (S3에 없다고 확인된 첨부는 URL을 줄 수 없으니 제외)
+    return (
+        select(WorkLog, Attachment)
+        .outerjoin(Attachment, (Attachment.work_log_id == WorkLog.id) & Attachment.missing_at.is_(None))
+        .order_by(Attachment.created_at.asc(), Attachment.id.asc())
+    )
+
+
+def work_log_with_attachments_statement(work_date: date):
+    return _work_log_with_attachments().where(WorkLog.work_date == work_date)
+
+
+def work_log_detail_statement(log_id: int):
+    return _work_log_with_attachments().where(WorkLog.id == log_id)
+
+
+def _split_work_log_rows(rows) -> tuple[WorkLog | None, list[Attachment]]:
+    if not rows:
+        return None, []
+    return rows[0][0], [a for _, a in rows if a is not None]
+
+
+async def get_work_log_with_attachments_by_date(
+    session: AsyncSession, work_date: date
+) -> tuple[WorkLog | None, list[Attachment]]:
+    return _split_work_log_rows((await session.exec(work_log_with_attachments_statement(work_date))).all())
+
+
+async def get_work_log_with_attachments(
+    session: AsyncSession, log_id: int
+) -> tuple[WorkLog | None, list[Attachment]]:
+    return _split_work_log_rows((await session.exec(work_log_detail_statement(log_id))).all())
+
+
+async def save_work_log(session: AsyncSession, log: WorkLog) -> WorkLog:
     session.add(log)
-    session.commit()
-    session.refresh(log)
+    await session.flush()
+    await refresh_rollups(session, [log.work_date])
+    await notify_change(session, "work_log", [log.work_date], [log.id])
+    await session.commit()
+    await session.refresh(log)
+    return log
+
+
+async def upsert_work_log(session: AsyncSession, values: dict) -> WorkLog:
+    # INSERT ... ON CONFLICT (work_date) DO UPDATE ... RETURNING 한 번으로 끝냄
+    # created_at/updated_at은 안 보내서 server_default가 적용됨
+    statement = pg_insert(WorkLog).values(**values)
+    statement = statement.on_conflict_do_update(
+        index_elements=["work_date"],
+        set_={
+            **{key: statement.excluded[key] for key in values if key != "work_date"},
+            "updated_at": func.now(),
+        },
+    ).returning(WorkLog)
+    result = await session.scalars(statement, execution_options={"populate_existing": True})
+    log = result.one()
+    await refresh_rollups(session, [log.work_date])
+    await notify_change(session, "work_log", [log.work_date], [log.id])
+    await session.commit()
+    return log
+
+
+async def update_work_log(session: AsyncSession, log_id: int, values: dict) -> WorkLog | None:
+    # UPDATE ... RETURNING 한 번 (조회 후 수정 대신)
+    statement = (
+        update(WorkLog)
+        .where(WorkLog.id == log_id)
+        .values(**values, updated_at=func.now())
+        .returning(WorkLog)
+    )
+    result = await session.scalars(statement, execution_options={"populate_existing": True})
+    log = result.one_or_none()
+    if log:
+        await refresh_rollups(session, [log.work_date])
+        await notify_change(session, "work_log", [log.work_date], [log.id])
+    await session.commit()
     return log
 
 
-def list_work_logs(session: Session) -> list[WorkLog]:
-    statement = select(WorkLog).order_by(WorkLog.work_date.desc())
-    return session.exec(statement).all()
+async def upsert_work_logs(session: AsyncSession, rows: list[dict]) -> list[int]:
+    # 여러 행을 multi-row INSERT ... ON CONFLICT 한 문장으로 (같은 work_date 중복은 호출 측에서 제거)
+    if not rows:
+        return []
+    statement = pg_insert(WorkLog).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=["work_date"],
+        set_={
+            "status": statement.excluded.status,
+            "sales_count": statement.excluded.sales_count,
+            "sales_amount": statement.excluded.sales_amount,
+            "note": statement.excluded.note,
+            "updated_at": func.now(),
+        },
+    ).returning(WorkLog.id)
+    ids = list((await session.scalars(statement)).all())
+    await refresh_rollups(session, [row["work_date"] for row in rows])
+    await notify_change(session, "work_log", [row["work_date"] for row in rows], ids)
+    await session.commit()
+    return ids
 
 
-def list_work_logs_by_status(session: Session, status: WorkStatus) -> list[WorkLog]:
+async def insert_work_log_if_absent(session: AsyncSession, values: dict) -> WorkLog | None:
+    # 이미 있으면(동시 요청이 먼저 넣은 경우 포함) 아무것도 안 하고 None
     statement = (
-        select(WorkLog)
-        .where(WorkLog.status == status)
-        .order_by(WorkLog.work_date.asc())
+        pg_insert(WorkLog)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=["work_date"])
+        .returning(WorkLog)
     )
-    return session.exec(statement).all()
+    log = (await session.scalars(statement)).first()
+    if log:
+        await refresh_rollups(session, [log.work_date])
+        await notify_change(session, "work_log", [log.work_date], [log.id])
+    await session.commit()
+    return log
+
+
+# 목록 API용 컬럼: ORM 객체를 만들지 않고 Row 튜플로 읽음 (응답 모델이 속성으로 바로 읽음)
+WORK_LOG_COLUMNS = (
+    WorkLog.id,
+    WorkLog.work_date,
+    WorkLog.status,
+    WorkLog.sales_count,
+    WorkLog.sales_amount,
+    WorkLog.note,
+    WorkLog.created_at,
+    WorkLog.updated_at,
+)
+
+
+# keyset 페이지네이션: (work_date, id) 튜플 비교로 이어서 읽음 (OFFSET 없음)
+def work_logs_statement(
+    status: WorkStatus | None = None,
+    after: tuple[date, int] | None = None,
+):
+    statement = select(*WORK_LOG_COLUMNS)
+    if status is None:
+        # 전체 목록은 최신순
+        statement = statement.order_by(WorkLog.work_date.desc(), WorkLog.id.desc())
+        if after:
+            statement = statement.where(tuple_(WorkLog.work_date, WorkLog.id) < tuple_(*after))
+    else:
+        # status 목록은 오래된 순
+        statement = statement.where(WorkLog.status == status).order_by(
+            WorkLog.work_date.asc(), WorkLog.id.asc()
+        )
+        if after:
+            statement = statement.where(tuple_(WorkLog.work_date, WorkLog.id) > tuple_(*after))
+    return statement
+
+
+async def list_work_logs(
+    session: AsyncSession,
+    limit: int | None = None,
+    after: tuple[date, int] | None = None,
+) -> list[Row]:
+    statement = work_logs_statement(after=after)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return (await session.exec(statement)).all()
+
+
+async def list_work_logs_by_status(
+    session: AsyncSession,
+    status: WorkStatus,
+    limit: int | None = None,
+    after: tuple[date, int] | None = None,
+) -> list[Row]:
+    statement = work_logs_statement(status=status, after=after)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return (await session.exec(statement)).all()
+
+
+async def iter_work_logs(
+    session: AsyncSession,
+    status: WorkStatus | None = None,
+    after: tuple[date, int] | None = None,
+    batch_size: int = 500,
+) -> AsyncIterator[Row]:
+    # yield_per -> 서버사이드 커서로 batch_size씩만 가져옴 (메모리 일정)
+    statement = work_logs_statement(status=status, after=after).execution_options(
+        yield_per=batch_size
+    )
+    async for row in await session.stream(statement):
+        yield row
+
+
+# 내보내기용 컬럼: work_log 한 행에 첨부 수만큼 행이 생김 (첨부가 없으면 첨부 컬럼은 NULL)
+EXPORT_COLUMNS = (
+    WorkLog.work_date,
+    WorkLog.id.label("work_log_id"),
+    WorkLog.status,
+    WorkLog.sales_count,
+    WorkLog.sales_amount,
+    WorkLog.note,
+    WorkLog.created_at,
+    WorkLog.updated_at,
+    Attachment.id.label("attachment_id"),
+    Attachment.file_key,
+    Attachment.original_filename,
+    Attachment.created_at.label("attachment_created_at"),
+)
+
+
+def export_statement(date_from: date, date_to: date):
+    return (
+        select(*EXPORT_COLUMNS)
+        .outerjoin(Attachment, Attachment.work_log_id == WorkLog.id)
+        .where(WorkLog.work_date >= date_from, WorkLog.work_date <= date_to)
+        .order_by(WorkLog.work_date, WorkLog.id, Attachment.id)
+    )
+
 
+async def iter_export_partitions(
+    session: AsyncSession,
+    date_from: date,
+    date_to: date,
+    batch_size: int = 1000,
+) -> AsyncIterator[list[Row]]:
+    # 서버사이드 커서로 batch_size행씩 (기간이 길어도 API 프로세스 메모리는 일정)
+    statement = export_statement(date_from, date_to).execution_options(yield_per=batch_size)
+    result = await session.stream(statement)
+    async for partition in result.partitions():
+        yield partition
 
-def sum_sales_amount(session: Session) -> int:
-    statement = select(func.coalesce(func.sum(WorkLog.sales_amount), 0))
-    result = session.exec(statement).scalar_one_or_none()
-    return int(result or 0)
@@ -4,26 +4,71 @@ work_logs 관련 HTTP 엔드포인트 정의
 Request -> Service 호출 -> Response 반환만 함
 '''
 
-from datetime import date, timedelta
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-
-from sqlalchemy import func
-from sqlmodel import Session, select
-from app.db import get_session
-from app.models import Attachment, WorkLog, WorkStatus
+import asyncio
+import csv
+import hashlib
+import json
+import time
+from collections import deque
+from datetime import date, datetime
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db import async_session, get_session
+from app.events import change_listener
+from app.export_service import (
+    export_csv,
+    export_parquet,
+    gzip_chunks,
+    pyarrow_available,
+    validate_export_range,
+)
+from app.models import WorkStatus
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, decode_cursor
+from app.responses import dumps
 from app.s3 import create_presigned_get_url
+from app.settings import get_settings
 from app.works_service import (
+    bulk_upsert_work_logs,
     create_or_update_work_log,
-    ensure_today_work_log,
     get_all_work_logs,
+    get_analytics,
     get_work_logs_by_status,
+    get_today_snapshot,
     get_total_sales_amount,
-    get_work_log,
+    get_week_summary,
+    get_work_log_detail,
+    stream_work_logs,
+    today_etag_parts,
+    update_today_sales,
+    work_log_etag_parts,
 )
 
 router = APIRouter(prefix="/work-logs", tags=["work_logs"])
 
+VIEW_URL_EXPIRES_IN = 600
+# view_url이 들어간 응답은 URL이 만료되기 전에 ETag가 바뀌어야 함
+VIEW_URL_ETAG_WINDOW = VIEW_URL_EXPIRES_IN // 2
+
+
+def _etag(*parts) -> str:
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    # If-None-Match가 맞으면 본문 만들기 전에 304
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    candidates = {c.strip().removeprefix("W/") for c in header.split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
 
 class WorkLogUpsertRequest(BaseModel):
     work_date: date
@@ -33,128 +78,229 @@ class WorkLogUpsertRequest(BaseModel):
     note: str | None = None
 
 
-@router.get("/")
-def read_work_logs(session: Session = Depends(get_session)):
-    return get_all_work_logs(session)
+# 목록/단건 응답: ORM 객체나 select(컬럼) Row 튜플에서 속성으로 바로 읽음
+class WorkLogItem(BaseModel):
+    id: int
+    work_date: date
+    status: WorkStatus
+    sales_count: int
+    sales_amount: int
+    note: str | None
+    created_at: datetime | None
+    updated_at: datetime | None
 
-@router.get("/today")
-def get_today(session: Session = Depends(get_session)):
-    wl = ensure_today_work_log(session)
 
-    att_stmt = (
-        select(Attachment)
-        .where(Attachment.work_log_id == wl.id)
-        .order_by(Attachment.created_at.asc())
-    )
-    atts = session.exec(att_stmt).all()
+async def _stream_ndjson(status: WorkStatus | None, cursor: str | None):
+    # 응답이 끝날 때까지 커서를 잡고 있어야 해서 요청 세션 대신 별도 세션 사용
+    async with async_session() as session:
+        async for row in stream_work_logs(session, status=status, cursor=cursor):
+            yield dumps(row._asdict()) + b"\n"
 
-    return {
-        "id": wl.id,
-        "work_date": str(wl.work_date),
-        "status": getattr(wl.status, "value", wl.status),
-        "sales_count": wl.sales_count,
-        "sales_amount": wl.sales_amount,
-        "note": wl.note,
-        "created_at": wl.created_at.isoformat() if wl.created_at else "",
-        "updated_at": wl.updated_at.isoformat() if wl.updated_at else "",
-        "attachments": [
-            {
-                "id": a.id,
-                "file_key": a.file_key,
-                "original_filename": a.original_filename,
-                "created_at": a.created_at.isoformat() if a.created_at else "",
-            }
-            for a in atts
-        ],
-    }
+
+async def _read_page(
+    response: Response,
+    status: WorkStatus | None,
+    limit: int,
+    cursor: str | None,
+    stream: bool,
+    session: AsyncSession,
+):
+    try:
+        if stream:
+            # 잘못된 cursor는 스트림 시작 전에 400으로
+            if cursor:
+                decode_cursor(cursor)
+            return StreamingResponse(
+                _stream_ndjson(status, cursor), media_type="application/x-ndjson"
+            )
+        if status is None:
+            logs, next_cursor = await get_all_work_logs(session, limit=limit, cursor=cursor)
+        else:
+            logs, next_cursor = await get_work_logs_by_status(session, status, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 다음 페이지 cursor는 헤더로 (body는 기존처럼 리스트 유지)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return logs
+
+
+@router.get("/", response_model=list[WorkLogItem])
+async def read_work_logs(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    stream: bool = False,
+    session: AsyncSession = Depends(get_session),
+):
+    return await _read_page(response, None, limit, cursor, stream, session)
+
+
+class TodayAttachmentItem(BaseModel):
+    id: int
+    file_key: str
+    original_filename: str
+    created_at: str
+    thumbnails: dict[str, str]  # 크기(px) -> 썸네일 file_key
+
+
+# 캐시된 스냅샷(dict)을 그대로 검증 -> 날짜/시각은 스냅샷처럼 문자열
+class TodayResponse(BaseModel):
+    id: int
+    work_date: str
+    status: WorkStatus
+    sales_count: int
+    sales_amount: int
+    note: str | None
+    created_at: str
+    updated_at: str
+    attachments: list[TodayAttachmentItem]
+
+
+@router.get("/today", response_model=TodayResponse)
+async def get_today(request: Request, response: Response, session: AsyncSession = Depends(get_session)):
+    # work_log + 첨부 JOIN 한 번 (짧은 캐시 앞단)
+    today = await get_today_snapshot(session)
+
+    etag = _etag("today", today["id"], *today_etag_parts(today))
+    if not_modified := _not_modified(request, etag):
+        return not_modified
+    response.headers["ETag"] = etag
+    return today
 
 class TodaySalesPatchRequest(BaseModel):
     sales_count: int | None = None
     sales_amount: int | None = None
 
-@router.patch("/today/sales")
-def patch_today_sales(payload: TodaySalesPatchRequest, session: Session = Depends(get_session)):
-    wl = ensure_today_work_log(session)
+class TodaySalesResponse(BaseModel):
+    id: int
+    work_date: date
+    status: WorkStatus
+    sales_count: int
+    sales_amount: int
+    note: str | None
 
-    status_value = getattr(wl.status, "value", wl.status)
-    if status_value == "휴무":
-        raise HTTPException(status_code=400, detail="휴무 상태에서는 판매 입력이 불가합니다. 출근으로 변경 후 입력하세요.")
+@router.patch("/today/sales", response_model=TodaySalesResponse)
+async def patch_today_sales(payload: TodaySalesPatchRequest, session: AsyncSession = Depends(get_session)):
+    # 휴무 여부/음수 검증과 집계 갱신은 서비스에서
+    try:
+        wl = await update_today_sales(
+            session,
+            sales_count=payload.sales_count,
+            sales_amount=payload.sales_amount,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    if payload.sales_count is None and payload.sales_amount is None:
-        raise HTTPException(status_code=400, detail="sales_count 또는 sales_amount 중 하나는 필요합니다.")
+    return wl
 
-    if payload.sales_count is not None and payload.sales_count < 0:
-        raise HTTPException(status_code=400, detail="sales_count는 음수일 수 없습니다.")
-    if payload.sales_amount is not None and payload.sales_amount < 0:
-        raise HTTPException(status_code=400, detail="sales_amount는 음수일 수 없습니다.")
+def _thumbnail_size(size: int | None) -> int:
+    # 기본은 설정의 첫 번째 크기, 그 외에는 설정된 크기만 허용
+    sizes = get_settings().thumbnail_sizes
+    if size is None:
+        return sizes[0]
+    if size not in sizes:
+        raise HTTPException(status_code=400, detail=f"thumbnail_size는 {list(sizes)} 중 하나여야 합니다.")
+    return size
 
-    if payload.sales_count is not None:
-        wl.sales_count = payload.sales_count
-    if payload.sales_amount is not None:
-        wl.sales_amount = payload.sales_amount
 
-    # updated_at은 server_default만 있으면 자동 갱신 안 될 수 있어서
-    # DB 트리거/DEFAULT 설정이 없다면 서비스에서 직접 찍어도 됨(선택)
-    # wl.updated_at = datetime.utcnow()
+def _thumbnail_url(attachment: dict, size: int, original_url: str, expires_in: int) -> str:
+    # 썸네일이 아직 없으면(생성 전/Pillow 없음) 원본 URL
+    key = attachment["thumbnails"].get(str(size))
+    if key is None:
+        return original_url
+    return create_presigned_get_url(file_key=key, expires_in=expires_in)
 
-    session.add(wl)
-    session.commit()
-    session.refresh(wl)
 
-    return {
-        "id": wl.id,
-        "work_date": str(wl.work_date),
-        "status": getattr(wl.status, "value", wl.status),
-        "sales_count": wl.sales_count,
-        "sales_amount": wl.sales_amount,
-        "note": wl.note,
-    }
+class TodayDetailWorkLog(BaseModel):
+    id: int
+    status: WorkStatus
+    sales_count: int
+    sales_amount: int
+    note: str | None
 
-@router.get("/today/detail")
-def get_today_detail(session: Session = Depends(get_session)):
-    wl = ensure_today_work_log(session)
 
-    att_stmt = (
-        select(Attachment)
-        .where(Attachment.work_log_id == wl.id)
-        .order_by(Attachment.created_at.asc())
+class TodayDetailAttachment(BaseModel):
+    id: int
+    file_key: str
+    original_filename: str
+    view_url: str
+    thumbnail_url: str
+
+
+class TodayDetailResponse(BaseModel):
+    date: str
+    work_log: TodayDetailWorkLog
+    attachments: list[TodayDetailAttachment]
+
+
+@router.get("/today/detail", response_model=TodayDetailResponse)
+async def get_today_detail(
+    request: Request,
+    response: Response,
+    thumbnail_size: int | None = None,
+    session: AsyncSession = Depends(get_session),
+):
+    size = _thumbnail_size(thumbnail_size)
+    today = await get_today_snapshot(session)
+
+    # URL 서명 전에 판단
+    etag = _etag(
+        "today-detail",
+        today["id"],
+        size,
+        *today_etag_parts(today),
+        int(time.time() // VIEW_URL_ETAG_WINDOW),
     )
-    atts = session.exec(att_stmt).all()
+    if not_modified := _not_modified(request, etag):
+        return not_modified
+    response.headers["ETag"] = etag
 
     return {
-        "date": str(wl.work_date),
+        "date": today["work_date"],
         "work_log": {
-            "id": wl.id,
-            "status": getattr(wl.status, "value", wl.status),
-            "sales_count": wl.sales_count,
-            "sales_amount": wl.sales_amount,
-            "note": wl.note,
+            "id": today["id"],
+            "status": today["status"],
+            "sales_count": today["sales_count"],
+            "sales_amount": today["sales_amount"],
+            "note": today["note"],
         },
-        "attachments": [
-            {
-                "id": a.id,
-                "file_key": a.file_key,
-                "original_filename": a.original_filename,
-                "view_url": create_presigned_get_url(
-                    file_key=a.file_key,
-                    expires_in=600,
-                    response_content_type=None,
-                    as_attachment=False,
-                ),
-            }
-            for a in atts
-        ],
+        "attachments": [_today_detail_attachment(a, size) for a in today["attachments"]],
+    }
+
+
+def _today_detail_attachment(a: dict, size: int) -> dict:
+    view_url = create_presigned_get_url(
+        file_key=a["file_key"],
+        expires_in=VIEW_URL_EXPIRES_IN,
+        response_content_type=None,
+        as_attachment=False,
+    )
+    return {
+        "id": a["id"],
+        "file_key": a["file_key"],
+        "original_filename": a["original_filename"],
+        "view_url": view_url,
+        "thumbnail_url": _thumbnail_url(a, size, view_url, VIEW_URL_EXPIRES_IN),
     }
 
-@router.get("/status/{status}")
-def read_work_logs_by_status(status: WorkStatus, session: Session = Depends(get_session)):
-    return get_work_logs_by_status(session, status)
+@router.get("/status/{status}", response_model=list[WorkLogItem])
+async def read_work_logs_by_status(
+    status: WorkStatus,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    stream: bool = False,
+    session: AsyncSession = Depends(get_session),
+):
+    return await _read_page(response, status, limit, cursor, stream, session)
 
 
-@router.post("/upsert")
-def upsert_work_log(payload: WorkLogUpsertRequest, session: Session = Depends(get_session)):
+@router.post("/upsert", response_model=WorkLogItem)
+async def upsert_work_log(payload: WorkLogUpsertRequest, session: AsyncSession = Depends(get_session)):
     try:
-        return create_or_update_work_log(
+        return await create_or_update_work_log(
             session=session,
             work_date=payload.work_date,
             status=payload.status,
@@ -166,9 +312,158 @@ def upsert_work_log(payload: WorkLogUpsertRequest, session: Session = Depends(ge
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/summary/total-sales-amount")
-def read_total_sales_amount(session: Session = Depends(get_session)):
-    total = get_total_sales_amount(session)
+async def _iter_body_lines(request: Request):
+    # body 전체를 메모리에 올리지 않고 줄 단위로 흘려보냄
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8").rstrip("\r")
+    if buffer:
+        yield buffer.decode("utf-8").rstrip("\r")
+
+
+class _LineFeed:
+    """csv.reader에 넘길 줄 공급기: 비면 StopIteration, 줄을 더 넣으면 같은 reader로 이어서 읽음"""
+
+    def __init__(self) -> None:
+        self.lines: deque[str] = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+def _in_quoted_field(line: str, in_quotes: bool) -> bool:
+    """
+    line을 읽은 뒤에도 따옴표로 감싼 필드 안인지 (csv.reader 기본 dialect와 같은 규칙).
+    필드 첫 글자인 "만 필드를 열고, 감싼 필드 안의 ""는 따옴표 한 글자.
+    따옴표로 시작하지 않은 필드의 "(예: 5" 모니터)는 그냥 글자.
+    """
+    if '"' not in line:
+        return in_quotes
+    field_start = not in_quotes
+    i = 0
+    while i < len(line):
+        c = line[i]
+        if in_quotes:
+            if c == '"':
+                if line.startswith('"', i + 1):
+                    i += 1
+                else:
+                    in_quotes = False
+        elif c == '"' and field_start:
+            in_quotes = True
+        field_start = not in_quotes and c == ","
+        i += 1
+    return in_quotes
+
+
+async def _iter_csv_records(request: Request):
+    # (시작 줄 번호, 필드 목록 또는 에러 메시지). 따옴표 안 줄바꿈이 있는 필드도 한 레코드로:
+    # 감싼 필드가 닫힐 때까지(레코드가 끝날 때까지) 줄을 모아 body 전체에 하나뿐인 reader에 넘김
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    start: int | None = None
+    in_quotes = False
+    line_no = 0
+    async for line in _iter_body_lines(request):
+        line_no += 1
+        if start is None:
+            if not line.strip():
+                continue
+            start = line_no
+        feed.lines.append(line + "\n")
+        in_quotes = _in_quoted_field(line, in_quotes)
+        if in_quotes:
+            continue
+        while feed.lines:
+            yield start, next(reader)
+        start = None
+    if start is not None:
+        # 닫히지 않은 따옴표로 body가 끝남
+        yield start, "CSV 파싱 실패: 따옴표가 닫히지 않았습니다."
+
+
+def _parse_bulk_row(raw: dict) -> dict | str:
+    try:
+        return WorkLogUpsertRequest.model_validate(raw).model_dump()
+    except ValidationError as e:
+        return "; ".join(
+            f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+        )
+
+
+async def _iter_bulk_rows(request: Request, kind: str):
+    if kind == "csv":
+        header: list[str] | None = None
+        async for line_no, fields in _iter_csv_records(request):
+            if isinstance(fields, str):
+                yield line_no, fields
+            elif header is None:
+                header = [f.strip() for f in fields]
+            else:
+                # 빈 칸은 기본값(sales=0, note=None)을 쓰도록 제외
+                yield line_no, _parse_bulk_row({k: v for k, v in zip(header, fields) if v != ""})
+        return
+
+    line_no = 0
+    async for line in _iter_body_lines(request):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, f"JSON 파싱 실패: {e.msg}"
+            continue
+        if not isinstance(raw, dict):
+            yield line_no, "각 줄은 JSON 객체여야 합니다."
+            continue
+        yield line_no, _parse_bulk_row(raw)
+
+
+class BulkErrorItem(BaseModel):
+    line: int
+    error: str
+
+
+class BulkUpsertResponse(BaseModel):
+    processed: int
+    upserted: int
+    error_count: int
+    errors: list[BulkErrorItem]  # 앞쪽 일부만 (error_count가 전체 개수)
+
+
+@router.post("/bulk", response_model=BulkUpsertResponse)
+async def bulk_upsert(request: Request, session: AsyncSession = Depends(get_session)):
+    """
+    text/csv(첫 줄 헤더) 또는 application/x-ndjson body를 배치 upsert.
+    행 단위 에러는 줄 번호와 함께 응답에 담고 나머지는 계속 반영함.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type == "text/csv":
+        kind = "csv"
+    elif content_type in ("application/x-ndjson", "application/jsonl"):
+        kind = "ndjson"
+    else:
+        raise HTTPException(status_code=415, detail="text/csv 또는 application/x-ndjson만 지원합니다.")
+
+    return await bulk_upsert_work_logs(session, _iter_bulk_rows(request, kind))
+
+
+class TotalSalesAmountResponse(BaseModel):
+    total_sales_amount: int
+
+
+@router.get("/summary/total-sales-amount", response_model=TotalSalesAmountResponse)
+async def read_total_sales_amount(session: AsyncSession = Depends(get_session)):
+    total = await get_total_sales_amount(session)
     return {"total_sales_amount": total}
 
 class AttachmentItem(BaseModel):
@@ -194,120 +489,193 @@ class TodayPhotoItem(BaseModel):
     original_filename: str
     file_key: str
     download_url: str
+    thumbnail_url: str  # 목록/미리보기용 (썸네일이 아직 없으면 download_url과 같음)
 
 @router.get("/today/photos", response_model=list[TodayPhotoItem])
-def get_today_photos(session: Session = Depends(get_session)):
-    today = date.today()
-
-    log_stmt = select(WorkLog).where(WorkLog.work_date == today)
-    log = session.exec(log_stmt).first()
-    if not log:
+async def get_today_photos(thumbnail_size: int | None = None, session: AsyncSession = Depends(get_session)):
+    size = _thumbnail_size(thumbnail_size)
+    # 서울 날짜 기준 스냅샷 (get_today와 같은 캐시), GET이라 오늘 work_log를 만들지 않음
+    today = await get_today_snapshot(session, create=False)
+    if today is None:
         return []
 
     # 휴무면 사진 보기 자체를 막고 싶으면 여기서도 체크 가능(선택)
-    status_value = getattr(getattr(log.status, "value", log.status), "strip", lambda: log.status)()
-    if status_value == "휴무":
+    if today["status"] == "휴무":
         return []
 
-    att_stmt = select(Attachment).where(Attachment.work_log_id == log.id)
-    atts = session.exec(att_stmt).all()
-
     items: list[TodayPhotoItem] = []
-    for a in atts:
+    for a in today["attachments"]:
         url = create_presigned_get_url(
-            file_key=a.file_key,
-            expires_in=600,  # 10분
+            file_key=a["file_key"],
+            expires_in=VIEW_URL_EXPIRES_IN,
             response_content_type=None,  # 굳이 강제하지 않아도 됨
             as_attachment=False,
         )
         items.append(
             TodayPhotoItem(
-                attachment_id=a.id,
-                original_filename=a.original_filename,
-                file_key=a.file_key,
+                attachment_id=a["id"],
+                original_filename=a["original_filename"],
+                file_key=a["file_key"],
                 download_url=url,
+                thumbnail_url=_thumbnail_url(a, size, url, VIEW_URL_EXPIRES_IN),
             )
         )
 
     return items
 
-@router.get("/week-summary")
-def week_summary(session: Session = Depends(get_session)):
-    today = date.today()
-    week_start = today - timedelta(days=today.weekday())  # 월요일
-    week_end = week_start + timedelta(days=6)
-
-    # 출근일 수
-    work_days_stmt = select(func.count()).select_from(WorkLog).where(
-        WorkLog.work_date >= week_start,
-        WorkLog.work_date <= week_end,
-        WorkLog.status == WorkStatus.출근,
+class WeekSummaryResponse(BaseModel):
+    week_start: str
+    week_end: str
+    work_days: int
+    sales_amount_sum: int
+    photo_days: int
+
+@router.get("/week-summary", response_model=WeekSummaryResponse)
+async def week_summary(session: AsyncSession = Depends(get_session)):
+    # 이번 주 집계 행 조회 한 번 (집계는 쓰기 시점에 갱신됨)
+    return await get_week_summary(session)
+
+SSE_HEARTBEAT_SECONDS = 15
+
+
+async def _event_stream(request: Request):
+    with change_listener.subscribe() as queue:
+        # 연결 직후 한 번: 클라이언트는 이걸 받고 /today 등을 한 번 읽으면 됨
+        yield "event: ready\ndata: {}\n\n"
+        while not await request.is_disconnected():
+            try:
+                payload = await asyncio.wait_for(queue.get(), SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"  # 프록시 idle timeout 방지
+                continue
+            yield f"event: {payload['kind']}\ndata: {json.dumps(payload)}\n\n"
+
+
+@router.get("/events")
+async def work_log_events(request: Request):
+    """
+    work_log/첨부 변경을 Server-Sent Events로 push (폴링 대신 사용).
+    data: {"kind": "work_log"|"attachment", "from": 날짜, "to": 날짜, "work_log_ids": [...]}
+    """
+    return StreamingResponse(
+        _event_stream(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    work_days = session.exec(work_days_stmt).one()
 
-    # 판매 합계
-    sales_sum_stmt = select(func.coalesce(func.sum(WorkLog.sales_amount), 0)).where(
-        WorkLog.work_date >= week_start,
-        WorkLog.work_date <= week_end,
-    )
-    sales_amount_sum = session.exec(sales_sum_stmt).one()
-
-    # 사진 업로드한 날 수 (attachments 있는 날짜 distinct)
-    photo_days_stmt = select(func.count(func.distinct(WorkLog.work_date))).select_from(WorkLog).join(
-        Attachment, Attachment.work_log_id == WorkLog.id
-    ).where(
-        WorkLog.work_date >= week_start,
-        WorkLog.work_date <= week_end,
-    )
-    photo_days = session.exec(photo_days_stmt).one()
+class AnalyticsBucket(BaseModel):
+    bucket_start: str
+    work_days: int
+    half_days: int
+    off_days: int
+    sales_count: int
+    sales_amount: int
+    photo_days: int
+    photo_count: int
+
+class AnalyticsResponse(BaseModel):
+    date_from: str = Field(alias="from")
+    date_to: str = Field(alias="to")
+    group_by: Literal["day", "week", "month"]
+    buckets: list[AnalyticsBucket]
+
+@router.get("/analytics", response_model=AnalyticsResponse)
+async def read_analytics(
+    date_from: date = Query(alias="from"),
+    date_to: date = Query(alias="to"),
+    group_by: Literal["day", "week", "month"] = "day",
+    session: AsyncSession = Depends(get_session),
+):
+    # 기간별 출근/반차/휴무 일수, 판매 합계, 사진 수 (집계 테이블 grouped 쿼리 한 번)
+    try:
+        buckets = await get_analytics(session, date_from, date_to, group_by)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return {
-        "week_start": str(week_start),
-        "week_end": str(week_end),
-        "work_days": int(work_days),
-        "sales_amount_sum": int(sales_amount_sum),
-        "photo_days": int(photo_days),
+        "from": str(date_from),
+        "to": str(date_to),
+        "group_by": group_by,
+        "buckets": buckets,
     }
 
-@router.get("/{id}")
-def read_work_log(id: int, session: Session = Depends(get_session)):
-    log = get_work_log(session, id)
-    if not log:
-        raise HTTPException(status_code=404, detail="WorkLog not found")
-    return log
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+async def _stream_export(date_from: date, date_to: date, format: str, compress: bool):
+    # _stream_ndjson과 같은 이유로 별도 세션
+    async with async_session() as session:
+        if format == "parquet":
+            # parquet은 파일 안에서 컬럼 단위로 압축
+            chunks = export_parquet(session, date_from, date_to, compression="zstd" if compress else "none")
+        else:
+            chunks = export_csv(session, date_from, date_to)
+            if compress:
+                chunks = gzip_chunks(chunks)
+        async for chunk in chunks:
+            if chunk:
+                yield chunk
+
+
+@router.get("/export")
+async def export_work_logs(
+    date_from: date = Query(alias="from"),
+    date_to: date = Query(alias="to"),
+    format: Literal["csv", "parquet"] = "csv",
+    compress: bool = False,
+):
+    """
+    기간 내 work_log + 첨부(LEFT JOIN, 첨부 1장당 1행)를 파일로 스트리밍.
+    compress=true: csv는 .csv.gz(gzip), parquet은 zstd 컬럼 압축.
+    """
+    try:
+        validate_export_range(date_from, date_to)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if format == "parquet" and not pyarrow_available():
+        raise HTTPException(status_code=501, detail="parquet 내보내기에는 pyarrow가 필요합니다.")
+
+    filename = f"work-logs_{date_from}_{date_to}.{format}"
+    media_type = EXPORT_MEDIA_TYPES[format]
+    if compress and format == "csv":
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        _stream_export(date_from, date_to, format, compress),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
-@router.get("/{id}/detail", response_model=WorkLogWithAttachmentsResponse)
-def read_work_log_detail(id: int, session: Session = Depends(get_session)):
-    log = get_work_log(session, id)   # 너 기존 service 사용
-    if not log:
+async def _read_work_log_detail(session: AsyncSession, id: int) -> dict:
+    detail = await get_work_log_detail(session, id)
+    if not detail:
         raise HTTPException(status_code=404, detail="WorkLog not found")
+    return detail
+
+@router.get("/{id}", response_model=WorkLogItem)
+async def read_work_log(id: int, request: Request, response: Response, session: AsyncSession = Depends(get_session)):
+    # 본문과 ETag를 같은 (캐시된) 값에서 만듦
+    detail = await _read_work_log_detail(session, id)
+    etag = _etag("work-log", id, *work_log_etag_parts(detail))
+    if not_modified := _not_modified(request, etag):
+        return not_modified
+    response.headers["ETag"] = etag
+    return detail
 
-    att_stmt = (
-        select(Attachment)
-        .where(Attachment.work_log_id == id)
-        .order_by(Attachment.created_at.asc())
-    )
-    atts = session.exec(att_stmt).all()
-
-    def sv(x):
-        return getattr(getattr(x, "value", x), "strip", lambda: x)()
+@router.get("/{id}/detail", response_model=WorkLogWithAttachmentsResponse)
+async def read_work_log_detail(id: int, request: Request, response: Response, session: AsyncSession = Depends(get_session)):
+    detail = await _read_work_log_detail(session, id)
+    etag = _etag("work-log-detail", id, *work_log_etag_parts(detail))
+    if not_modified := _not_modified(request, etag):
+        return not_modified
+    response.headers["ETag"] = etag
 
     return WorkLogWithAttachmentsResponse(
-        id=log.id,
-        work_date=str(log.work_date),
-        status=sv(log.status),
-        sales_count=log.sales_count,
-        sales_amount=log.sales_amount,
-        note=log.note,
-        created_at=log.created_at.isoformat() if log.created_at else "",
-        updated_at=log.updated_at.isoformat() if log.updated_at else "",
-        attachments=[
-            AttachmentItem(
-                id=a.id,
-                file_key=a.file_key,
-                original_filename=a.original_filename,
-                created_at=a.created_at.isoformat() if a.created_at else "",
-            )
-            for a in atts
-        ],
+        **{key: detail[key] for key in ("id", "work_date", "status", "sales_count", "sales_amount", "note")},
+        created_at=detail["created_at"] or "",
+        updated_at=detail["updated_at"] or "",
+        attachments=detail["attachments"],
     )
\ No newline at end of file
@@ -4,35 +4,123 @@ work_logs에서 어떻게 처리할지 결정합니다 (비즈니스 로직).
 예: 휴무일엔 매출 0 강제, work_date 유니크 기반 upsert 등
 '''
 
-from datetime import date, datetime
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
-from sqlmodel import Session
+from sqlalchemy import Row
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models import WorkLog, WorkStatus
+from app.attachments_repo import list_thumbnail_keys
+from app.cache import get_cache
+from app.models import Attachment, WorkLog, WorkStatus
+from app.pagination import cursor_after, page
+from app.rollups_repo import get_rollup, get_rollup_total, list_rollup_buckets, week_start_of
+from app.settings import get_settings
 from app.works_repo import (
-    get_work_log_by_id,
     get_work_log_by_date,
+    get_work_log_with_attachments,
+    get_work_log_with_attachments_by_date,
+    insert_work_log_if_absent,
+    iter_work_logs,
     list_work_logs,
     list_work_logs_by_status,
-    save_work_log,
-    sum_sales_amount,
+    update_work_log,
+    upsert_work_log,
+    upsert_work_logs,
 )
 
 SEOUL = ZoneInfo("Asia/Seoul")
+BULK_BATCH_SIZE = 1000
+MAX_BULK_ERRORS = 1000
+
+
+def _today_snapshot_key(work_date: date) -> str:
+    return f"today_snapshot:{work_date.isoformat()}"
+
+
+def _today_work_log_key(work_date: date) -> str:
+    return f"today_work_log:{work_date.isoformat()}"
+
+
+def _work_log_key(log_id: int) -> str:
+    return f"work_log:{log_id}"
+
+
+TOTAL_SALES_KEY = "total_sales_amount"
+
+
+async def invalidate_work_log_caches(
+    work_dates: list[date] | None = None, log_ids: list[int] | None = None
+) -> None:
+    # 쓰기 후 호출 (write-through 무효화). 합계는 어떤 쓰기든 바뀔 수 있어서 항상 지움
+    keys = [TOTAL_SALES_KEY]
+    for d in work_dates or []:
+        keys += [_today_snapshot_key(d), _today_work_log_key(d)]
+    keys += [_work_log_key(i) for i in log_ids or []]
+    await get_cache().delete(*keys)
+
+
+async def handle_change_event(payload: dict) -> None:
+    # 다른 프로세스의 쓰기 알림 -> 이 프로세스의 로컬 캐시도 무효화
+    today = today_seoul_date()
+    dates = [today] if payload["from"] <= today.isoformat() <= payload["to"] else []
+    await invalidate_work_log_caches(dates, payload.get("work_log_ids") or [])
+
+
+def _work_log_to_cache(log: WorkLog) -> dict:
+    return {
+        "id": log.id,
+        "work_date": log.work_date.isoformat(),
+        "status": getattr(log.status, "value", log.status),
+        "sales_count": log.sales_count,
+        "sales_amount": log.sales_amount,
+        "note": log.note,
+        "created_at": log.created_at.isoformat() if log.created_at else None,
+        "updated_at": log.updated_at.isoformat() if log.updated_at else None,
+    }
+
+
+def _work_log_from_cache(data: dict) -> WorkLog:
+    # 세션에 붙지 않은 읽기 전용 객체 (수정/저장에 쓰면 안 됨)
+    return WorkLog(
+        id=data["id"],
+        work_date=date.fromisoformat(data["work_date"]),
+        status=WorkStatus(data["status"]),
+        sales_count=data["sales_count"],
+        sales_amount=data["sales_amount"],
+        note=data["note"],
+        created_at=datetime.fromisoformat(data["created_at"]) if data["created_at"] else None,
+        updated_at=datetime.fromisoformat(data["updated_at"]) if data["updated_at"] else None,
+    )
 
 def _validate_non_negative(value: int, field_name: str) -> None:
     if value < 0:
         raise ValueError(f"{field_name}는 0 이상이어야 합니다.")
 
 
-def create_or_update_work_log(
-    session: Session,
+async def create_or_update_work_log(
+    session: AsyncSession,
     work_date: date,
     status: WorkStatus,
     sales_count: int = 0,
     sales_amount: int = 0,
     note: str | None = None,
 ) -> WorkLog:
+    # work_date 유니크 제약 기반 upsert (조회 후 수정/삽입 대신 한 문장)
+    log = await upsert_work_log(
+        session, _work_log_values(work_date, status, sales_count, sales_amount, note)
+    )
+    await invalidate_work_log_caches([work_date], [log.id])
+    return log
+
+
+def _work_log_values(
+    work_date: date,
+    status: WorkStatus,
+    sales_count: int = 0,
+    sales_amount: int = 0,
+    note: str | None = None,
+) -> dict:
     _validate_non_negative(sales_count, "sales_count")
     _validate_non_negative(sales_amount, "sales_amount")
 
@@ -41,70 +129,282 @@ def create_or_update_work_log(
         sales_count = 0
         sales_amount = 0
 
-    existing = get_work_log_by_date(session, work_date)
-    if existing:
-        existing.status = status
-        existing.sales_count = sales_count
-        existing.sales_amount = sales_amount
-        existing.note = note
-        return save_work_log(session, existing)
-
-    new_log = WorkLog(
-        work_date=work_date,
-        status=status,
-        sales_count=sales_count,
-        sales_amount=sales_amount,
-        note=note,
+    return {
+        "work_date": work_date,
+        "status": status,
+        "sales_count": sales_count,
+        "sales_amount": sales_amount,
+        "note": note,
+    }
+
+
+async def bulk_upsert_work_logs(
+    session: AsyncSession,
+    rows: AsyncIterable[tuple[int, dict | str]],
+    batch_size: int = BULK_BATCH_SIZE,
+) -> dict:
+    """
+    (줄 번호, 값 dict 또는 파싱 에러 메시지)를 받아 batch_size씩 upsert.
+    단건 upsert와 같은 검증/휴무 규칙을 적용하고, 실패한 행은 건너뛰고 보고함.
+    배치 단위로 커밋하므로 중간에 끊기면 앞 배치까지는 반영됨.
+    """
+    processed = 0
+    upserted = 0
+    error_count = 0
+    errors: list[dict] = []
+    batch: dict[date, dict] = {}
+
+    async def flush(batch: dict[date, dict]) -> int:
+        ids = await upsert_work_logs(session, list(batch.values()))
+        await invalidate_work_log_caches(list(batch), ids)
+        return len(ids)
+
+    def add_error(line: int, message: str) -> None:
+        nonlocal error_count
+        error_count += 1
+        if len(errors) < MAX_BULK_ERRORS:
+            errors.append({"line": line, "error": message})
+
+    async for line, row in rows:
+        processed += 1
+        if isinstance(row, str):
+            add_error(line, row)
+            continue
+        try:
+            values = _work_log_values(**row)
+        except ValueError as e:
+            add_error(line, str(e))
+            continue
+
+        # 같은 배치 안에 같은 날짜가 두 번 오면 ON CONFLICT가 실패하므로 마지막 값만 남김
+        batch[values["work_date"]] = values
+        if len(batch) >= batch_size:
+            upserted += await flush(batch)
+            batch = {}
+
+    upserted += await flush(batch)
+
+    return {
+        "processed": processed,
+        "upserted": upserted,
+        "error_count": error_count,
+        "errors": errors,
+    }
+
+
+async def get_all_work_logs(
+    session: AsyncSession, limit: int, cursor: str | None = None
+) -> tuple[list[Row], str | None]:
+    return page(await list_work_logs(session, limit=limit + 1, after=cursor_after(cursor)), limit)
+
+
+async def get_work_logs_by_status(
+    session: AsyncSession, status: WorkStatus, limit: int, cursor: str | None = None
+) -> tuple[list[Row], str | None]:
+    return page(
+        await list_work_logs_by_status(session, status, limit=limit + 1, after=cursor_after(cursor)), limit
     )
 
-    # DB default 쓰려면 ORM이 NULL을 보내면 안 됨
-    delattr(new_log, "created_at")
-    delattr(new_log, "updated_at")
-    
-    return save_work_log(session, new_log)
 
+def stream_work_logs(
+    session: AsyncSession, status: WorkStatus | None = None, cursor: str | None = None
+) -> AsyncIterator[Row]:
+    return iter_work_logs(session, status=status, after=cursor_after(cursor))
+
+
+async def get_total_sales_amount(session: AsyncSession) -> int:
+    # 전체 합계는 집계 테이블의 month 행 합산 (full scan 없음)
+    async def load() -> int:
+        return int((await get_rollup_total(session))["sales_amount"])
+
+    return await get_cache().get_or_load(TOTAL_SALES_KEY, load, get_settings().total_sales_cache_ttl)
+
+
+async def get_week_summary(session: AsyncSession) -> dict:
+    week_start = week_start_of(today_seoul_date())  # 월요일
+    week_end = week_start + timedelta(days=6)
 
-def get_all_work_logs(session: Session) -> list[WorkLog]:
-    return list_work_logs(session)
+    rollup = await get_rollup(session, "week", week_start)
+    return {
+        "week_start": str(week_start),
+        "week_end": str(week_end),
+        "work_days": rollup.work_days if rollup else 0,  # 출근일 수
+        "sales_amount_sum": int(rollup.sales_amount) if rollup else 0,
+        "photo_days": rollup.photo_days if rollup else 0,  # 사진 업로드한 날 수
+    }
 
 
-def get_work_logs_by_status(session: Session, status: WorkStatus) -> list[WorkLog]:
-    return list_work_logs_by_status(session, status)
+async def get_work_log_detail(session: AsyncSession, log_id: int) -> dict | None:
+    """
+    work_log + 첨부 목록을 dict로 (/{id}, /{id}/detail 공용).
+    캐시 -> 없으면 JOIN 쿼리 한 번. ETag(work_log_etag_parts)도 이 값에서 만들어야
+    본문과 ETag가 항상 같은 시점의 데이터가 됨.
+    """
+    async def load() -> dict | None:
+        log, atts = await get_work_log_with_attachments(session, log_id)
+        if not log:
+            return None
+        return {
+            **_work_log_to_cache(log),
+            "attachments": [
+                {
+                    "id": a.id,
+                    "file_key": a.file_key,
+                    "original_filename": a.original_filename,
+                    "created_at": a.created_at.isoformat() if a.created_at else "",
+                }
+                for a in atts
+            ],
+        }
 
+    return await get_cache().get_or_load(_work_log_key(log_id), load, get_settings().work_log_cache_ttl)
 
-def get_total_sales_amount(session: Session) -> int:
-    return sum_sales_amount(session)
 
+def work_log_etag_parts(detail: dict) -> tuple:
+    # (updated_at, 최신 첨부 created_at, 첨부 수). 없어진 첨부는 목록에서 빠지므로 ETag도 바뀜
+    atts = detail["attachments"]
+    return (detail["updated_at"], max((a["created_at"] for a in atts), default=""), len(atts))
 
-def get_work_log(session: Session, log_id: int) -> WorkLog | None:
-    return get_work_log_by_id(session, log_id)
+
+def today_etag_parts(snapshot: dict) -> tuple:
+    atts = snapshot["attachments"]
+    return (
+        snapshot["updated_at"],
+        max((a["created_at"] for a in atts), default=""),
+        len(atts),
+        # 썸네일이 나중에 생기면 응답(URL)이 바뀜
+        sum(len(a["thumbnails"]) for a in atts),
+    )
 
 def today_seoul_date():
     return datetime.now(SEOUL).date()
 
-def ensure_today_work_log(session: Session) -> WorkLog:
+async def ensure_today_work_log(session: AsyncSession) -> WorkLog:
     """
     오늘 work_log가 있으면 반환
     없으면 자동 생성해서 반환
     (기본 status는 '휴무' 추천)
+    캐시를 거치므로 반환값은 읽기 전용으로만 사용
     """
     today = today_seoul_date()
 
-    wl = get_work_log_by_date(session, today)
+    async def load() -> dict:
+        return _work_log_to_cache(await _ensure_work_log(session, today))
+
+    data = await get_cache().get_or_load(_today_work_log_key(today), load, get_settings().today_cache_ttl)
+    return _work_log_from_cache(data)
+
+
+async def _ensure_work_log(session: AsyncSession, today: date) -> WorkLog:
+    wl = await get_work_log_by_date(session, today)
     if wl:
         return wl
 
-    new_log = WorkLog(
-        work_date=today,
-        status=WorkStatus.휴무,   # 안전한 기본값
-        sales_count=0,
-        sales_amount=0,
-        note=None,
+    # 없을 때만 INSERT ... ON CONFLICT DO NOTHING (가장 자주 타는 경로는 위 SELECT 한 번)
+    wl = await insert_work_log_if_absent(
+        session,
+        {
+            "work_date": today,
+            "status": WorkStatus.휴무,   # 안전한 기본값
+            "sales_count": 0,
+            "sales_amount": 0,
+            "note": None,
+        },
     )
+    if wl:
+        return wl
+
+    # 동시에 다른 요청이 먼저 만든 경우
+    return await get_work_log_by_date(session, today)
+
+
+async def update_today_sales(
+    session: AsyncSession,
+    sales_count: int | None = None,
+    sales_amount: int | None = None,
+) -> WorkLog:
+    wl = await ensure_today_work_log(session)
+
+    if wl.status == WorkStatus.휴무:
+        raise ValueError("휴무 상태에서는 판매 입력이 불가합니다. 출근으로 변경 후 입력하세요.")
+
+    if sales_count is None and sales_amount is None:
+        raise ValueError("sales_count 또는 sales_amount 중 하나는 필요합니다.")
+
+    values = {}
+    if sales_count is not None:
+        _validate_non_negative(sales_count, "sales_count")
+        values["sales_count"] = sales_count
+    if sales_amount is not None:
+        _validate_non_negative(sales_amount, "sales_amount")
+        values["sales_amount"] = sales_amount
+
+    updated = await update_work_log(session, wl.id, values)
+    await invalidate_work_log_caches([wl.work_date], [wl.id])
+    return updated
+
+
+def _today_snapshot(
+    wl: WorkLog, atts: list[Attachment], thumbnails: dict[int, dict[int, str]]
+) -> dict:
+    return {
+        "id": wl.id,
+        "work_date": str(wl.work_date),
+        "status": getattr(wl.status, "value", wl.status),
+        "sales_count": wl.sales_count,
+        "sales_amount": wl.sales_amount,
+        "note": wl.note,
+        "created_at": wl.created_at.isoformat() if wl.created_at else "",
+        "updated_at": wl.updated_at.isoformat() if wl.updated_at else "",
+        "attachments": [
+            {
+                "id": a.id,
+                "file_key": a.file_key,
+                "original_filename": a.original_filename,
+                "created_at": a.created_at.isoformat() if a.created_at else "",
+                # JSON(Redis) 캐시와 맞추려고 size를 문자열 키로
+                "thumbnails": {str(size): key for size, key in thumbnails.get(a.id, {}).items()},
+            }
+            for a in atts
+        ],
+    }
+
+
+async def get_today_snapshot(session: AsyncSession, create: bool = True) -> dict | None:
+    """
+    오늘(서울 기준) work_log + 첨부 목록을 dict로.
+    캐시 -> 없으면 JOIN 쿼리 한 번 후 캐시에 저장.
+    오늘 work_log가 없으면 create=True일 때만 생성 (create=False면 None, 읽기 전용 GET용).
+    """
+    today = today_seoul_date()
+
+    async def load() -> dict | None:
+        # 로딩은 읽기만: 캐시 single-flight로 create=False 요청과 합쳐져도 같은 결과
+        wl, atts = await get_work_log_with_attachments_by_date(session, today)
+        if not wl:
+            return None  # None은 캐시에 넣지 않음
+        thumbnails = await list_thumbnail_keys(session, [a.id for a in atts])
+        return _today_snapshot(wl, atts, thumbnails)
+
+    snapshot = await get_cache().get_or_load(_today_snapshot_key(today), load, get_settings().today_cache_ttl)
+    if snapshot is None and create:
+        # 막 만든 work_log라 첨부 없음 (캐시는 다음 요청이 채움)
+        snapshot = _today_snapshot(await _ensure_work_log(session, today), [], {})
+    return snapshot
 
-    # 네 models.py에서 created_at/updated_at은 server_default라
-    # ORM이 None을 보내면 default가 안 먹는 이슈가 있어서 너가 upsert에서 쓰던 방식 그대로 적용
-    delattr(new_log, "created_at")
-    delattr(new_log, "updated_at")
 
-    return save_work_log(session, new_log)
\ No newline at end of file
+async def get_analytics(
+    session: AsyncSession, date_from: date, date_to: date, group_by: str
+) -> list[dict]:
+    if date_from > date_to:
+        raise ValueError("from은 to보다 이후일 수 없습니다.")
+    buckets = await list_rollup_buckets(session, group_by, date_from, date_to)
+    return [
+        {
+            **bucket,
+            "bucket_start": str(bucket["bucket_start"]),
+            "sales_count": int(bucket["sales_count"]),
+            "sales_amount": int(bucket["sales_amount"]),
+        }
+        for bucket in buckets
+    ]
@@ -0,0 +1,104 @@
+'''
+콜드 스타트(import 시간) 측정: python -X importtime으로 새 프로세스에서 import
+python -m bench.importtime --repeat 5 --save bench/baselines/importtime.json
+python -m bench.importtime --compare bench/baselines/importtime.json   # 회귀 시 exit 1
+
+import만으로 무거운 모듈(boto3 등)이 로드되면 실패로 봄 -> lazy import가 깨지면 바로 보임.
+(같은 검사가 pytest에도 있음: tests/test_importtime.py)
+'''
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+DEFAULT_MODULE = "app.main"
+# import 시점에 로드되면 안 되는 모듈 (첫 사용 때 로드)
+DEFAULT_FORBIDDEN = ("boto3", "botocore")
+DEFAULT_TOLERANCE = 0.25
+MIN_REGRESSION_MS = 20.0
+
+
+def _measure(module: str) -> dict[str, tuple[int, int]]:
+    # 모듈 이름 -> (self us, cumulative us)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.exit(f"import {module} 실패:\n{proc.stderr[-2000:]}")
+
+    timings: dict[str, tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|", 2)
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def run(module: str, repeat: int, forbidden: list[str]) -> dict:
+    runs = [_measure(module) for _ in range(repeat)]
+    totals = [timings[module][1] / 1000 for timings in runs]
+
+    # 가장 느린 top-level 의존성 (마지막 실행 기준)
+    last = runs[-1]
+    top = sorted(
+        ((name, cumulative / 1000) for name, (_, cumulative) in last.items() if "." not in name),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:15]
+
+    return {
+        "module": module,
+        "repeat": repeat,
+        "median_ms": round(statistics.median(totals), 1),
+        "min_ms": round(min(totals), 1),
+        "max_ms": round(max(totals), 1),
+        "top_packages_ms": {name: round(ms, 1) for name, ms in top},
+        "forbidden_loaded": sorted(name for name in forbidden if name in last),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench.importtime")
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--forbid", nargs="*", default=list(DEFAULT_FORBIDDEN), help="import 시 로드되면 실패로 볼 모듈")
+    parser.add_argument("--budget-ms", type=float, help="중앙값이 이 값을 넘으면 실패")
+    parser.add_argument("--save", help="결과를 기준선 JSON으로 저장할 경로")
+    parser.add_argument("--compare", help="비교할 기준선 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    report = run(args.module, args.repeat, args.forbid)
+    print(f"import {report['module']}: median {report['median_ms']}ms "
+          f"(min {report['min_ms']}, max {report['max_ms']}, n={report['repeat']})")
+    for name, ms in report["top_packages_ms"].items():
+        print(f"  {name:30} {ms:>9.1f}ms")
+
+    failures = [f"{name} loaded at import time" for name in report["forbidden_loaded"]]
+    if args.budget_ms is not None and report["median_ms"] > args.budget_ms:
+        failures.append(f"median {report['median_ms']}ms > budget {args.budget_ms}ms")
+    if args.compare:
+        base = json.loads(Path(args.compare).read_text())["median_ms"]
+        limit = max(base * (1 + args.tolerance), base + MIN_REGRESSION_MS)
+        if report["median_ms"] > limit:
+            failures.append(f"median {base}ms -> {report['median_ms']}ms")
+
+    if args.save:
+        path = Path(args.save)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"baseline saved: {path}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
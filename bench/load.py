@@ -0,0 +1,408 @@
+'''
+전체 라우터 부하 테스트 (works / attachments / users)
+DATABASE_URL=postgresql+asyncpg://... python -m bench.load --concurrency 16 --requests 500 --save bench/baselines/local.json
+DATABASE_URL=... python -m bench.load --compare bench/baselines/local.json   # p95 회귀 시 exit 1
+
+기본은 앱을 프로세스 안에서 ASGI로 직접 호출 (네트워크/uvicorn 제외, 앱+DB 비용만 측정).
+--base-url을 주면 떠 있는 서버에 HTTP로 보냄 (그 서버도 일회용 DB + bench.env의 가짜 S3 키로 띄울 것).
+S3는 presign(로컬 서명)만 하므로 가짜 자격증명으로 충분함. SSE(/work-logs/events)는 제외.
+
+--sync-vs-async 16,64,256: 동기(def 라우트 + threadpool + psycopg2 Session, async 전환 전 구조)와
+비동기(async def + asyncpg AsyncSession) 처리량을 동시 요청 수별로 비교. 두 쪽 다 같은 repo 문장을
+같은 풀 크기(DB_POOL_SIZE/DB_MAX_OVERFLOW)로 실행하고 응답이 같은지도 확인함 (다르면 exit 1).
+- today  : GET  날짜별 work_log + 첨부 (works_repo.work_log_with_attachments_statement)
+- confirm: POST work_log FOR UPDATE 잠금 + 기존 첨부 조회 후 commit (attachments_repo.lock_work_log_with_attachments와 같은 두 문장)
+psycopg2가 필요함 (동기 쪽 드라이버).
+'''
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+import httpx
+
+from bench.env import prepare_env
+
+prepare_env()
+
+from bench.seed import SEED_START  # noqa: E402
+
+# 기준선 대비 p95가 이 비율 + 절대값 이상 느려지면 회귀로 판단 (작은 값의 노이즈 방지)
+DEFAULT_TOLERANCE = 0.25
+MIN_REGRESSION_MS = 2.0
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    # 요청 번호 -> (path, kwargs) : 요청마다 다른 날짜/페이지를 고르기 위해 함수로 둠
+    build: Callable[[int], tuple[str, dict]]
+    expected: tuple[int, ...] = (200,)
+
+
+@dataclass
+class Result:
+    latencies: list[float] = field(default_factory=list)
+    statuses: dict[int, int] = field(default_factory=dict)
+    errors: int = 0
+    wall: float = 0.0
+
+
+@dataclass
+class Fixture:
+    # 시드 데이터에서 뽑은 요청 대상 (HTTP로 조회하므로 --base-url에서도 동일)
+    work_log_ids: list[int]
+    work_dates: list[date]
+    attachment: dict
+
+
+async def _discover(client: httpx.AsyncClient) -> Fixture:
+    logs = (await client.get("/work-logs/", params={"limit": 200})).raise_for_status().json()
+    if not logs:
+        sys.exit("work_logs가 비어 있습니다. 먼저 python -m bench.seed를 실행하세요.")
+
+    attachment = None
+    for log in logs:
+        detail = (await client.get(f"/work-logs/{log['id']}/detail")).raise_for_status().json()
+        if detail["attachments"]:
+            attachment = detail["attachments"][0]
+            break
+    if attachment is None:
+        sys.exit("첨부가 있는 work_log가 없습니다. python -m bench.seed --photos 1 이상으로 적재하세요.")
+
+    return Fixture(
+        work_log_ids=[log["id"] for log in logs],
+        work_dates=[date.fromisoformat(log["work_date"]) for log in logs],
+        attachment=attachment,
+    )
+
+
+def _scenarios(fx: Fixture) -> list[Scenario]:
+    ids, dates, att = fx.work_log_ids, fx.work_dates, fx.attachment
+
+    def pick(seq, i):
+        return seq[i % len(seq)]
+
+    def upsert_body(i):
+        d = pick(dates, i)
+        return {"work_date": d.isoformat(), "status": "출근", "sales_count": i % 30, "sales_amount": (i % 30) * 10000}
+
+    def bulk_body(i):
+        lines = [json.dumps(upsert_body(i + n), ensure_ascii=False) for n in range(20)]
+        return "\n".join(lines).encode()
+
+    year_from = SEED_START.isoformat()
+    year_to = SEED_START.replace(year=SEED_START.year + 1).isoformat()
+
+    return [
+        # works_router
+        Scenario("works.list", "GET", lambda i: ("/work-logs/", {"params": {"limit": 100}})),
+        Scenario("works.list_stream", "GET", lambda i: ("/work-logs/", {"params": {"stream": "true"}})),
+        Scenario("works.by_status", "GET", lambda i: ("/work-logs/status/출근", {"params": {"limit": 100}})),
+        Scenario("works.get", "GET", lambda i: (f"/work-logs/{pick(ids, i)}", {})),
+        Scenario("works.detail", "GET", lambda i: (f"/work-logs/{pick(ids, i)}/detail", {})),
+        Scenario("works.today", "GET", lambda i: ("/work-logs/today", {})),
+        Scenario("works.today_detail", "GET", lambda i: ("/work-logs/today/detail", {})),
+        Scenario("works.today_photos", "GET", lambda i: ("/work-logs/today/photos", {})),
+        Scenario("works.today_sales", "PATCH",
+                 lambda i: ("/work-logs/today/sales", {"json": {"sales_count": i % 50}}), (200, 400)),
+        Scenario("works.total_sales", "GET", lambda i: ("/work-logs/summary/total-sales-amount", {})),
+        Scenario("works.week_summary", "GET", lambda i: ("/work-logs/week-summary", {})),
+        Scenario("works.analytics_day", "GET",
+                 lambda i: ("/work-logs/analytics", {"params": {"from": year_from, "to": year_to}})),
+        Scenario("works.analytics_month", "GET",
+                 lambda i: ("/work-logs/analytics", {"params": {"from": year_from, "to": year_to, "group_by": "month"}})),
+        Scenario("works.upsert", "POST", lambda i: ("/work-logs/upsert", {"json": upsert_body(i)})),
+        Scenario("works.bulk", "POST", lambda i: (
+            "/work-logs/bulk", {"content": bulk_body(i), "headers": {"content-type": "application/x-ndjson"}})),
+        # attachments_router (confirm은 이미 있는 file_key로 -> 멱등 경로, 데이터 불변)
+        Scenario("attachments.presign", "POST", lambda i: (
+            "/attachments/presign",
+            {"json": {"work_log_id": pick(ids, i), "filename": f"p{i}.jpg", "content_type": "image/jpeg"}})),
+        Scenario("attachments.presign_get", "POST", lambda i: (
+            "/attachments/presign-get", {"json": {"file_key": att["file_key"]}})),
+        Scenario("attachments.confirm", "POST", lambda i: (
+            "/attachments/confirm",
+            {"json": {"work_log_id": att["work_log_id"], "file_key": att["file_key"],
+                      "original_filename": att["original_filename"]}})),
+        Scenario("attachments.confirm_batch", "POST", lambda i: (
+            "/attachments/confirm/batch",
+            {"json": {"work_log_id": att["work_log_id"], "files": [
+                {"file_key": att["file_key"], "original_filename": att["original_filename"]}]}})),
+        # 오늘이 휴무이거나 장수가 찼으면 400 (정상 응답으로 취급)
+        Scenario("attachments.presign_today", "POST", lambda i: (
+            "/attachments/presign/today", {"json": {"filename": f"t{i}.jpg", "content_type": "image/jpeg"}}), (200, 400)),
+        Scenario("attachments.presign_today_batch", "POST", lambda i: (
+            "/attachments/presign/today/batch",
+            {"json": {"files": [{"filename": f"t{i}.jpg", "content_type": "image/jpeg"}]}}), (200, 400)),
+        # users_router
+        Scenario("users.list", "GET", lambda i: ("/users/", {})),
+    ]
+
+
+async def _run(client: httpx.AsyncClient, scenario: Scenario, requests: int, concurrency: int) -> Result:
+    result = Result()
+    counter = iter(range(requests))
+
+    async def worker():
+        for i in counter:
+            path, kwargs = scenario.build(i)
+            started = time.perf_counter()
+            try:
+                response = await client.request(scenario.method, path, **kwargs)
+                await response.aread()
+            except httpx.HTTPError:
+                result.errors += 1
+                continue
+            result.latencies.append(time.perf_counter() - started)
+            result.statuses[response.status_code] = result.statuses.get(response.status_code, 0) + 1
+            if response.status_code not in scenario.expected:
+                result.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.wall = time.perf_counter() - started
+    return result
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    # nearest-rank
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def _summarize(result: Result) -> dict:
+    values = sorted(result.latencies)
+    ms = lambda v: round(v * 1000, 3)  # noqa: E731
+    return {
+        "requests": len(values),
+        "errors": result.errors,
+        "statuses": {str(k): v for k, v in sorted(result.statuses.items())},
+        "p50_ms": ms(_percentile(values, 0.50)),
+        "p95_ms": ms(_percentile(values, 0.95)),
+        "p99_ms": ms(_percentile(values, 0.99)),
+        "mean_ms": ms(sum(values) / len(values)) if values else 0.0,
+        "rps": round(len(values) / result.wall, 1) if result.wall else 0.0,
+    }
+
+
+def _git_rev() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_report(report: dict) -> None:
+    print(f"{'scenario':34} {'n':>6} {'err':>4} {'p50':>9} {'p95':>9} {'p99':>9} {'rps':>8}")
+    for name, s in report["scenarios"].items():
+        print(f"{name:34} {s['requests']:>6} {s['errors']:>4} "
+              f"{s['p50_ms']:>9.2f} {s['p95_ms']:>9.2f} {s['p99_ms']:>9.2f} {s['rps']:>8.1f}")
+
+
+def _compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, current in report["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            continue
+        limit = max(base["p95_ms"] * (1 + tolerance), base["p95_ms"] + MIN_REGRESSION_MS)
+        if current["p95_ms"] > limit:
+            regressions.append(f"{name}: p95 {base['p95_ms']:.2f}ms -> {current['p95_ms']:.2f}ms")
+        if current["errors"] > base["errors"]:
+            regressions.append(f"{name}: errors {base['errors']} -> {current['errors']}")
+    return regressions
+
+
+def _client(base_url: str | None) -> httpx.AsyncClient:
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url, timeout=30)
+    from app.main import app
+
+    # lifespan(LISTEN 커넥션)은 띄우지 않음 -> SSE 외 엔드포인트에는 영향 없음
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=30)
+
+
+def _paired_apps():
+    # 같은 일을 하는 동기/비동기 앱 한 쌍 -> (apps, 동기 엔진)
+    from fastapi import FastAPI
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import make_url
+    from sqlmodel import Session
+
+    from app.attachments_repo import lock_work_log_statement, work_log_attachments_statement
+    from app.db import async_session
+    from app.settings import get_settings
+    from app.works_repo import work_log_with_attachments_statement
+
+    def today_body(rows) -> dict:
+        if not rows:
+            return {"id": None, "attachments": []}
+        return {"id": rows[0][0].id, "attachments": [a.id for _, a in rows if a is not None]}
+
+    def confirm_body(work_log, attachments) -> dict:
+        return {"id": work_log.id if work_log else None, "attachments": len(attachments)}
+
+    settings = get_settings()
+    engine = create_engine(
+        make_url(settings.database_url).set(drivername="postgresql+psycopg2"),
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+    )
+    sync_app, async_app = FastAPI(), FastAPI()
+
+    # 동기: FastAPI가 def 라우트를 threadpool에서 실행 -> 요청 하나가 DB를 기다리는 동안 스레드 하나를 잡음
+    @sync_app.get("/today/{work_date}")
+    def sync_today(work_date: date):
+        with Session(engine) as session:
+            return today_body(session.exec(work_log_with_attachments_statement(work_date)).all())
+
+    @sync_app.post("/confirm/{work_log_id}")
+    def sync_confirm(work_log_id: int):
+        with Session(engine) as session:
+            work_log = session.exec(lock_work_log_statement(work_log_id)).first()
+            attachments = session.exec(work_log_attachments_statement(work_log_id)).all()
+            session.commit()
+            return confirm_body(work_log, attachments)
+
+    @async_app.get("/today/{work_date}")
+    async def async_today(work_date: date):
+        async with async_session() as session:
+            return today_body((await session.exec(work_log_with_attachments_statement(work_date))).all())
+
+    @async_app.post("/confirm/{work_log_id}")
+    async def async_confirm(work_log_id: int):
+        async with async_session() as session:
+            work_log = (await session.exec(lock_work_log_statement(work_log_id))).first()
+            attachments = (await session.exec(work_log_attachments_statement(work_log_id))).all()
+            await session.commit()
+            return confirm_body(work_log, attachments)
+
+    return {"sync": sync_app, "async": async_app}, engine
+
+
+async def run_sync_vs_async(args: argparse.Namespace) -> int:
+    if importlib.util.find_spec("psycopg2") is None:
+        sys.exit("--sync-vs-async에는 psycopg2가 필요합니다 (pip install psycopg2-binary).")
+    async with _client(None) as client:
+        fixture = await _discover(client)
+    ids, dates = fixture.work_log_ids, fixture.work_dates
+    scenarios = [
+        Scenario("today", "GET", lambda i: (f"/today/{dates[i % len(dates)]}", {})),
+        Scenario("confirm", "POST", lambda i: (f"/confirm/{ids[i % len(ids)]}", {})),
+    ]
+    apps, engine = _paired_apps()
+    # 앱 예외(풀 타임아웃 등)는 500으로 받아서 errors로 셈
+    clients = {
+        mode: httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://bench", timeout=60
+        )
+        for mode, app in apps.items()
+    }
+    failures = []
+    try:
+        for scenario in scenarios:
+            for i in range(3):
+                path, kwargs = scenario.build(i)
+                bodies = [
+                    (await c.request(scenario.method, path, **kwargs)).json() for c in clients.values()
+                ]
+                if bodies[0] != bodies[1]:
+                    failures.append(f"{scenario.name} {path}: sync {bodies[0]} != async {bodies[1]}")
+
+        print(f"{'scenario':10} {'conc':>5}  {'sync rps':>9} {'p95':>8} {'err':>4}  {'async rps':>9} {'p95':>8} {'err':>4}")
+        for concurrency in (int(c) for c in args.sync_vs_async.split(",")):
+            for scenario in scenarios:
+                summary = {}
+                for mode, c in clients.items():
+                    await _run(c, scenario, args.warmup, min(concurrency, args.warmup or 1))
+                    summary[mode] = _summarize(await _run(c, scenario, args.requests, concurrency))
+                sync, async_ = summary["sync"], summary["async"]
+                print(
+                    f"{scenario.name:10} {concurrency:>5}  {sync['rps']:>9.1f} {sync['p95_ms']:>8.2f} {sync['errors']:>4}"
+                    f"  {async_['rps']:>9.1f} {async_['p95_ms']:>8.2f} {async_['errors']:>4}"
+                )
+    finally:
+        for c in clients.values():
+            await c.aclose()
+        engine.dispose()
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+async def run(args: argparse.Namespace) -> int:
+    async with _client(args.base_url) as client:
+        fixture = await _discover(client)
+        scenarios = [s for s in _scenarios(fixture) if not args.only or any(s.name.startswith(p) for p in args.only)]
+
+        report = {
+            "meta": {
+                "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "git_rev": _git_rev(),
+                "python": platform.python_version(),
+                "target": args.base_url or "asgi",
+                "concurrency": args.concurrency,
+                "requests": args.requests,
+            },
+            "scenarios": {},
+        }
+        for scenario in scenarios:
+            # 워밍업: 캐시/커넥션 풀/프리페어드 스테이트먼트를 채운 뒤 측정
+            await _run(client, scenario, args.warmup, min(args.concurrency, args.warmup or 1))
+            result = await _run(client, scenario, args.requests, args.concurrency)
+            report["scenarios"][scenario.name] = _summarize(result)
+
+    _print_report(report)
+
+    if args.save:
+        path = Path(args.save)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+        print(f"baseline saved: {path}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = _compare(report, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        print("ok" if not regressions else f"{len(regressions)} regression(s) vs {args.compare}")
+        return 1 if regressions else 0
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench.load")
+    parser.add_argument("--base-url", help="떠 있는 서버 주소 (없으면 프로세스 내 ASGI 호출)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="시나리오당 요청 수")
+    parser.add_argument("--warmup", type=int, default=20, help="시나리오당 워밍업 요청 수 (측정 제외)")
+    parser.add_argument("--only", nargs="*", help="시나리오 이름 prefix 필터 (예: works. users.list)")
+    parser.add_argument("--save", help="결과를 기준선 JSON으로 저장할 경로")
+    parser.add_argument("--compare", help="비교할 기준선 JSON 경로 (p95 회귀 시 exit 1)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="허용 p95 증가 비율")
+    parser.add_argument(
+        "--sync-vs-async", metavar="CONCURRENCY", help="동기/비동기 처리량 비교 (동시 요청 수 쉼표 목록, 예: 16,64,256)"
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run_sync_vs_async(args) if args.sync_vs_async else run(args)))
+
+
+if __name__ == "__main__":
+    main()
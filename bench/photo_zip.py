@@ -0,0 +1,95 @@
+'''
+사진 ZIP 스트리밍 측정 (로컬 S3 스텁, DB/AWS 불필요)
+python -m bench.photo_zip [--files 200] [--size-kb 2048] [--latency-ms 30] [--concurrency 1,8]
+
+tests.s3_stub을 띄우고 S3_ENDPOINT_URL로 boto3를 붙여서 app.export_service.stream_photos_zip을 그대로 돌림.
+동시 개수별 소요 시간, 처리량, 첫 바이트까지 시간, 최대 메모리(tracemalloc) 비교.
+ZIP 내용(이름/CRC/MISSING.txt) 검증은 tests/test_photo_zip.py. boto3가 필요함.
+'''
+
+import argparse
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from bench.env import prepare_env
+from tests.s3_stub import S3Stub
+
+prepare_env(require_database=False)
+
+MISSING_KEY_EVERY = 50  # 이 간격마다 S3에 없는 key를 섞음
+
+
+def _object_body(key: str, size: int) -> bytes:
+    # key마다 다른 내용 (압축이 안 되는 바이트)
+    seed = hashlib.sha256(key.encode()).digest()
+    block = hashlib.sha256(seed).digest() * 2048  # 64KB
+    return (block * (size // len(block) + 1))[:size]
+
+
+def _files(count: int) -> list[tuple[date, str, str]]:
+    start = date(2024, 1, 1)
+    files = []
+    for i in range(count):
+        work_date = start + timedelta(days=i // 5)
+        # 같은 날 같은 이름(IMG_0001.jpg)이 섞이도록
+        files.append((work_date, f"work-logs/{work_date}/{i:06d}.jpg", f"IMG_{i % 3:04d}.jpg"))
+    return files
+
+
+async def _run(files, concurrency: int, out) -> tuple[float, float]:
+    from app.export_service import stream_photos_zip
+
+    started = time.perf_counter()
+    first_byte = None
+    async for chunk in stream_photos_zip(files, concurrency):
+        if chunk and first_byte is None:
+            first_byte = time.perf_counter() - started
+        out.write(chunk)
+    return time.perf_counter() - started, first_byte or 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench.photo_zip")
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--size-kb", type=int, default=2048)
+    parser.add_argument("--latency-ms", type=float, default=30, help="스텁의 요청당 지연 (S3 왕복 흉내)")
+    parser.add_argument("--concurrency", default="1,8", help="쉼표로 여러 개")
+    args = parser.parse_args()
+
+    files = _files(args.files)
+    stub = S3Stub(latency=args.latency_ms / 1000).start()
+    for i, (_, key, _) in enumerate(files):
+        if i % MISSING_KEY_EVERY != MISSING_KEY_EVERY - 1:
+            stub.put(key, _object_body(key, args.size_kb * 1024))
+    os.environ["S3_ENDPOINT_URL"] = stub.endpoint_url
+
+    total_mb = sum(len(body) for body, _ in stub.objects.values()) / 2**20
+    missing = len(files) - len(stub.objects)
+    print(f"{len(files)} files ({missing} missing), {total_mb:.0f} MB, latency {args.latency_ms:g} ms")
+
+    from app.s3 import get_s3_client
+
+    get_s3_client()  # boto3 import/client 생성은 측정에서 제외
+
+    for concurrency in (int(c) for c in args.concurrency.split(",")):
+        # 결과는 디스크로 -> peak는 스트리밍 경로가 잡은 메모리만
+        with tempfile.TemporaryFile() as archive:
+            tracemalloc.start()
+            elapsed, first_byte = asyncio.run(_run(files, concurrency, archive))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        peak_mb = peak / 2**20
+        print(
+            f"concurrency {concurrency:>3}: {elapsed:7.2f} s  {total_mb / elapsed:7.1f} MB/s"
+            f"  first byte {first_byte * 1000:6.1f} ms  peak mem ~{peak_mb:6.1f} MB"
+        )
+
+    stub.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+'''
+presign 엔진별 URL 1개당 서명 시간(us)
+python -m bench.presign [--iterations 20000]
+
+서명값 검증(AWS 문서 예제, boto3와 같은 URL인지)은 tests/test_sigv4.py.
+'''
+
+import argparse
+import timeit
+
+from app.sigv4 import SigV4Presigner
+
+ACCESS_KEY = "AKIDEXAMPLE"
+SECRET_KEY = "bench/fake/secret/key"
+
+
+def _boto3_client(region: str):
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        "s3",
+        region_name=region,
+        aws_access_key_id=ACCESS_KEY,
+        aws_secret_access_key=SECRET_KEY,
+        config=Config(signature_version="s3v4", s3={"addressing_style": "virtual"}),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench.presign")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    try:
+        import boto3  # noqa: F401
+    except ImportError:
+        boto3_available = False
+        print("boto3 not installed: local only")
+    else:
+        boto3_available = True
+
+    presigner = SigV4Presigner("wrt-bench", "ap-southeast-2", ACCESS_KEY, SECRET_KEY)
+    n = args.iterations
+    local_us = timeit.timeit(
+        lambda: presigner.presign("GET", "work-logs/2024-01-01/abc.jpg", 600), number=n
+    ) / n * 1e6
+    print(f"local  get_object: {local_us:8.2f} us/url")
+    if boto3_available:
+        client = _boto3_client("ap-southeast-2")
+        m = max(n // 10, 1)
+        boto3_us = timeit.timeit(
+            lambda: client.generate_presigned_url(
+                "get_object", Params={"Bucket": "wrt-bench", "Key": "work-logs/2024-01-01/abc.jpg"}, ExpiresIn=600
+            ),
+            number=m,
+        ) / m * 1e6
+        print(f"boto3  get_object: {boto3_us:8.2f} us/url ({boto3_us / local_us:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
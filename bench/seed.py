@@ -0,0 +1,164 @@
+'''
+벤치마크용 WorkLog/Attachment(+썸네일)/Job 적재 (일회용 DB 전용, 스키마는 alembic upgrade head로 먼저 생성)
+DATABASE_URL=postgresql+asyncpg://... python -m bench.seed --days 3650 --photos 2 --reset
+
+SEED_START부터 --days일치를 채움. 같은 --seed면 같은 데이터 -> 기준선 비교가 재현 가능.
+근무일마다 job 1건 (마지막 UNPAID_DAYS일만 UNPAID), 첨부마다 THUMBNAIL_SIZES 크기별 썸네일 행.
+끝나면 ANALYZE -> 바로 python -m app.manage explain-hot-queries로 실행계획 확인 가능.
+'''
+
+import argparse
+import asyncio
+import random
+from datetime import date, timedelta
+
+from bench.env import prepare_env
+
+prepare_env()
+
+from sqlalchemy import delete, select, text  # noqa: E402
+from sqlalchemy.dialects.postgresql import insert as pg_insert  # noqa: E402
+
+from app.db import async_session  # noqa: E402
+from app.jobs_repo import rebuild_job_totals  # noqa: E402
+from app.models import Attachment, AttachmentThumbnail, Job, JobStatus, WorkLog, WorkStatus  # noqa: E402
+from app.rollups_repo import rebuild_rollups  # noqa: E402
+from app.s3 import build_thumbnail_key  # noqa: E402
+from app.settings import get_settings  # noqa: E402
+
+SEED_START = date(2000, 1, 1)
+BATCH_SIZE = 1000
+STATUS_WEIGHTS = {WorkStatus.출근: 0.7, WorkStatus.반차: 0.1, WorkStatus.휴무: 0.2}
+# 최근 이 일수의 job만 미지급 (나머지는 지급 완료)
+UNPAID_DAYS = 60
+
+
+def _work_log_rows(days: int, rng: random.Random) -> list[dict]:
+    statuses = rng.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()), k=days)
+    rows = []
+    for i, status in enumerate(statuses):
+        sold = status != WorkStatus.휴무
+        count = rng.randint(1, 40) if sold else 0
+        rows.append({
+            "work_date": SEED_START + timedelta(days=i),
+            "status": status,
+            "sales_count": count,
+            "sales_amount": count * rng.randint(5, 30) * 1000,
+            "note": None,
+        })
+    return rows
+
+
+async def _reset(session, days: int) -> None:
+    seed_range = (SEED_START, SEED_START + timedelta(days=days - 1))
+    seeded = select(WorkLog.id).where(WorkLog.work_date.between(*seed_range))
+    seeded_attachments = select(Attachment.id).where(Attachment.work_log_id.in_(seeded))
+    await session.execute(
+        delete(AttachmentThumbnail).where(AttachmentThumbnail.attachment_id.in_(seeded_attachments))
+    )
+    await session.execute(delete(Attachment).where(Attachment.work_log_id.in_(seeded)))
+    await session.execute(delete(WorkLog).where(WorkLog.id.in_(seeded)))
+    await session.execute(delete(Job).where(Job.work_date.between(*seed_range)))
+
+
+def _job_rows(inserted, unpaid_from: date, rng: random.Random) -> list[dict]:
+    return [
+        {
+            "work_date": work_date,
+            "title": f"bench job {work_date.isoformat()}",
+            "amount": rng.randint(5, 30) * 10000,
+            "status": (JobStatus.UNPAID if work_date >= unpaid_from else JobStatus.PAID).value,
+        }
+        for _, work_date, status in inserted
+        if status != WorkStatus.휴무
+    ]
+
+
+def _thumbnail_rows(attachments, sizes: tuple[int, ...]) -> list[dict]:
+    return [
+        {
+            "attachment_id": attachment_id,
+            "size": size,
+            "file_key": build_thumbnail_key(file_key, size),
+            "width": size,
+            "height": size * 3 // 4,
+            "byte_size": size * 40,
+        }
+        for attachment_id, file_key in attachments
+        for size in sizes
+    ]
+
+
+async def seed(days: int, photos: int, reset: bool, seed_value: int) -> tuple[int, int]:
+    rng = random.Random(seed_value)
+    rows = _work_log_rows(days, rng)
+    unpaid_from = SEED_START + timedelta(days=days - UNPAID_DAYS)
+    sizes = get_settings().thumbnail_sizes
+    log_count = photo_count = 0
+
+    async with async_session() as session:
+        if reset:
+            await _reset(session, days)
+
+        for start in range(0, len(rows), BATCH_SIZE):
+            batch = rows[start:start + BATCH_SIZE]
+            # 이미 있는 날짜는 건너뜀 (--reset 없이 다시 실행해도 안전)
+            inserted = (await session.execute(
+                pg_insert(WorkLog)
+                .values(batch)
+                .on_conflict_do_nothing(index_elements=["work_date"])
+                .returning(WorkLog.id, WorkLog.work_date, WorkLog.status)
+            )).all()
+            log_count += len(inserted)
+
+            attachments = [
+                {
+                    "work_log_id": log_id,
+                    "file_key": f"work-logs/{work_date.isoformat()}/bench-{n}.jpg",
+                    "original_filename": f"photo-{n}.jpg",
+                }
+                for log_id, work_date, status in inserted
+                if status != WorkStatus.휴무
+                for n in range(photos)
+            ]
+            if attachments:
+                inserted_attachments = (await session.execute(
+                    pg_insert(Attachment)
+                    .values(attachments)
+                    .on_conflict_do_nothing(index_elements=["work_log_id", "file_key"])
+                    .returning(Attachment.id, Attachment.file_key)
+                )).all()
+                photo_count += len(inserted_attachments)
+                thumbnails = _thumbnail_rows(inserted_attachments, sizes)
+                # 바인드 파라미터 수 제한(32767) 때문에 나눠서
+                for thumb_start in range(0, len(thumbnails), BATCH_SIZE):
+                    await session.execute(
+                        pg_insert(AttachmentThumbnail).values(thumbnails[thumb_start:thumb_start + BATCH_SIZE])
+                    )
+            if jobs := _job_rows(inserted, unpaid_from, rng):
+                await session.execute(pg_insert(Job).values(jobs))
+
+        await session.commit()
+        # 집계 테이블을 시드 데이터 기준으로 다시 계산
+        await rebuild_rollups(session)
+        await rebuild_job_totals(session)
+        await session.execute(text("ANALYZE"))
+        await session.commit()
+
+    return log_count, photo_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench.seed")
+    parser.add_argument("--days", type=int, default=3650, help="SEED_START부터 채울 일수")
+    parser.add_argument("--photos", type=int, default=2, choices=range(0, 4), help="근무일당 첨부 수 (0~3)")
+    parser.add_argument("--reset", action="store_true", help="시드 범위의 기존 행을 지우고 다시 적재")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args()
+
+    logs, photos = asyncio.run(seed(args.days, args.photos, args.reset, args.seed))
+    print(f"seeded work_logs={logs} attachments={photos}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+'''
+work_log 목록 응답 직렬화 비용 (10k건당 ms): ORM 객체 + jsonable_encoder  vs  Row 튜플 + response_model
+python -m bench.serialization [--rows 10000] [--repeat 7]
+
+Postgres 없이 SQLite 메모리 DB로 같은 SELECT를 실행해서 "행 -> JSON bytes"만 비교함.
+- before: select(WorkLog) ORM 객체 -> jsonable_encoder -> json.dumps (response_model 없던 목록 API)
+- after : select(WORK_LOG_COLUMNS) Row -> list[WorkLogItem] 검증 -> pydantic dump_json (FastAPI 경로)
+- ndjson: ?stream=true 한 줄씩 (before: json.dumps(jsonable_encoder(log)), after: dumps(row._asdict()))
+두 경로의 JSON이 같은 값인지도 확인하고, 다르면 exit 1.
+'''
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+
+from app.models import WorkLog
+from app.responses import dumps
+from app.works_repo import WORK_LOG_COLUMNS
+from app.works_router import WorkLogItem
+
+STATUSES = ("출근", "반차", "휴무")
+
+# 타입은 SQLAlchemy 쪽(PGEnum/DateTime) 결과 처리로 맞춰지므로 SQLite에는 단순한 컬럼으로
+_DDL = text("""
+    CREATE TABLE work_logs (
+        id INTEGER PRIMARY KEY,
+        work_date DATE NOT NULL UNIQUE,
+        sales_count INTEGER NOT NULL,
+        sales_amount INTEGER NOT NULL,
+        status VARCHAR NOT NULL,
+        note VARCHAR,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL
+    )
+""")
+
+
+def _seed(session: Session, rows: int) -> None:
+    session.execute(_DDL)
+    start = date(2000, 1, 1)
+    stamp = datetime(2024, 1, 1, 9, 30)
+    session.execute(
+        text("""
+            INSERT INTO work_logs (id, work_date, sales_count, sales_amount, status, note, created_at, updated_at)
+            VALUES (:id, :work_date, :sales_count, :sales_amount, :status, :note, :created_at, :updated_at)
+        """),
+        [
+            {
+                "id": i + 1,
+                "work_date": start + timedelta(days=i),
+                "sales_count": i % 40,
+                "sales_amount": (i % 40) * 12500,
+                "status": STATUSES[i % 3],
+                "note": None if i % 4 else f"메모 {i}",
+                "created_at": stamp + timedelta(seconds=i),
+                "updated_at": stamp + timedelta(seconds=i, minutes=5),
+            }
+            for i in range(rows)
+        ],
+    )
+
+
+def _before(session: Session) -> bytes:
+    logs = session.scalars(select(WorkLog).order_by(WorkLog.work_date, WorkLog.id)).all()
+    # JSONResponse.render와 같은 옵션
+    return json.dumps(
+        jsonable_encoder(logs), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
+
+
+_ITEMS = TypeAdapter(list[WorkLogItem])
+
+
+def _after(session: Session) -> bytes:
+    rows = session.execute(select(*WORK_LOG_COLUMNS).order_by(WorkLog.work_date, WorkLog.id)).all()
+    # FastAPI serialize_response(dump_json=True)와 같은 순서: from_attributes 검증 -> dump_json
+    return _ITEMS.dump_json(_ITEMS.validate_python(rows, from_attributes=True))
+
+
+def _before_ndjson(session: Session) -> bytes:
+    logs = session.scalars(select(WorkLog).order_by(WorkLog.work_date, WorkLog.id))
+    return "".join(json.dumps(jsonable_encoder(log), ensure_ascii=False) + "\n" for log in logs).encode()
+
+
+def _after_ndjson(session: Session) -> bytes:
+    rows = session.execute(select(*WORK_LOG_COLUMNS).order_by(WorkLog.work_date, WorkLog.id))
+    return b"".join(dumps(row._asdict()) + b"\n" for row in rows)
+
+
+def _time(fn, session: Session, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        # identity map에 남은 객체를 재사용하지 않도록 매번 비움
+        session.expunge_all()
+        started = time.perf_counter()
+        fn(session)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def _same(before: bytes, after: bytes, ndjson: bool) -> bool:
+    if ndjson:
+        return [json.loads(line) for line in before.splitlines()] == [
+            json.loads(line) for line in after.splitlines()
+        ]
+    return json.loads(before) == json.loads(after)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench.serialization")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    failures = []
+    with Session(engine) as session:
+        _seed(session, args.rows)
+        per_10k = 10_000 / args.rows
+
+        for name, before, after, ndjson in (
+            ("list", _before, _after, False),
+            ("ndjson", _before_ndjson, _after_ndjson, True),
+        ):
+            if not _same(before(session), after(session), ndjson):
+                failures.append(f"{name}: before/after JSON differs")
+            before_ms = _time(before, session, args.repeat) * per_10k
+            after_ms = _time(after, session, args.repeat) * per_10k
+            print(
+                f"{name:<7} before {before_ms:8.1f} ms/10k  after {after_ms:8.1f} ms/10k"
+                f"  ({before_ms / after_ms:.1f}x)"
+            )
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
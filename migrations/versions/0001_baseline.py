@@ -0,0 +1,57 @@
+"""baseline: users, work_logs, attachments
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+기존 운영 DB는 이 스키마가 이미 있으므로 `alembic stamp 0001`로 시작.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+work_status = postgresql.ENUM("출근", "휴무", "반차", name="work_status", create_type=False)
+
+
+def upgrade() -> None:
+    postgresql.ENUM("출근", "휴무", "반차", name="work_status").create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_table(
+        "work_logs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("work_date", sa.Date(), nullable=False),
+        sa.Column("sales_count", sa.Integer(), nullable=False),
+        sa.Column("sales_amount", sa.Integer(), nullable=False),
+        sa.Column("status", work_status, nullable=False),
+        sa.Column("note", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+    )
+    op.create_index("ix_work_logs_work_date", "work_logs", ["work_date"])
+    op.create_table(
+        "attachments",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("work_log_id", sa.Integer(), sa.ForeignKey("work_logs.id"), nullable=False),
+        sa.Column("file_key", sa.String(length=1024), nullable=False),
+        sa.Column("original_filename", sa.String(length=255), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+    )
+    op.create_index("ix_attachments_work_log_id", "attachments", ["work_log_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("attachments")
+    op.drop_table("work_logs")
+    op.drop_table("users")
+    postgresql.ENUM(name="work_status").drop(op.get_bind(), checkfirst=True)
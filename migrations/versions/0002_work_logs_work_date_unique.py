@@ -0,0 +1,25 @@
+"""work_logs.work_date unique (upsert ON CONFLICT 대상)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+적용 전에 중복 날짜가 있으면 먼저 정리해야 함:
+  SELECT work_date, count(*) FROM work_logs GROUP BY work_date HAVING count(*) > 1;
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_work_logs_work_date", table_name="work_logs")
+    op.create_index("ix_work_logs_work_date", "work_logs", ["work_date"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_work_logs_work_date", table_name="work_logs")
+    op.create_index("ix_work_logs_work_date", "work_logs", ["work_date"])
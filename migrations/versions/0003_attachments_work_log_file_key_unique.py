@@ -0,0 +1,25 @@
+"""attachments (work_log_id, file_key) unique (confirm ON CONFLICT 대상)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+적용 전에 중복이 있으면 먼저 정리해야 함:
+  SELECT work_log_id, file_key, count(*) FROM attachments GROUP BY 1, 2 HAVING count(*) > 1;
+"""
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        "uq_attachments_work_log_id_file_key", "attachments", ["work_log_id", "file_key"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_attachments_work_log_id_file_key", "attachments", type_="unique")
@@ -0,0 +1,35 @@
+"""work_log_rollups (day / week / month 집계, 전체 합계는 month 행 합산)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+
+적용 후 한 번: python -m app.manage rebuild-rollups
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "work_log_rollups",
+        sa.Column("period", sa.String(length=8), primary_key=True),
+        sa.Column("period_start", sa.Date(), primary_key=True),
+        sa.Column("work_days", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("half_days", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("off_days", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sales_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("sales_amount", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("photo_days", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("photo_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("work_log_rollups")
@@ -0,0 +1,30 @@
+"""hot path composite indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+
+- work_logs (status, work_date): status별 목록, 주간 집계
+- attachments (work_log_id, created_at): 첨부 목록 정렬
+  (work_log_id 단독 인덱스는 이 인덱스와 uq (work_log_id, file_key)가 대신함)
+"""
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_work_logs_status_work_date", "work_logs", ["status", "work_date"])
+    op.create_index(
+        "ix_attachments_work_log_id_created_at", "attachments", ["work_log_id", "created_at"]
+    )
+    op.drop_index("ix_attachments_work_log_id", table_name="attachments")
+
+
+def downgrade() -> None:
+    op.create_index("ix_attachments_work_log_id", "attachments", ["work_log_id"])
+    op.drop_index("ix_attachments_work_log_id_created_at", table_name="attachments")
+    op.drop_index("ix_work_logs_status_work_date", table_name="work_logs")
@@ -0,0 +1,34 @@
+"""attachment_thumbnails (첨부 WebP 썸네일)
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+
+기존 첨부 썸네일 생성: python -m app.manage generate-thumbnails
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "attachment_thumbnails",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("attachment_id", sa.Integer(), sa.ForeignKey("attachments.id"), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("file_key", sa.String(length=1024), nullable=False),
+        sa.Column("width", sa.Integer(), nullable=False),
+        sa.Column("height", sa.Integer(), nullable=False),
+        sa.Column("byte_size", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+        sa.UniqueConstraint("attachment_id", "size", name="uq_attachment_thumbnails_attachment_id_size"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("attachment_thumbnails")
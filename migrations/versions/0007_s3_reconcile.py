@@ -0,0 +1,37 @@
+"""S3 대조: attachments.missing_at, s3_reconcile_checkpoints
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+
+실행: python -m app.manage reconcile-s3 [--dry-run]
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("attachments", sa.Column("missing_at", sa.DateTime(), nullable=True))
+    op.create_table(
+        "s3_reconcile_checkpoints",
+        sa.Column("work_date", sa.Date(), primary_key=True),
+        sa.Column("object_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("orphan_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("deleted_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("missing_count", sa.Integer(), nullable=False, server_default="0"),
+        # 대조 시점 prefix의 최신 LastModified (UTC): 정리가 끝난 날짜도 목록이 바뀌었으면 다시 대조
+        sa.Column("max_last_modified", sa.DateTime(), nullable=True),
+        sa.Column("reconciled_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+        # 목록을 마지막으로 확인한 시각 (대조 또는 재확인): 재확인은 이게 오래된 날짜부터 돌아가며
+        sa.Column("checked_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("s3_reconcile_checkpoints")
+    op.drop_column("attachments", "missing_at")
@@ -0,0 +1,70 @@
+"""jobs (status, work_date) / (work_date) 인덱스 + job_totals 카운터
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+
+jobs 테이블은 마이그레이션 도입 전부터 있던 DB도 있어서 없을 때만 생성.
+여기서 만든 테이블/컬럼에는 주석(CREATED_BY)을 남겨서 downgrade가 그것만 되돌림 (원래 있던 jobs는 유지).
+job_totals는 현재 jobs 기준으로 채움 (이후 어긋나면 python -m app.manage rebuild-job-totals)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+CREATED_BY = "created by migration 0008"
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("jobs"):
+        op.create_table(
+            "jobs",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("work_date", sa.Date(), nullable=False),
+            sa.Column("title", sa.String(length=255), nullable=True),
+            sa.Column("amount", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("status", sa.String(length=16), nullable=False, server_default="UNPAID"),
+            sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+            sa.Column("paid_at", sa.DateTime(), nullable=True),
+            comment=CREATED_BY,
+        )
+    else:
+        columns = {c["name"] for c in inspector.get_columns("jobs")}
+        if "paid_at" not in columns:
+            op.add_column("jobs", sa.Column("paid_at", sa.DateTime(), nullable=True, comment=CREATED_BY))
+    op.create_index("ix_jobs_status_work_date", "jobs", ["status", "work_date", "id"])
+    op.create_index("ix_jobs_work_date", "jobs", ["work_date", "id"])
+
+    op.create_table(
+        "job_totals",
+        sa.Column("status", sa.String(length=16), primary_key=True),
+        sa.Column("job_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("amount", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+    )
+    op.execute("""
+        INSERT INTO job_totals (status, job_count, amount)
+        SELECT s.status, count(j.id), coalesce(sum(j.amount), 0)
+        FROM (VALUES ('UNPAID'), ('PAID')) AS s(status)
+        LEFT JOIN jobs j ON j.status = s.status
+        GROUP BY s.status
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("job_totals")
+    op.drop_index("ix_jobs_work_date", table_name="jobs")
+    op.drop_index("ix_jobs_status_work_date", table_name="jobs")
+
+    inspector = sa.inspect(op.get_bind())
+    if inspector.get_table_comment("jobs").get("text") == CREATED_BY:
+        op.drop_table("jobs")
+        return
+    paid_at = next(c for c in inspector.get_columns("jobs") if c["name"] == "paid_at")
+    if paid_at.get("comment") == CREATED_BY:
+        op.drop_column("jobs", "paid_at")
@@ -0,0 +1,60 @@
+'''
+공용 fixture
+- DB가 필요한 테스트는 DATABASE_URL이 있을 때만 실행 (alembic upgrade head + python -m bench.seed 한 일회용 DB)
+- s3_stub: 로컬 S3 스텁을 띄우고 app.s3가 거기로 붙게 함 (boto3 필요: requirements-dev.txt)
+'''
+
+import os
+from contextlib import asynccontextmanager
+
+import pytest
+
+
+@pytest.fixture
+def database_url() -> str:
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        pytest.skip("DATABASE_URL 미설정 (일회용 DB에서만 실행)")
+    return url
+
+
+@pytest.fixture
+def db_sessions(database_url):
+    # 테스트마다 이벤트 루프(asyncio.run)가 다르므로 app.db의 전역 엔진 대신 테스트 안에서 만들고 닫음
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    @asynccontextmanager
+    async def open_sessions():
+        engine = create_async_engine(database_url)
+        try:
+            yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        finally:
+            await engine.dispose()
+
+    return open_sessions
+
+
+@pytest.fixture
+def s3_stub(monkeypatch):
+    pytest.importorskip("boto3")
+    from app import s3
+    from app.settings import get_settings
+    from tests.s3_stub import S3Stub
+
+    with S3Stub() as stub:
+        for name, value in {
+            "AWS_ACCESS_KEY_ID": "AKIATESTFAKEKEY",
+            "AWS_SECRET_ACCESS_KEY": "test/fake/secret/key",
+            "AWS_REGION": "ap-southeast-2",
+            "AWS_S3_BUCKET": "wrt-test",
+            "S3_ENDPOINT_URL": stub.endpoint_url,
+        }.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.delenv("AWS_SESSION_TOKEN", raising=False)
+        # settings/클라이언트는 첫 사용 때 한 번 만들어지므로 스텁 주소로 다시 만들게 비움
+        get_settings.cache_clear()
+        monkeypatch.setattr(s3, "_client", None)
+        monkeypatch.setattr(s3, "_presigner", None)
+        yield stub
+    get_settings.cache_clear()
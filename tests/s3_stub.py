@@ -0,0 +1,180 @@
+'''
+로컬 S3 스텁 (테스트/벤치 공용, 네트워크/AWS 불필요)
+스레드 HTTP 서버에 path-style 요청만 받음: S3_ENDPOINT_URL로 붙이면 boto3가 그대로 씀
+- GET /{bucket}/{key}               GetObject (없으면 404 NoSuchKey)
+- GET /{bucket}?list-type=2         ListObjectsV2 (prefix, delimiter, 페이지)
+- POST /{bucket}?delete             DeleteObjects
+서명은 검사하지 않음. 처리한 요청은 requests에 (method, S3 operation, prefix/key)로 남김.
+'''
+
+import hashlib
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+S3_XMLNS = "http://s3.amazonaws.com/doc/2006-03-01/"
+
+
+class S3Stub:
+    def __init__(self, latency: float = 0.0, page_size: int = 1000) -> None:
+        self.latency = latency  # 요청당 지연 (S3 왕복 흉내)
+        self.page_size = page_size
+        self.objects: dict[str, tuple[bytes, datetime]] = {}
+        self.requests: list[tuple[str, str, str]] = []
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    def put(self, key: str, body: bytes = b"", last_modified: datetime | None = None) -> None:
+        # S3처럼 LastModified는 초 단위
+        modified = (last_modified or datetime.now(timezone.utc)).replace(microsecond=0)
+        with self._lock:
+            self.objects[key] = (body, modified)
+
+    @property
+    def endpoint_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "S3Stub":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "S3Stub":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def list_requests(self, operation: str) -> list[str]:
+        return [target for _, op, target in self.requests if op == operation]
+
+    def _record(self, method: str, operation: str, target: str) -> None:
+        with self._lock:
+            self.requests.append((method, operation, target))
+
+    def _list(self, prefix: str, delimiter: str, token: str) -> tuple[list[tuple[str, bytes, datetime]], list[str], str]:
+        # (Contents, CommonPrefixes, 다음 페이지 토큰). 토큰은 마지막으로 돌려준 key/prefix
+        with self._lock:
+            keys = sorted(key for key in self.objects if key.startswith(prefix))
+            entries: dict[str, tuple[bytes, datetime] | None] = {}
+            for key in keys:
+                rest = key[len(prefix):]
+                if delimiter and delimiter in rest:
+                    entries.setdefault(prefix + rest.split(delimiter, 1)[0] + delimiter, None)
+                else:
+                    entries[key] = self.objects[key]
+        names = [name for name in sorted(entries) if name > token]
+        page, more = names[:self.page_size], len(names) > self.page_size
+        contents = [(name, *entries[name]) for name in page if entries[name] is not None]
+        prefixes = [name for name in page if entries[name] is None]
+        return contents, prefixes, page[-1] if more else ""
+
+
+def _error(code: str, message: str) -> bytes:
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><Error><Code>{code}</Code><Message>{message}</Message></Error>'
+    ).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def stub(self) -> S3Stub:
+        return self.server.stub
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/xml", headers: dict | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _target(self) -> tuple[str, dict[str, list[str]]]:
+        # "/bucket/key?query" -> (key, query). 버킷 이름은 보지 않음
+        url = urlsplit(self.path)
+        _, _, key = unquote(url.path).lstrip("/").partition("/")
+        return key, parse_qs(url.query, keep_blank_values=True)
+
+    def do_GET(self) -> None:
+        time.sleep(self.stub.latency)
+        key, query = self._target()
+        if "list-type" in query:
+            self._list_objects(query)
+            return
+        self.stub._record("GET", "GetObject", key)
+        entry = self.stub.objects.get(key)
+        if entry is None:
+            self._send(404, _error("NoSuchKey", "The specified key does not exist."))
+            return
+        body, modified = entry
+        self._send(200, body, "application/octet-stream", {
+            "ETag": f'"{hashlib.md5(body).hexdigest()}"',
+            "Last-Modified": modified.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+        })
+
+    def _list_objects(self, query: dict[str, list[str]]) -> None:
+        prefix = query.get("prefix", [""])[0]
+        delimiter = query.get("delimiter", [""])[0]
+        token = query.get("continuation-token", [""])[0]
+        url_encoded = query.get("encoding-type", [""])[0] == "url"
+        self.stub._record("GET", "ListObjectsV2", prefix)
+        contents, prefixes, next_token = self.stub._list(prefix, delimiter, token)
+
+        def name(value: str) -> str:
+            return escape(quote(value, safe="/") if url_encoded else value)
+
+        parts = [
+            f'<?xml version="1.0" encoding="UTF-8"?><ListBucketResult xmlns="{S3_XMLNS}">',
+            f"<Name>stub</Name><Prefix>{name(prefix)}</Prefix><KeyCount>{len(contents) + len(prefixes)}</KeyCount>",
+            f"<MaxKeys>{self.stub.page_size}</MaxKeys><IsTruncated>{'true' if next_token else 'false'}</IsTruncated>",
+        ]
+        if delimiter:
+            parts.append(f"<Delimiter>{name(delimiter)}</Delimiter>")
+        if url_encoded:
+            parts.append("<EncodingType>url</EncodingType>")
+        if token:
+            parts.append(f"<ContinuationToken>{escape(token)}</ContinuationToken>")
+        if next_token:
+            parts.append(f"<NextContinuationToken>{escape(next_token)}</NextContinuationToken>")
+        for key, body, modified in contents:
+            parts.append(
+                f"<Contents><Key>{name(key)}</Key>"
+                f"<LastModified>{modified.strftime('%Y-%m-%dT%H:%M:%S.000Z')}</LastModified>"
+                f'<ETag>"{hashlib.md5(body).hexdigest()}"</ETag><Size>{len(body)}</Size>'
+                f"<StorageClass>STANDARD</StorageClass></Contents>"
+            )
+        for common in prefixes:
+            parts.append(f"<CommonPrefixes><Prefix>{name(common)}</Prefix></CommonPrefixes>")
+        parts.append("</ListBucketResult>")
+        self._send(200, "".join(parts).encode())
+
+    def do_POST(self) -> None:
+        time.sleep(self.stub.latency)
+        _, query = self._target()
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if "delete" not in query:
+            self._send(501, _error("NotImplemented", "only DeleteObjects is supported"))
+            return
+        keys = [element.text for element in ET.fromstring(body).iter() if element.tag.rpartition("}")[2] == "Key"]
+        for key in keys:
+            self.stub._record("POST", "DeleteObjects", key)
+            with self.stub._lock:
+                self.stub.objects.pop(key, None)
+        # Quiet: 실패한 key만 (여기서는 없음)
+        self._send(200, f'<?xml version="1.0" encoding="UTF-8"?><DeleteResult xmlns="{S3_XMLNS}"></DeleteResult>'.encode())
+
+    def log_message(self, *args) -> None:
+        pass
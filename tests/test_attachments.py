@@ -0,0 +1,69 @@
+'''
+첨부 confirm (app.attachments_service, DATABASE_URL 필요)
+동시 confirm이 하루 장수 제한을 넘지 못하는지 (work_log 행 잠금)
+'''
+
+import asyncio
+from datetime import date, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from app.attachments_service import MAX_PHOTOS_PER_DAY, confirm_attachments
+from app.models import WorkLog, WorkStatus
+from app.s3 import build_file_key
+
+DAY = date(2015, 4, 1)  # 시드 데이터(2000~2009년)와 겹치지 않는 날짜
+CONCURRENT_CONFIRMS = 8
+
+
+async def _cleanup(session) -> None:
+    await session.rollback()
+    params = {"day": DAY}
+    await session.execute(text(
+        "DELETE FROM attachments WHERE work_log_id IN (SELECT id FROM work_logs WHERE work_date = :day)"
+    ), params)
+    await session.execute(text("DELETE FROM work_logs WHERE work_date = :day"), params)
+    # confirm이 채운 집계 행 (시드 범위 밖이라 이 날짜 몫뿐)
+    await session.execute(text(
+        "DELETE FROM work_log_rollups WHERE (period, period_start) IN "
+        "(('day', :day), ('week', :week), ('month', :month))"
+    ), {**params, "week": DAY - timedelta(days=DAY.weekday()), "month": DAY.replace(day=1)})
+    await session.commit()
+
+
+def test_parallel_confirms_respect_daily_limit(db_sessions):
+    async def run():
+        async with db_sessions() as sessions, sessions() as session:
+            await _cleanup(session)
+            try:
+                work_log = WorkLog(work_date=DAY, status=WorkStatus.출근)
+                session.add(work_log)
+                await session.commit()
+
+                async def confirm(n: int):
+                    # 요청마다 세션(커넥션) 하나, 서로 다른 사진 한 장씩
+                    async with sessions() as request_session:
+                        file_key = build_file_key(DAY, f"photo-{n}.jpg")
+                        try:
+                            return await confirm_attachments(
+                                request_session, work_log.id, [(file_key, f"photo-{n}.jpg")]
+                            )
+                        except HTTPException as e:
+                            return e
+
+                results = await asyncio.gather(*(confirm(n) for n in range(CONCURRENT_CONFIRMS)))
+                count = (await session.execute(
+                    text("SELECT count(*) FROM attachments WHERE work_log_id = :id"), {"id": work_log.id}
+                )).scalar_one()
+                return results, count
+            finally:
+                await _cleanup(session)
+
+    results, count = asyncio.run(run())
+    accepted = [r for r in results if isinstance(r, list)]
+    rejected = [r for r in results if isinstance(r, HTTPException)]
+    assert count == MAX_PHOTOS_PER_DAY
+    assert len(accepted) == MAX_PHOTOS_PER_DAY
+    assert len(rejected) == CONCURRENT_CONFIRMS - MAX_PHOTOS_PER_DAY
+    assert all(e.status_code == 400 for e in rejected)
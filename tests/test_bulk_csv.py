@@ -0,0 +1,80 @@
+'''
+POST /works/bulk의 CSV 레코드 분리 (app.works_router._iter_csv_records)
+body는 청크로 나눠 흘려보냄 (줄/필드 중간에서 잘려도 같은 결과여야 함)
+'''
+
+import asyncio
+import csv
+import io
+
+import pytest
+
+from app.works_router import _iter_csv_records
+
+UNTERMINATED = "CSV 파싱 실패: 따옴표가 닫히지 않았습니다."
+
+
+class _Body:
+    # request.stream()만 흉내 (chunk_size 바이트씩)
+    def __init__(self, text: str, chunk_size: int) -> None:
+        self.data = text.encode("utf-8")
+        self.chunk_size = chunk_size
+
+    async def stream(self):
+        for start in range(0, len(self.data), self.chunk_size):
+            yield self.data[start:start + self.chunk_size]
+
+
+def _records(text: str, chunk_size: int) -> list:
+    async def collect():
+        return [record async for record in _iter_csv_records(_Body(text, chunk_size))]
+
+    return asyncio.run(collect())
+
+
+CASES = {
+    "embedded newline": (
+        'work_date,note\n2024-01-01,"첫 줄\n둘째 줄"\n2024-01-02,ok\n',
+        [(1, ["work_date", "note"]), (2, ["2024-01-01", "첫 줄\n둘째 줄"]), (4, ["2024-01-02", "ok"])],
+    ),
+    "doubled quotes": (
+        'work_date,note\n2024-01-01,"say ""hi"", ok"\n2024-01-02,"""quoted"""\n',
+        [(1, ["work_date", "note"]), (2, ["2024-01-01", 'say "hi", ok']), (3, ["2024-01-02", '"quoted"'])],
+    ),
+    "doubled quote before newline": (
+        'work_date,note\n2024-01-01,"a ""\nb"""\n2024-01-02,ok\n',
+        [(1, ["work_date", "note"]), (2, ["2024-01-01", 'a "\nb"']), (4, ["2024-01-02", "ok"])],
+    ),
+    "stray quote in unquoted field": (
+        'work_date,note\n2024-01-01,27" 모니터\n2024-01-02,ok\n2024-01-03,a"b"c\n',
+        [
+            (1, ["work_date", "note"]),
+            (2, ["2024-01-01", '27" 모니터']),
+            (3, ["2024-01-02", "ok"]),
+            (4, ["2024-01-03", 'a"b"c']),
+        ],
+    ),
+    "blank lines and crlf": (
+        "work_date,note\r\n\r\n2024-01-01,a\r\n\n2024-01-02,b",
+        [(1, ["work_date", "note"]), (3, ["2024-01-01", "a"]), (5, ["2024-01-02", "b"])],
+    ),
+    "unterminated quote": (
+        'work_date,note\n2024-01-01,ok\n2024-01-02,"열고\n안 닫음\n',
+        [(1, ["work_date", "note"]), (2, ["2024-01-01", "ok"]), (3, UNTERMINATED)],
+    ),
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+@pytest.mark.parametrize("name", list(CASES))
+def test_csv_records(name, chunk_size):
+    text, expected = CASES[name]
+    assert _records(text, chunk_size) == expected
+
+
+@pytest.mark.parametrize("name", [name for name in CASES if name != "unterminated quote"])
+def test_csv_records_match_csv_module(name):
+    # 레코드 분리만 다르고 필드는 body 전체를 csv.reader로 읽은 것과 같아야 함
+    text, _ = CASES[name]
+    fields = [row for row in csv.reader(io.StringIO(text, newline="")) if row]
+    assert [record for _, record in _records(text, 1 << 16)] == fields
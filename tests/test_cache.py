@@ -0,0 +1,113 @@
+'''
+캐시 백엔드 (app.cache): get_or_load single-flight, 로딩 중 무효화
+'''
+
+import asyncio
+
+import pytest
+
+from app.cache import CacheBackend, LocalCache
+
+
+class _Loader:
+    # release() 전까지 끝나지 않는 로더 (호출 횟수 기록)
+    def __init__(self, value) -> None:
+        self.value = value
+        self.calls = 0
+        self.started = asyncio.Event()
+        self._release = asyncio.Event()
+
+    def release(self) -> None:
+        self._release.set()
+
+    async def __call__(self):
+        self.calls += 1
+        self.started.set()
+        await self._release.wait()
+        return self.value
+
+
+def test_backend_requires_all_operations():
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+    class Partial(CacheBackend):
+        async def get(self, key):
+            return None
+
+        async def set(self, key, value, ttl):
+            pass
+
+        async def delete(self, *keys):
+            pass
+
+        async def _version(self, key):
+            return 0
+
+    # _set_if_version 없이는 get_or_load의 무효화 보장이 안 되므로 만들 수 없어야 함
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_concurrent_misses_call_loader_once():
+    async def run():
+        cache = LocalCache(maxsize=16)
+        loader = _Loader({"n": 1})
+        tasks = [asyncio.create_task(cache.get_or_load("k", loader, ttl=60)) for _ in range(10)]
+        await loader.started.wait()
+        loader.release()
+        results = await asyncio.gather(*tasks)
+        return loader.calls, results, await cache.get("k")
+
+    calls, results, cached = asyncio.run(run())
+    assert calls == 1
+    assert results == [{"n": 1}] * 10
+    assert cached == {"n": 1}
+
+
+def test_invalidate_during_load_is_not_written_back():
+    async def run():
+        cache = LocalCache(maxsize=16)
+        stale = _Loader("old")
+        first = asyncio.create_task(cache.get_or_load("k", stale, ttl=60))
+        await stale.started.wait()
+
+        # 로딩 중에 쓰기 + 무효화: 그 뒤 요청은 진행 중인 (옛) 로딩에 합류하지 않음
+        await cache.delete("k")
+        fresh = _Loader("new")
+        second = asyncio.create_task(cache.get_or_load("k", fresh, ttl=60))
+        await fresh.started.wait()
+
+        stale.release()
+        assert await first == "old"  # 먼저 온 요청은 자기 결과를 받지만
+        assert await cache.get("k") is None  # 캐시에는 남지 않음
+
+        fresh.release()
+        assert await second == "new"
+        return await cache.get("k")
+
+    assert asyncio.run(run()) == "new"
+
+
+def test_loader_error_is_shared_and_not_cached():
+    async def run():
+        cache = LocalCache(maxsize=16)
+        calls = 0
+        release = asyncio.Event()
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            raise RuntimeError("db down")
+
+        tasks = [asyncio.create_task(cache.get_or_load("k", failing, ttl=60)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return calls, results, await cache.get("k")
+
+    calls, results, cached = asyncio.run(run())
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cached is None
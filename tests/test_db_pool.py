@@ -0,0 +1,52 @@
+'''
+커넥션 풀 대기 계측 (app.db._TimedQueuePool, pool_status(), DATABASE_URL 필요)
+'''
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import db
+
+HOLD_SECONDS = 0.2
+
+
+def test_pool_status_counts_waits_and_timeouts(database_url, monkeypatch):
+    monkeypatch.setattr(db, "pool_stats", db.PoolStats())
+
+    async def query(engine) -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    async def run():
+        engine = create_async_engine(
+            database_url, poolclass=db._TimedQueuePool, pool_size=1, max_overflow=0, pool_timeout=1
+        )
+        # pool_status()가 이 엔진을 보도록
+        monkeypatch.setattr(db, "_engine", engine)
+        try:
+            async with engine.connect() as held:
+                await held.execute(text("SELECT 1"))
+                # 풀이 비어 있으니 반납될 때까지 기다림
+                waiting = asyncio.create_task(query(engine))
+                await asyncio.sleep(HOLD_SECONDS)
+                while_waiting = db.pool_status()
+            await waiting
+
+            async with engine.connect():
+                with pytest.raises(PoolTimeoutError):
+                    await query(engine)
+            return while_waiting, db.pool_status()
+        finally:
+            await engine.dispose()
+
+    while_waiting, after = asyncio.run(run())
+    assert while_waiting["checked_out"] == 1
+    assert after["checked_out"] == 0
+    assert after["acquisitions"] == 3
+    assert after["timeouts"] == 1
+    assert after["max_wait_ms"] >= HOLD_SECONDS * 1000
+    assert 0 < after["avg_wait_ms"] <= after["max_wait_ms"]
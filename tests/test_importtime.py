@@ -0,0 +1,34 @@
+'''
+콜드 스타트: import app.main만으로 boto3/botocore가 로드되면 안 됨 (S3 클라이언트는 첫 사용 때 생성)
+새 프로세스에서 python -X importtime으로 실제 import된 모듈 목록을 봄. 시간 측정은 bench.importtime
+'''
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+FORBIDDEN = ("boto3", "botocore")
+
+
+def _imported_modules(module: str) -> set[str]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    # "import time:   self |  cumulative | name" (첫 줄은 헤더)
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:") and "[us]" not in line
+    }
+
+
+def test_app_import_does_not_load_boto3():
+    modules = _imported_modules("app.main")
+    assert "app.main" in modules
+    loaded = sorted(m for m in modules if m.split(".")[0] in FORBIDDEN)
+    assert loaded == []
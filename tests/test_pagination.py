@@ -0,0 +1,51 @@
+'''
+keyset 페이지 (app.pagination) + GET /jobs/ 페이지 순회 (DATABASE_URL 필요)
+'''
+
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlmodel import select
+
+from app.jobs_service import get_jobs
+from app.models import Job
+from app.pagination import decode_cursor, encode_cursor, page
+
+
+def _row(day: int, row_id: int):
+    return SimpleNamespace(work_date=date(2024, 1, day), id=row_id)
+
+
+def test_cursor_round_trip():
+    assert encode_cursor(_row(2, 7)) == "2024-01-02_7"
+    assert decode_cursor("2024-01-02_7") == (date(2024, 1, 2), 7)
+    for bad in ["", "2024-01-02", "2024-13-01_1", "2024-01-02_x"]:
+        with pytest.raises(ValueError):
+            decode_cursor(bad)
+
+
+def test_page_uses_limit_plus_one():
+    rows = [_row(1, 1), _row(1, 2), _row(2, 3)]
+    assert page(rows, 3) == (rows, None)
+    assert page(rows, 2) == (rows[:2], "2024-01-01_2")
+
+
+def test_jobs_pages_cover_all_jobs(db_sessions):
+    async def run():
+        async with db_sessions() as sessions, sessions() as session:
+            expected = [
+                job.id for job in (await session.exec(select(Job).order_by(Job.work_date, Job.id))).all()
+            ]
+            seen: list[int] = []
+            cursor = None
+            while True:
+                jobs, cursor = await get_jobs(session, limit=500, cursor=cursor)
+                assert len(jobs) <= 500
+                seen += [job.id for job in jobs]
+                if cursor is None:
+                    return expected, seen
+
+    expected, seen = asyncio.run(run())
+    assert seen == expected
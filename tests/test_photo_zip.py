@@ -0,0 +1,85 @@
+'''
+사진 ZIP 스트리밍 (app.export_service.stream_photos_zip) 을 로컬 S3 스텁으로 검증 (boto3 필요)
+엔트리 이름/내용/CRC, 같은 날 같은 이름 처리, 없는 객체의 MISSING.txt. 속도 비교는 bench.photo_zip
+'''
+
+import asyncio
+import hashlib
+import io
+import zipfile
+from datetime import date
+
+import pytest
+
+from app.export_service import ZIP_MISSING_ENTRY, stream_photos_zip, zip_entry_names
+
+# 청크 경계를 여러 번 넘도록 ZIP_CHUNK_SIZE(256KB)보다 큰 것도 섞음
+SIZES = (0, 1, 300 * 1024, 700 * 1024)
+
+
+def _body(key: str, size: int) -> bytes:
+    block = hashlib.sha256(key.encode()).digest() * 2048  # 64KB, 압축 안 되는 바이트
+    return (block * (size // len(block) + 1))[:size]
+
+
+def _files() -> list[tuple[date, str, str]]:
+    day, next_day = date(2024, 1, 1), date(2024, 1, 2)
+    return [
+        (day, "work-logs/2024-01-01/a.jpg", "IMG_0001.jpg"),
+        (day, "work-logs/2024-01-01/b.jpg", "IMG_0001.jpg"),
+        (day, "work-logs/2024-01-01/c.jpg", "img_0001.JPG"),
+        (day, "work-logs/2024-01-01/gone.jpg", "IMG_0002.jpg"),
+        (day, "work-logs/2024-01-01/d.jpg", "../../etc/passwd"),
+        (next_day, "work-logs/2024-01-02/e.jpg", "IMG_0001.jpg"),
+        (next_day, "work-logs/2024-01-02/gone.jpg", "IMG_0003.jpg"),
+    ]
+
+
+def _zip(files, concurrency: int) -> bytes:
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in stream_photos_zip(files, concurrency)])
+
+    return asyncio.run(collect())
+
+
+def test_zip_entry_names():
+    assert zip_entry_names(_files()) == [
+        "2024-01-01/IMG_0001.jpg",
+        "2024-01-01/IMG_0001 (2).jpg",
+        "2024-01-01/img_0001 (3).JPG",
+        "2024-01-01/IMG_0002.jpg",
+        "2024-01-01/passwd",
+        "2024-01-02/IMG_0001.jpg",
+        "2024-01-02/IMG_0003.jpg",
+    ]
+
+
+@pytest.mark.parametrize("concurrency", [1, 3, 16])
+def test_stream_photos_zip(s3_stub, concurrency):
+    files = _files()
+    present = [key for _, key, _ in files if not key.endswith("gone.jpg")]
+    for i, key in enumerate(present):
+        s3_stub.put(key, _body(key, SIZES[i % len(SIZES)]))
+
+    archive = zipfile.ZipFile(io.BytesIO(_zip(files, concurrency)))
+
+    assert archive.testzip() is None  # CRC
+    expected = {
+        name: key for name, (_, key, _) in zip(zip_entry_names(files), files) if key in present
+    }
+    assert archive.namelist() == [*expected, ZIP_MISSING_ENTRY]
+    for name, key in expected.items():
+        assert archive.read(name) == s3_stub.objects[key][0]
+    assert archive.read(ZIP_MISSING_ENTRY).decode().split() == [
+        "work-logs/2024-01-01/gone.jpg",
+        "work-logs/2024-01-02/gone.jpg",
+    ]
+    assert all(info.compress_type == zipfile.ZIP_STORED for info in archive.infolist())
+
+
+def test_stream_photos_zip_without_missing(s3_stub):
+    files = [(date(2024, 1, 1), "work-logs/2024-01-01/a.jpg", "a.jpg")]
+    s3_stub.put(files[0][1], b"jpeg")
+
+    archive = zipfile.ZipFile(io.BytesIO(_zip(files, 4)))
+    assert archive.namelist() == ["2024-01-01/a.jpg"]
@@ -0,0 +1,29 @@
+'''
+hot path 쿼리 실행계획 회귀 (app.query_plans, DATABASE_URL 필요)
+시드된 DB에서 기대 인덱스를 모두 쓰는지, 인덱스가 없어지면 잡아내는지
+'''
+
+import asyncio
+
+from sqlalchemy import text
+
+from app.query_plans import check_hot_query_plans
+
+
+def test_hot_query_plans_use_expected_indexes(db_sessions):
+    async def check():
+        async with db_sessions() as sessions, sessions() as session:
+            return await check_hot_query_plans(session)
+
+    assert asyncio.run(check()) == []
+
+
+def test_missing_index_is_reported(db_sessions):
+    async def check():
+        async with db_sessions() as sessions, sessions() as session:
+            # 같은 트랜잭션 안에서만 지움 (check_hot_query_plans가 끝에 롤백)
+            await session.execute(text("DROP INDEX ix_work_logs_status_work_date"))
+            return await check_hot_query_plans(session)
+
+    failures = asyncio.run(check())
+    assert any("ix_work_logs_status_work_date not used" in f for f in failures)
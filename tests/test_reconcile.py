@@ -0,0 +1,102 @@
+'''
+S3 <-> attachments 대조 (app.reconcile_service, DATABASE_URL + 로컬 S3 스텁)
+시드 데이터(2000~2009년)와 겹치지 않는 2015년 날짜에 만들고 끝나면 지움
+'''
+
+import asyncio
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+
+from app.models import Attachment, WorkLog, WorkStatus
+from app.reconcile_service import dates_to_reconcile, reconcile_date, reopen_reconciled_date
+from app.s3 import work_date_prefix
+
+SINCE = date(2015, 1, 1)
+DAY1, DAY2, DAY3 = date(2015, 3, 1), date(2015, 3, 2), date(2015, 3, 3)
+OLD = datetime(2015, 3, 4, tzinfo=timezone.utc)  # 유예 기간이 한참 지난 객체
+
+
+def _listed(stub) -> list[str]:
+    # 날짜 prefix 목록 조회만 (work-logs/ 아래 prefix 목록은 제외)
+    return sorted(p for p in stub.list_requests("ListObjectsV2") if p != "work-logs/")
+
+
+async def _cleanup(session) -> None:
+    await session.rollback()  # 실패한 단계가 남긴 트랜잭션
+    params = {"start": DAY1, "end": DAY3}
+    await session.execute(text(
+        "DELETE FROM attachments WHERE work_log_id IN "
+        "(SELECT id FROM work_logs WHERE work_date BETWEEN :start AND :end)"
+    ), params)
+    await session.execute(text("DELETE FROM work_logs WHERE work_date BETWEEN :start AND :end"), params)
+    await session.execute(text(
+        "DELETE FROM s3_reconcile_checkpoints WHERE work_date BETWEEN :start AND :end"
+    ), params)
+    await session.commit()
+
+
+def test_reconcile_with_bounded_recheck(db_sessions, s3_stub):
+    kept = f"{work_date_prefix(DAY1)}kept.jpg"
+    orphan = f"{work_date_prefix(DAY1)}orphan.jpg"
+    lost = f"{work_date_prefix(DAY2)}lost.jpg"
+    kept3 = f"{work_date_prefix(DAY3)}kept.jpg"
+    orphan3 = f"{work_date_prefix(DAY3)}orphan.jpg"
+    for key in (kept, orphan, kept3, orphan3):
+        s3_stub.put(key, b"x", last_modified=OLD)
+
+    async def run() -> None:
+        async with db_sessions() as sessions, sessions() as session:
+            await _cleanup(session)
+            try:
+                day1 = WorkLog(work_date=DAY1, status=WorkStatus.출근)
+                day2 = WorkLog(work_date=DAY2, status=WorkStatus.출근)
+                day3 = WorkLog(work_date=DAY3, status=WorkStatus.출근)
+                session.add_all([day1, day2, day3])
+                await session.flush()
+                lost_attachment = Attachment(work_log_id=day2.id, file_key=lost, original_filename="lost.jpg")
+                session.add_all([
+                    Attachment(work_log_id=day1.id, file_key=kept, original_filename="kept.jpg"),
+                    lost_attachment,
+                    Attachment(work_log_id=day3.id, file_key=kept3, original_filename="kept.jpg"),
+                ])
+                await session.commit()
+
+                # 처음: 체크포인트가 없으니 S3/DB에 첨부가 있는 날짜 전부
+                dates = await dates_to_reconcile(session, since=SINCE)
+                assert dates == [DAY1, DAY2, DAY3]
+                results = {d: await reconcile_date(session, d) for d in dates}
+                assert results[DAY1].deleted == [orphan]
+                assert results[DAY2].missing_ids == [lost_attachment.id]
+                assert results[DAY3].deleted == [orphan3]
+                assert set(s3_stub.objects) == {kept, kept3}
+                missing_at = (await session.execute(
+                    text("SELECT missing_at FROM attachments WHERE file_key = :key"), {"key": lost}
+                )).scalar_one()
+                assert missing_at is not None
+
+                # 모두 정리 끝: 바뀐 게 없으면 대조할 날짜 없음, 목록은 recheck_limit개만 다시 봄
+                s3_stub.requests.clear()
+                assert await dates_to_reconcile(session, since=SINCE, recheck_limit=2) == []
+                assert _listed(s3_stub) == [work_date_prefix(DAY1), work_date_prefix(DAY2)]
+
+                # 다음 실행은 오래 확인 안 한 날짜부터 (돌아가며)
+                s3_stub.requests.clear()
+                assert await dates_to_reconcile(session, since=SINCE, recheck_limit=2) == []
+                assert _listed(s3_stub) == [work_date_prefix(DAY1), work_date_prefix(DAY3)]
+
+                # 재확인에서 목록이 바뀐 날짜는 다시 대조
+                late = f"{work_date_prefix(DAY2)}late.jpg"
+                s3_stub.put(late, b"y", last_modified=OLD)
+                assert await dates_to_reconcile(session, since=SINCE, recheck_limit=3) == [DAY2]
+                assert (await reconcile_date(session, DAY2)).deleted == [late]
+
+                # 지난 날짜로 presign하면 재확인 차례가 아니어도 다음 실행에서 대조
+                await reopen_reconciled_date(session, DAY3)
+                s3_stub.requests.clear()
+                assert await dates_to_reconcile(session, since=SINCE, recheck_limit=0) == [DAY3]
+                assert _listed(s3_stub) == []
+            finally:
+                await _cleanup(session)
+
+    asyncio.run(run())
@@ -0,0 +1,48 @@
+'''
+JSON 응답 직렬화 (app.responses)
+- ORJSONResponse는 표준 JSONResponse와 같은 bytes
+- response_model 라우트는 응답 클래스를 지정하지 않음 (FastAPI의 dump_json 경로 유지)
+'''
+
+from datetime import date, datetime
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from app.attachments_router import router as attachments_router
+from app.internal_router import router as internal_router
+from app.jobs_router import router as jobs_router
+from app.models import WorkStatus
+from app.responses import ORJSONResponse, dumps
+from app.users_router import router as users_router
+from app.works_router import router as works_router
+
+ROUTERS = [works_router, jobs_router, users_router, attachments_router, internal_router]
+
+
+def test_orjson_response_matches_json_response():
+    content = [
+        {"id": 1, "title": "타일 시공", "amount": 120000, "note": None, "paid": False},
+        {"id": 2, "title": 'say "hi"\n', "amount": -1, "ratio": 0.5, "tags": []},
+    ]
+    assert ORJSONResponse(content).body == JSONResponse(content).body
+
+
+def test_dumps_dates_and_enums():
+    row = {"work_date": date(2024, 1, 2), "created_at": datetime(2024, 1, 2, 3, 4, 5), "status": WorkStatus.출근}
+    assert dumps(row) == '{"work_date":"2024-01-02","created_at":"2024-01-02T03:04:05","status":"출근"}'.encode()
+
+
+def test_response_class_per_route():
+    routes = {
+        (route.path, *sorted(route.methods)): route
+        for router in ROUTERS
+        for route in router.routes
+        if isinstance(route, APIRoute)
+    }
+    for route in routes.values():
+        if route.response_model is not None:
+            assert isinstance(route.response_class, DefaultPlaceholder), route.path
+    for key in [("/jobs/", "GET"), ("/jobs/unpaid", "GET"), ("/jobs/mark_paid", "POST")]:
+        assert routes[key].response_class is ORJSONResponse
@@ -0,0 +1,52 @@
+'''
+오늘 스냅샷 (app.works_service.get_today_snapshot, DATABASE_URL 필요)
+GET /works/today/photos는 오늘 work_log를 만들지 않음
+'''
+
+import asyncio
+from datetime import timedelta
+
+from sqlalchemy import text
+
+from app.cache import get_cache
+from app.works_router import get_today_photos
+from app.works_service import _today_snapshot_key, get_today_snapshot, today_seoul_date
+
+
+def test_today_photos_does_not_create_work_log(db_sessions):
+    today = today_seoul_date()
+
+    async def count(session) -> int:
+        return (await session.execute(
+            text("SELECT count(*) FROM work_logs WHERE work_date = :today"), {"today": today}
+        )).scalar_one()
+
+    async def cleanup(session) -> None:
+        await session.rollback()
+        await session.execute(text("DELETE FROM work_logs WHERE work_date = :today"), {"today": today})
+        # 만들면서 채운 집계 행 (시드 범위 밖이라 오늘 몫뿐)
+        await session.execute(text(
+            "DELETE FROM work_log_rollups WHERE (period, period_start) IN "
+            "(('day', :today), ('week', :week), ('month', :month))"
+        ), {"today": today, "week": today - timedelta(days=today.weekday()), "month": today.replace(day=1)})
+        await session.commit()
+        await get_cache().delete(_today_snapshot_key(today))
+
+    async def run() -> None:
+        async with db_sessions() as sessions, sessions() as session:
+            if await count(session):
+                await session.rollback()
+                raise AssertionError("오늘 work_log가 이미 있는 DB (일회용 시드 DB에서 실행)")
+            try:
+                assert await get_today_photos(thumbnail_size=None, session=session) == []
+                assert await get_today_snapshot(session, create=False) is None
+                assert await count(session) == 0
+
+                # GET /works/today는 예전처럼 만들어서 돌려줌
+                snapshot = await get_today_snapshot(session)
+                assert snapshot["work_date"] == str(today) and snapshot["attachments"] == []
+                assert await count(session) == 1
+            finally:
+                await cleanup(session)
+
+    asyncio.run(run())